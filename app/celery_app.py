@@ -1,10 +1,13 @@
-from celery import Celery
+from celery import Celery, group
+from celery.exceptions import Retry
+from celery.signals import worker_process_init
 from kombu import Queue
 import asyncio
-from typing import Dict
+import os
+from typing import Dict, List
 from app.services.thumbnails.thumbnail_service import process_image_to_gcs
-from app.core.database import get_db
-from app.models.news_article import NewsArticle
+from app.core.database import engine, get_db
+from app.models.news_article import NewsArticle, media_status_update
 from app.services.tts.tts_service import TTSService
 
 # Celery 앱 생성
@@ -21,6 +24,42 @@ celery_app.conf.task_queues = (
     Queue("image"),
     Queue("default"),
 )
+# 태스크 결과를 읽는 곳이 없으므로 결과 저장 생략, 저장하는 경우에도 만료시켜 Redis 메모리 증가 방지
+celery_app.conf.task_ignore_result = True
+celery_app.conf.result_expires = int(os.getenv("CELERY_RESULT_EXPIRES", 3600))
+
+
+@worker_process_init.connect
+def reset_db_pool(**kwargs):
+    # prefork 자식 프로세스가 부모(import 시 연결 테스트)의 커넥션을 같이 쓰지 않도록 풀을 비움
+    engine.dispose(close=False)
+
+# 저장 후처리 배치 태스크 하나가 맡는 기사 수
+TTS_BATCH_SIZE = int(os.getenv("TTS_BATCH_SIZE", 5))
+IMAGE_BATCH_SIZE = int(os.getenv("IMAGE_BATCH_SIZE", 10))
+# TTS 배치 태스크 안에서 동시에 생성하는 기사 수
+TTS_BATCH_CONCURRENCY = int(os.getenv("TTS_BATCH_CONCURRENCY", 5))
+
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    return [items[i:i + size] for i in range(0, len(items), max(1, size))]
+
+
+def dispatch_post_save_tasks(article_ids: List[str], duplicate_article_ids: List[str]) -> Dict:
+    """
+    저장 배치의 후처리 태스크를 한 번에 발행 (group 하나, 브로커 연결 1회)
+    - 새 기사: TTS_BATCH_SIZE/IMAGE_BATCH_SIZE개씩 묶은 TTS/썸네일 배치 태스크
+    - 근접 중복 기사: 기사별 정본 미디어 복사 태스크 (기사마다 재시도하므로 묶지 않음)
+    """
+    signatures = (
+        [generate_tts_audio_batch.s(chunk) for chunk in _chunks(article_ids, TTS_BATCH_SIZE)]
+        + [process_image_batch.s(chunk) for chunk in _chunks(article_ids, IMAGE_BATCH_SIZE)]
+        + [copy_canonical_media_async.s(article_id) for article_id in duplicate_article_ids]
+    )
+    if not signatures:
+        return {"group_id": None, "tasks": 0}
+    result = group(signatures).apply_async()
+    return {"group_id": result.id, "tasks": len(signatures)}
 
 def process_image_to_gcs_async_task(article_id: str) -> Dict:
     """이미지 처리 Celery 태스크를 비동기로 시작하고 태스크 ID 반환"""
@@ -99,6 +138,7 @@ def generate_tts_audio_async(article_id: str) -> Dict:
             
             article.male_audio_url = audio_urls["male_audio_url"]
             article.female_audio_url = audio_urls["female_audio_url"]
+            article.media_status = media_status_update(audio_ready=True)
             db.commit()
             
             print(f"TTS 생성 성공: male_url={audio_urls['male_audio_url']}, female_url={audio_urls['female_audio_url']}")
@@ -121,4 +161,119 @@ def generate_tts_audio_async(article_id: str) -> Dict:
             "article_id": article_id
         }
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+@celery_app.task(queue='image')
+def process_image_batch(article_ids: List[str]) -> Dict:
+    """여러 기사의 썸네일을 차례로 생성하는 배치 태스크"""
+    succeeded, failed = 0, 0
+    for article_id in article_ids:
+        try:
+            result = process_image_to_gcs(article_id)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        if result.get("success"):
+            succeeded += 1
+        else:
+            failed += 1
+            print(f"썸네일 생성 실패: article_id={article_id}, error={result.get('error')}")
+    return {"success": failed == 0, "succeeded": succeeded, "failed": failed}
+
+@celery_app.task(queue='tts')
+def generate_tts_audio_batch(article_ids: List[str]) -> Dict:
+    """
+    여러 기사의 TTS 오디오를 한 이벤트 루프에서 TTS_BATCH_CONCURRENCY개씩 동시에 생성하는 배치 태스크
+    - 기사를 한 번에 조회하고 결과는 한 번에 커밋
+    """
+    db = next(get_db())
+    succeeded, failed = 0, 0
+    try:
+        articles = db.query(NewsArticle).filter(NewsArticle.id.in_(article_ids)).all()
+        targets = [article for article in articles if article.summary_text]
+        failed += len(article_ids) - len(targets)
+        tts_service = TTSService()
+
+        async def generate_all():
+            semaphore = asyncio.Semaphore(TTS_BATCH_CONCURRENCY)
+
+            async def generate(article):
+                async with semaphore:
+                    return await tts_service.generate_male_female_audio(article.summary_text)
+            return await asyncio.gather(*(generate(article) for article in targets), return_exceptions=True)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            results = loop.run_until_complete(generate_all())
+        finally:
+            loop.close()
+        for article, audio_urls in zip(targets, results):
+            if isinstance(audio_urls, Exception) or not audio_urls.get("male_audio_url") or not audio_urls.get("female_audio_url"):
+                print(f"TTS 생성 실패: article_id={article.id}, result={audio_urls}")
+                failed += 1
+                continue
+            article.male_audio_url = audio_urls["male_audio_url"]
+            article.female_audio_url = audio_urls["female_audio_url"]
+            article.media_status = media_status_update(audio_ready=True)
+            succeeded += 1
+        db.commit()
+        print(f"TTS 배치 생성 완료: 성공 {succeeded}개, 실패 {failed}개")
+        return {"success": failed == 0, "succeeded": succeeded, "failed": failed}
+    except Exception as e:
+        db.rollback()
+        print(f"TTS 배치 생성 중 예외 발생: {e}")
+        return {"success": False, "succeeded": 0, "failed": len(article_ids), "error": str(e)}
+    finally:
+        db.close()
+
+def copy_canonical_media_async_task(article_id: str) -> Dict:
+    """정본 기사의 오디오/썸네일 복사 Celery 태스크를 시작하고 태스크 ID 반환"""
+    task = copy_canonical_media_async.delay(article_id)
+    return {
+        "task_id": task.id,
+        "status": "processing",
+        "message": "정본 기사 미디어 복사가 시작되었습니다. 백그라운드에서 처리 중입니다."
+    }
+
+@celery_app.task(bind=True, queue='default', max_retries=10, default_retry_delay=30)
+def copy_canonical_media_async(self, article_id: str) -> Dict:
+    """
+    근접 중복 기사에 정본 기사의 TTS 오디오/썸네일을 복사하는 Celery 태스크
+    - 정본 미디어가 아직 생성 중이면 재시도하고, 끝내 준비되지 않으면 직접 생성 태스크를 실행
+    """
+    db = next(get_db())
+    try:
+        article = db.query(NewsArticle).filter(NewsArticle.id == article_id).first()
+        if not article or not article.canonical_article_id:
+            return {"success": False, "error": "정본 기사가 연결되지 않은 기사입니다.", "article_id": article_id}
+        canonical = db.query(NewsArticle).filter(NewsArticle.id == article.canonical_article_id).first()
+        if canonical:
+            copied_audio = bool(canonical.male_audio_url and canonical.female_audio_url and not article.male_audio_url)
+            copied_thumbnail = bool(canonical.thumbnail_image_url and not article.thumbnail_image_url)
+            if copied_audio:
+                article.male_audio_url = canonical.male_audio_url
+                article.female_audio_url = canonical.female_audio_url
+            if copied_thumbnail:
+                article.thumbnail_image_url = canonical.thumbnail_image_url
+            if copied_audio or copied_thumbnail:
+                article.media_status = media_status_update(audio_ready=copied_audio, thumbnail_ready=copied_thumbnail)
+            db.commit()
+        audio_ready = bool(article.male_audio_url and article.female_audio_url)
+        thumbnail_ready = bool(article.thumbnail_image_url)
+        if audio_ready and thumbnail_ready:
+            return {"success": True, "article_id": article_id, "canonical_article_id": str(article.canonical_article_id)}
+        if canonical and self.request.retries < self.max_retries:
+            raise self.retry()
+        # 정본 미디어를 끝내 받지 못하면 부족한 것만 직접 생성
+        if not audio_ready:
+            generate_tts_audio_async_task(article_id)
+        if not thumbnail_ready:
+            process_image_to_gcs_async_task(article_id)
+        return {"success": False, "error": "정본 미디어 준비 안 됨, 직접 생성으로 전환", "article_id": article_id}
+    except Retry:
+        raise
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "error": str(e), "article_id": article_id}
+    finally:
+        db.close()
@@ -1,13 +1,22 @@
+from fastapi import Request
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
 import os
+import threading
 from dotenv import load_dotenv
 import time
 from sqlalchemy.exc import OperationalError
+from app.core.db_pool import check_connection_budget, engine_options, instrument_engine
+from app.core.db_replicas import pick_replica, replicas
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DB_URL")
+# async 엔드포인트용 asyncpg 주소 (없으면 DB_URL의 드라이버만 바꿔서 사용)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DB_URL")
 MAX_RETRIES = 10
 RETRY_DELAY = 2  # seconds
 
@@ -20,12 +29,30 @@ def get_db():
     finally:
         db.close()
 
-#DB 연결 재시도 함수
+# async 엔드포인트 전용 세션 (쿼리 대기 중에도 이벤트 루프가 다른 요청을 처리)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 읽기 전용(GET) 엔드포인트용 세션 (복제본이 없거나 지연이 크거나 최근에 데이터를 쓴 사용자면 primary)
+def get_read_db(request: Request):
+    db = create_read_session(getattr(request.state, "user_id", None))
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    async with create_async_read_session(getattr(request.state, "user_id", None)) as db:
+        yield db
+
+#DB 연결 재시도 함수 (엔진은 한 번만 만들고 DB가 뜰 때까지 연결만 재시도)
 def init_engine_with_retries():
     global engine
+    engine = create_engine(str(DATABASE_URL), **engine_options(is_async=False))
+    instrument_engine(engine)
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            engine = create_engine(str(DATABASE_URL), pool_pre_ping=True)
             with engine.connect() as conn:
                 #커넥션 테스트
                 conn.execute(text("SELECT 1"))
@@ -37,7 +64,69 @@ def init_engine_with_retries():
     else:
         raise RuntimeError("❌ Could not connect to the database after multiple attempts")
 
-engine = create_engine(DATABASE_URL)
 init_engine_with_retries()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-Base = declarative_base()
\ No newline at end of file
+
+Base = declarative_base()
+
+# async 엔드포인트(채팅/추천)는 적으므로 동기 풀과 따로 작은 풀 사용
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL or make_url(str(DATABASE_URL)).set(drivername="postgresql+asyncpg"),
+    **engine_options(is_async=True, role="async"),
+)
+instrument_engine(async_engine.sync_engine, role="async")
+# 커밋 후에도 응답 직렬화 시 속성 접근이 가능하도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# 워커 수 × 엔진별 풀 상한이 max_connections를 넘으면 API 시작 실패
+check_connection_budget(len(replicas))
+
+# 크롤러 전용 엔진 (요청 처리 스레드와 커넥션을 나눠 쓰지 않도록 풀을 분리)
+# 크롤러를 실행하는 프로세스에서 처음 세션을 만들 때 생성 (크롤러를 돌리지 않는 워커에는 풀이 생기지 않음)
+_crawler_sessionmaker = None
+_crawler_lock = threading.Lock()
+
+
+def create_crawler_session() -> Session:
+    global _crawler_sessionmaker
+    if _crawler_sessionmaker is None:
+        with _crawler_lock:
+            if _crawler_sessionmaker is None:
+                crawler_engine = create_engine(str(DATABASE_URL), **engine_options(is_async=False, role="crawler"))
+                instrument_engine(crawler_engine, role="crawler")
+                _crawler_sessionmaker = sessionmaker(bind=crawler_engine, autoflush=False, autocommit=False)
+    return _crawler_sessionmaker()
+
+
+class RoutingSession(Session):
+    """
+    읽기는 세션 생성 시 고른 복제본(info["replica"]), 쓰기는 primary(info["primary"])
+    - flush/INSERT/UPDATE/DELETE가 한 번이라도 있으면 이후 읽기도 primary (방금 쓴 내용을 읽도록)
+    - text()로 쓰는 SQL은 구분하지 못하므로 쓰기 엔드포인트는 get_db/get_async_db 사용
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["use_primary"] = True
+        replica = self.info.get("replica")
+        if replica is None or self.info.get("use_primary"):
+            return self.info["primary"]
+        return replica
+
+
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autoflush=False, autocommit=False)
+AsyncReadSessionLocal = async_sessionmaker(sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False)
+
+
+def create_read_session(user_id=None) -> RoutingSession:
+    replica = pick_replica(user_id)
+    return ReadSessionLocal(info={"primary": engine, "replica": replica.engine if replica else None})
+
+
+def create_async_read_session(user_id=None):
+    # AsyncSession 안의 동기 세션은 AsyncEngine이 아니라 sync_engine을 bind로 사용
+    replica = pick_replica(user_id)
+    return AsyncReadSessionLocal(info={
+        "primary": async_engine.sync_engine,
+        "replica": replica.async_engine.sync_engine if replica else None,
+    })
@@ -0,0 +1,192 @@
+"""DB 커넥션 풀 설정과 Prometheus 메트릭
+
+- 엔진 역할별 기본 풀 크기는 DB 서버 max_connections를 (워커 수 × 엔진 수)로 나눠 계산
+  - 프로세스 역할(DB_ROLE=api/celery)의 동기 엔진: DB_POOL_SIZE/DB_MAX_OVERFLOW/DB_POOL_RECYCLE/DB_POOL_TIMEOUT으로 덮어씀
+  - 그 밖의 엔진(async/crawler/replica/replica_async): DB_{ROLE}_POOL_SIZE 등으로 덮어씀
+- API 프로세스는 시작할 때 덮어쓴 값까지 합친 최대 커넥션 수가 max_connections를 넘으면 실패 (check_connection_budget)
+- DB_PGBOUNCER=true면 앱 쪽 풀 없이(NullPool) PgBouncer가 서버 커넥션 수를 제한 (transaction 모드 기준)
+- 풀 대기시간/사용 중 커넥션/overflow 수를 역할·대상 DB(primary/복제본)·엔진(sync/async)별로 노출
+"""
+import os
+import time
+import uuid
+from typing import Dict, Optional
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+DB_ROLE = os.getenv("DB_ROLE", "api")
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+# 동기 엔드포인트를 실행하는 anyio 스레드풀 크기 (main에서 설정, 풀보다 많은 스레드는 pool_timeout까지 커넥션을 기다림)
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", 40))
+# 크롤러 요약 워커 수 (요약 캐시/정본 요약 조회로 워커마다 커넥션 1개 사용)
+CRAWL_SUMMARIZE_WORKERS = int(os.getenv("CRAWL_SUMMARIZE_WORKERS", 5))
+
+# 커넥션 예산
+# - DB_MAX_CONNECTIONS: primary의 max_connections / DB_REPLICA_MAX_CONNECTIONS: 복제본 서버마다의 max_connections
+# - DB_RESERVED_CONNECTIONS: API 밖에서 쓰는 primary 커넥션
+#   (celery tts 8 + image 6 프로세스 × celery 풀 2, migrate 1, superuser_reserved_connections 3, 관리 도구 여유)
+# - API_WORKERS: uvicorn 워커 수 (uvicorn --workers와 같은 WEB_CONCURRENCY 환경변수)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 100))
+DB_REPLICA_MAX_CONNECTIONS = int(os.getenv("DB_REPLICA_MAX_CONNECTIONS", DB_MAX_CONNECTIONS))
+DB_RESERVED_CONNECTIONS = int(os.getenv("DB_RESERVED_CONNECTIONS", 40))
+DB_REPLICA_RESERVED_CONNECTIONS = int(os.getenv("DB_REPLICA_RESERVED_CONNECTIONS", 5))
+API_WORKERS = int(os.getenv("WEB_CONCURRENCY", 8))
+
+
+def _limits(total: int, overflow: Optional[int] = None) -> Dict[str, int]:
+    """최대 커넥션 수 total을 상시 유지(pool_size)와 몰릴 때만 여는 max_overflow로 나눔 (기본은 절반씩)"""
+    total = max(1, total)
+    if overflow is None:
+        overflow = total // 2
+    return {"pool_size": max(1, total - overflow), "max_overflow": overflow, "pool_recycle": 1800, "pool_timeout": 30}
+
+
+def _split_per_worker(budget: int) -> Dict[str, int]:
+    """워커 하나의 커넥션 예산을 동기/비동기 엔진에 나눔 (비동기 엔드포인트는 채팅/추천뿐이라 1/4, 동기는 스레드 수까지만)"""
+    per_worker = max(2, budget // max(1, API_WORKERS))
+    async_total = max(1, per_worker // 4)
+    return {"sync": min(per_worker - async_total, API_THREADPOOL_SIZE), "async": async_total}
+
+
+# - crawler: 크롤러를 실행하는 API 워커 하나에만 생기는 엔진 (요약 워커 수 + discover/persist 각 1개 + overflow 2)
+# - api/async: primary 예산에서 celery 등 예약분과 크롤러를 뺀 나머지를 API 워커 수로 나눔
+# - replica/replica_async: 복제본 서버마다 예산을 API 워커 수로 나눔 (복제본은 API 읽기 전용)
+# - celery: prefork 자식 프로세스는 한 번에 태스크 하나, 세션 하나만 사용 (비동기 엔진은 만들어도 사용하지 않음)
+_CRAWLER_LIMITS = _limits(CRAWL_SUMMARIZE_WORKERS + 4, overflow=2)
+_PRIMARY_SPLIT = _split_per_worker(DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS - _CRAWLER_LIMITS["pool_size"] - _CRAWLER_LIMITS["max_overflow"])
+_REPLICA_SPLIT = _split_per_worker(DB_REPLICA_MAX_CONNECTIONS - DB_REPLICA_RESERVED_CONNECTIONS)
+POOL_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "api": _limits(_PRIMARY_SPLIT["sync"]),
+    "async": _limits(_PRIMARY_SPLIT["async"]),
+    "crawler": _CRAWLER_LIMITS,
+    "replica": _limits(_REPLICA_SPLIT["sync"]),
+    "replica_async": _limits(_REPLICA_SPLIT["async"]),
+    "celery": _limits(2),
+}
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "풀에서 커넥션을 얻기까지 걸린 시간 (새 연결 생성 포함)",
+    ["role", "target", "engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "사용 중(체크아웃된) 커넥션 수",
+    ["role", "target", "engine"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "pool_size를 넘어 추가로 연 커넥션 수",
+    ["role", "target", "engine"],
+)
+
+
+def _engine_label(is_async: bool) -> str:
+    return "async" if is_async else "sync"
+
+
+class _InstrumentedPoolMixin:
+    """커넥션 체크아웃 대기시간 기록 (타임아웃으로 실패한 경우 포함)"""
+    # 메트릭 role 라벨 (None이면 DB_ROLE, instrument_engine에서 지정)
+    _metrics_role = None
+
+    def recreate(self):
+        # dispose() 후 새 풀에도 role 라벨 유지
+        pool = super().recreate()
+        pool._metrics_role = self._metrics_role
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            # 대상 DB 이름은 pool_logging_name으로 전달 (dispose 후 새 풀에도 유지됨)
+            label = _engine_label(getattr(self._dialect, "is_async", False))
+            DB_POOL_CHECKOUT_WAIT.labels(role=self._metrics_role or DB_ROLE, target=self._orig_logging_name or "primary", engine=label).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_InstrumentedPoolMixin, NullPool):
+    pass
+
+
+def pool_settings(role: Optional[str] = None) -> Dict[str, int]:
+    """role을 지정하면(async/crawler/replica/replica_async) DB_{ROLE}_POOL_SIZE 등, 아니면 DB_POOL_SIZE 등으로 덮어씀"""
+    defaults = POOL_DEFAULTS.get(role or DB_ROLE, POOL_DEFAULTS["api"])
+    prefix = f"DB_{role.upper()}_" if role else "DB_"
+    return {key: int(os.getenv(f"{prefix}{key.upper()}", value)) for key, value in defaults.items()}
+
+
+def engine_options(is_async: bool, target: str = "primary", role: Optional[str] = None) -> Dict:
+    """create_engine/create_async_engine에 넘길 풀 옵션 (target: 메트릭에 표시할 대상 DB 이름, role: 프로세스 역할 대신 쓸 풀 역할)"""
+    if DB_PGBOUNCER:
+        options: Dict = {"poolclass": InstrumentedNullPool, "pool_logging_name": target}
+        if is_async:
+            # transaction 모드에서는 트랜잭션마다 서버 커넥션이 바뀌므로
+            # asyncpg prepared statement 캐시를 끄고 statement 이름이 겹치지 않게 함
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        return options
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_pre_ping": True,
+        "pool_logging_name": target,
+        **pool_settings(role),
+    }
+
+
+def instrument_engine(engine: Engine, target: str = "primary", role: Optional[str] = None) -> None:
+    """사용 중 커넥션 수는 checkout/checkin 이벤트로, overflow는 수집 시점의 풀 상태로 기록 (async는 sync_engine 전달)"""
+    label = _engine_label(engine.dialect.is_async)
+    role = role or DB_ROLE
+    engine.pool._metrics_role = role
+    in_use = DB_POOL_IN_USE.labels(role=role, target=target, engine=label)
+    event.listen(engine, "checkout", lambda *args: in_use.inc())
+    event.listen(engine, "checkin", lambda *args: in_use.dec())
+    # dispose() 후에는 engine.pool이 새 풀로 바뀌므로 매번 engine에서 읽음
+    DB_POOL_OVERFLOW.labels(role=role, target=target, engine=label).set_function(
+        lambda: max(0, engine.pool.overflow()) if isinstance(engine.pool, QueuePool) else 0
+    )
+
+
+def _max_connections(role: Optional[str] = None) -> int:
+    settings = pool_settings(role)
+    return settings["pool_size"] + settings["max_overflow"]
+
+
+def check_connection_budget(replica_count: int) -> None:
+    """
+    API 프로세스 시작 시 전체 워커의 최대 커넥션 수가 max_connections 안에 드는지 확인 (넘으면 RuntimeError)
+    - primary: 워커 수 × (api + async) + crawler 1개 + 예약분
+    - 복제본 서버마다: 워커 수 × (replica + replica_async) + 예약분
+    """
+    if DB_PGBOUNCER or DB_ROLE != "api":
+        return
+    errors = []
+    primary = API_WORKERS * (_max_connections() + _max_connections("async")) + _max_connections("crawler") + DB_RESERVED_CONNECTIONS
+    if primary > DB_MAX_CONNECTIONS:
+        errors.append(f"primary {primary} > DB_MAX_CONNECTIONS {DB_MAX_CONNECTIONS}")
+    if replica_count:
+        replica = API_WORKERS * (_max_connections("replica") + _max_connections("replica_async")) + DB_REPLICA_RESERVED_CONNECTIONS
+        if replica > DB_REPLICA_MAX_CONNECTIONS:
+            errors.append(f"복제본 {replica} > DB_REPLICA_MAX_CONNECTIONS {DB_REPLICA_MAX_CONNECTIONS}")
+    if errors:
+        raise RuntimeError(
+            f"DB 커넥션 풀 상한이 max_connections를 넘습니다 ({', '.join(errors)}, 워커 {API_WORKERS}개): "
+            "풀 크기/WEB_CONCURRENCY를 줄이거나 DB_PGBOUNCER를 사용하세요"
+        )
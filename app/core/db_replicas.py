@@ -0,0 +1,155 @@
+"""읽기 복제본 엔진과 복제 지연 감시
+
+- DB_REPLICA_URLS(쉼표 구분)의 복제본마다 sync/async 엔진 생성 (없으면 모든 읽기가 primary)
+- 프로세스마다 감시 스레드 1개가 REPLICA_LAG_CHECK_INTERVAL초마다 지연을 확인
+- 지연이 REPLICA_MAX_LAG_SECONDS를 넘거나 연결에 실패한 복제본은 다음 확인까지 제외 (모두 제외되면 primary)
+- 사용자 데이터를 쓴 직후에는 그 사용자의 읽기를 일정 시간 primary로 고정 (세션이 달라도 방금 쓴 내용을 읽도록)
+"""
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from dotenv import load_dotenv
+from prometheus_client import Gauge
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from app.core.db_pool import engine_options, instrument_engine
+from app.core.redis_client import get_redis_client
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 5))
+# 쓰기 후 primary 고정 시간 (허용 지연 + 지연 확인 주기 사이에 늘어날 수 있는 지연 + 여유 1초)
+USER_PRIMARY_PIN_SECONDS = math.ceil(REPLICA_MAX_LAG_SECONDS + REPLICA_LAG_CHECK_INTERVAL) + 1
+
+redis_client = get_redis_client()
+
+# 받은 WAL을 모두 재생했으면 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간
+# (복제본이 아닌 서버는 NULL → 지연 없음으로 처리, 로컬 테스트용 두 번째 Postgres도 그대로 사용 가능)
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "복제본 복제 지연 (확인 실패 시 -1)",
+    ["replica"],
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "복제본을 읽기에 사용 중이면 1",
+    ["replica"],
+)
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: Engine
+    async_engine: AsyncEngine
+    # 첫 지연 확인 전까지는 primary에서 읽음
+    healthy: bool = False
+    lag: Optional[float] = None
+
+
+def _create_replica(index: int, url: str) -> Replica:
+    name = f"replica-{index}"
+    # 복제본 풀은 primary와 따로 복제본 서버의 max_connections 기준으로 크기를 잡음
+    engine = create_engine(url, **engine_options(is_async=False, target=name, role="replica"))
+    async_engine = create_async_engine(
+        make_url(url).set(drivername="postgresql+asyncpg"),
+        **engine_options(is_async=True, target=name, role="replica_async"),
+    )
+    instrument_engine(engine, target=name, role="replica")
+    instrument_engine(async_engine.sync_engine, target=name, role="replica_async")
+    return Replica(name=name, engine=engine, async_engine=async_engine)
+
+
+replicas: List[Replica] = [_create_replica(i, url) for i, url in enumerate(DB_REPLICA_URLS, start=1)]
+_round_robin = itertools.count()
+
+
+def check_replica(replica: Replica) -> None:
+    try:
+        with replica.engine.connect() as conn:
+            lag = float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+        healthy = lag <= REPLICA_MAX_LAG_SECONDS
+    except Exception as e:
+        lag, healthy = None, False
+        if replica.healthy:
+            logger.warning(f"복제본 {replica.name} 지연 확인 실패, primary로 전환: {e}")
+    if replica.healthy and not healthy and lag is not None:
+        logger.warning(f"복제본 {replica.name} 지연 {lag:.1f}초, primary로 전환")
+    elif healthy and not replica.healthy:
+        logger.info(f"복제본 {replica.name} 읽기 사용 (지연 {lag:.1f}초)")
+    replica.lag, replica.healthy = lag, healthy
+    DB_REPLICA_LAG.labels(replica=replica.name).set(-1 if lag is None else lag)
+    DB_REPLICA_HEALTHY.labels(replica=replica.name).set(1 if healthy else 0)
+
+
+def _monitor() -> None:
+    while True:
+        for replica in replicas:
+            check_replica(replica)
+        time.sleep(REPLICA_LAG_CHECK_INTERVAL)
+
+
+_monitor_pid: Optional[int] = None
+_monitor_lock = threading.Lock()
+
+
+def _ensure_monitor() -> None:
+    """프로세스마다 감시 스레드 1개 (fork된 워커에서도 다시 시작)"""
+    global _monitor_pid
+    if _monitor_pid == os.getpid():
+        return
+    with _monitor_lock:
+        if _monitor_pid != os.getpid():
+            threading.Thread(target=_monitor, name="db-replica-monitor", daemon=True).start()
+            _monitor_pid = os.getpid()
+
+
+def _last_write_key(user_id) -> str:
+    return f"user:{user_id}:last_write"
+
+
+def mark_user_write(user_id) -> None:
+    """사용자 데이터 커밋 직후 호출 (캐시를 지우기 전에 호출해야 다음 읽기가 primary에서 캐시를 채움)"""
+    if not replicas or user_id is None:
+        return
+    try:
+        redis_client.setex(_last_write_key(user_id), USER_PRIMARY_PIN_SECONDS, int(time.time()))
+    except Exception as e:
+        logger.warning(f"사용자 쓰기 시각 기록 실패 ({user_id}): {e}")
+
+
+def _pinned_to_primary(user_id) -> bool:
+    try:
+        return bool(redis_client.exists(_last_write_key(user_id)))
+    except Exception:
+        # 확인할 수 없으면 오래된 데이터를 읽지 않도록 primary
+        return True
+
+
+def pick_replica(user_id=None) -> Optional[Replica]:
+    """지연이 허용 범위인 복제본을 돌아가며 선택 (없거나 user_id가 최근에 썼으면 None → primary)"""
+    if not replicas:
+        return None
+    if user_id is not None and _pinned_to_primary(user_id):
+        return None
+    _ensure_monitor()
+    healthy = [replica for replica in replicas if replica.healthy]
+    if not healthy:
+        return None
+    return healthy[next(_round_robin) % len(healthy)]
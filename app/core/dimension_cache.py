@@ -0,0 +1,177 @@
+"""언론사/카테고리 이름 ↔ id 프로세스 내 캐시
+
+- 처음 사용할 때(또는 서버 시작 시) 테이블 전체를 읽어 메모리에서 조회
+- 없는 이름은 advisory lock 안에서 다시 확인 후 한 번의 INSERT로 생성 (같은 이름의 삭제된 행은 되살림)
+- 새 행이 커밋되면 Redis pub/sub으로 다른 워커에 알려 다시 읽게 함 (Redis 장애 시 DIMENSION_CACHE_TTL마다 다시 읽음)
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+import datetime
+from typing import Dict, Iterable, List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.redis_client import get_redis_client
+from app.models.category import Category
+from app.models.press import Press
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+redis_client = get_redis_client()
+
+DIMENSION_CACHE_TTL = int(os.getenv("DIMENSION_CACHE_TTL", 300))
+INVALIDATION_CHANNEL = "dimension_cache:invalidate"
+
+
+class DimensionCache:
+    def __init__(self, model, name_column):
+        self.model = model
+        self.name_column = name_column
+        self.table = model.__tablename__
+        self._ids: Dict[str, uuid.UUID] = {}  # 삭제되지 않은 행의 이름 → id
+        self._names: Dict[uuid.UUID, str] = {}  # 삭제된 행을 포함한 id → 이름
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def load(self, db: Session) -> None:
+        rows = db.query(self.model.id, self.name_column, self.model.is_deleted).all()
+        with self._lock:
+            self._names = {id_: name for id_, name, _ in rows}
+            self._ids = {name: id_ for id_, name, is_deleted in rows if not is_deleted}
+            self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self, db: Session) -> None:
+        _ensure_listener()
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > DIMENSION_CACHE_TTL:
+            self.load(db)
+
+    def get_id(self, db: Session, name: str) -> Optional[uuid.UUID]:
+        self._ensure_loaded(db)
+        return self._ids.get(name)
+
+    def get_names(self, db: Session, ids: Iterable[uuid.UUID]) -> List[str]:
+        """id 순서대로 이름 목록 (모르는 id는 제외)"""
+        self._ensure_loaded(db)
+        return [self._names[i] for i in ids if i in self._names]
+
+    def get_or_create_ids(self, db: Session, names: Iterable[str]) -> Dict[str, uuid.UUID]:
+        """
+        {이름: id} 반환, 없는 이름은 현재 트랜잭션 안에서 생성
+        - 다른 워커와 동시에 같은 이름을 만들지 않도록 테이블별 advisory lock 안에서 다시 확인
+        - 이름 UNIQUE 제약은 삭제된 행도 포함하므로 같은 이름의 삭제된 행이 있으면 새로 만들지 않고 되살림
+        - 새 행은 커밋된 뒤에 캐시에 반영하고 다른 워커에 무효화 알림
+        """
+        self._ensure_loaded(db)
+        names = set(names)
+        ids = {name: self._ids[name] for name in names if name in self._ids}
+        missing = names - ids.keys()
+        if not missing:
+            return ids
+        db.execute(select(func.pg_advisory_xact_lock(func.hashtext(self.table))))
+        rows = db.query(self.name_column, self.model.id, self.model.is_deleted).filter(self.name_column.in_(missing)).all()
+        created: Dict[str, uuid.UUID] = {}
+        found = {name: id_ for name, id_, is_deleted in rows if not is_deleted}
+        deleted = {name for name, _, is_deleted in rows if is_deleted}
+        to_insert = sorted(missing - found.keys())
+        if to_insert:
+            now = datetime.datetime.utcnow()
+            stmt = insert(self.model).values([
+                {'id': uuid.uuid4(), self.name_column.key: name, 'created_at': now, 'updated_at': now, 'is_deleted': False}
+                for name in to_insert
+            ]).on_conflict_do_update(
+                index_elements=[self.name_column],
+                set_={'is_deleted': False, 'updated_at': now},
+            ).returning(self.name_column, self.model.id)
+            created = {name: id_ for name, id_ in db.execute(stmt)}
+            revived = [name for name in created if name in deleted]
+            if revived:
+                logger.info(f"삭제된 {self.table} 복구: {', '.join(revived)}")
+            if len(revived) < len(created):
+                logger.info(f"새 {self.table} 생성: {', '.join(name for name in created if name not in deleted)}")
+        ids.update(found)
+        ids.update(created)
+        self._after_commit(db, {**found, **created}, notify=bool(created))
+        return ids
+
+    def _after_commit(self, db: Session, entries: Dict[str, uuid.UUID], notify: bool) -> None:
+        def _apply(session):
+            event.remove(db, "after_rollback", _discard)
+            with self._lock:
+                for name, id_ in entries.items():
+                    self._ids[name] = id_
+                    self._names[id_] = name
+            if notify:
+                publish_invalidation(self.table)
+
+        def _discard(session):
+            # 롤백되면 생성한 id가 없어지므로 반영하지 않음
+            event.remove(db, "after_commit", _apply)
+
+        event.listen(db, "after_commit", _apply, once=True)
+        event.listen(db, "after_rollback", _discard, once=True)
+
+
+press_cache = DimensionCache(Press, Press.press_name)
+category_cache = DimensionCache(Category, Category.category_name)
+_CACHES = {cache.table: cache for cache in (press_cache, category_cache)}
+
+
+def publish_invalidation(table: str) -> None:
+    try:
+        redis_client.publish(INVALIDATION_CHANNEL, table)
+    except Exception as e:
+        logger.warning(f"차원 캐시 무효화 알림 실패 ({table}): {e}")
+
+
+def _listen() -> None:
+    """무효화 채널 구독 (끊겼다가 다시 연결되면 그 사이 알림을 놓쳤을 수 있으므로 전체 무효화)"""
+    reconnecting = False
+    while True:
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            if reconnecting:
+                for cache in _CACHES.values():
+                    cache.invalidate()
+            reconnecting = False
+            for message in pubsub.listen():
+                cache = _CACHES.get(message.get("data"))
+                if cache is not None:
+                    cache.invalidate()
+        except Exception as e:
+            if not reconnecting:
+                logger.warning(f"차원 캐시 무효화 구독 끊김, 재연결 시도: {e}")
+            reconnecting = True
+        time.sleep(5)
+
+
+_listener_pid: Optional[int] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    """프로세스마다 구독 스레드 1개 (fork된 워커에서도 다시 시작)"""
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid != os.getpid():
+            threading.Thread(target=_listen, name="dimension-cache-listener", daemon=True).start()
+            _listener_pid = os.getpid()
+
+
+def warm_dimension_caches(db: Session) -> None:
+    """서버 시작 시 언론사/카테고리 전체를 미리 읽음"""
+    _ensure_listener()
+    for cache in _CACHES.values():
+        cache.load(db)
+    logger.info(f"차원 캐시 로드: 언론사 {len(press_cache._ids)}개, 카테고리 {len(category_cache._ids)}개")
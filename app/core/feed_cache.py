@@ -0,0 +1,113 @@
+"""시간 버킷 단위 사용자 피드 캐시
+
+- 최근 FEED_WINDOW_HOURS 범위를 요청마다 FEED_BUCKET_SECONDS 경계에 맞춰 계산 (같은 버킷 안의 요청은 같은 범위)
+- 피드 결과를 (피드 종류, 사용자, 피드 버전, 버킷)별로 Redis에 저장하고 버킷이 끝나면 만료
+- 관심 언론사/카테고리를 바꾸면 사용자 피드 버전을 올려 이전 결과를 더 이상 읽지 않음
+- Redis 장애 시 캐시 없이 DB 조회
+"""
+import datetime
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+from dotenv import load_dotenv
+from app.core.redis_client import get_redis_client
+from app.utils.datetime_utils import get_bucketed_range_kst
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+redis_client = get_redis_client()
+
+FEED_WINDOW_HOURS = int(os.getenv("FEED_WINDOW_HOURS", 12))
+FEED_BUCKET_SECONDS = int(os.getenv("FEED_BUCKET_SECONDS", 300))
+
+
+@dataclass(frozen=True)
+class FeedWindow:
+    bucket: int
+    start: datetime.datetime
+    end: datetime.datetime
+
+
+@dataclass
+class FeedArticle:
+    """캐시에 저장하는 피드 기사 (피드 응답/OpenSearch 인덱싱에 쓰는 필드만)"""
+    id: str
+    title: str
+    summary_text: Optional[str]
+    thumbnail_image_url: Optional[str]
+    category_name: Optional[str]
+    author: Optional[str]
+    published_at: datetime.datetime
+
+    @classmethod
+    def from_article(cls, article) -> "FeedArticle":
+        return cls(
+            id=str(article.id),
+            title=article.title,
+            summary_text=article.summary_text,
+            thumbnail_image_url=article.thumbnail_image_url,
+            category_name=article.category_name,
+            author=article.author,
+            published_at=article.published_at,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FeedArticle":
+        return cls(**{**data, "published_at": datetime.datetime.fromisoformat(data["published_at"])})
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "published_at": self.published_at.isoformat()}
+
+
+def current_feed_window() -> FeedWindow:
+    return FeedWindow(*get_bucketed_range_kst(FEED_WINDOW_HOURS, FEED_BUCKET_SECONDS))
+
+
+def _version_key(user_id) -> str:
+    return f"user:{user_id}:feed_version"
+
+
+def bump_feed_version(user_id) -> None:
+    """사용자 관심 설정이 바뀐 뒤 호출 (이전 버전 캐시는 TTL로 정리)"""
+    try:
+        redis_client.incr(_version_key(user_id))
+    except Exception as e:
+        logger.warning(f"피드 버전 증가 실패 ({user_id}): {e}")
+
+
+def feed_cache_key(kind: str, user_id, window: FeedWindow, *parts: str) -> Optional[str]:
+    """버전을 읽지 못하면 None (오래된 설정의 결과를 쓰지 않도록 캐시 사용 안 함)"""
+    try:
+        version = redis_client.get(_version_key(user_id)) or 0
+    except Exception as e:
+        logger.warning(f"피드 버전 조회 실패 ({user_id}): {e}")
+        return None
+    return ":".join(["feed", kind, str(user_id), f"v{version}", str(window.bucket), *parts])
+
+
+def read_feed_cache(key: Optional[str]) -> Optional[List[FeedArticle]]:
+    if key is None:
+        return None
+    try:
+        cached = redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"피드 캐시 조회 실패 ({key}): {e}")
+        return None
+    if cached is None:
+        return None
+    return [FeedArticle.from_dict(item) for item in json.loads(cached)]
+
+
+def write_feed_cache(key: Optional[str], window: FeedWindow, articles: List[FeedArticle]) -> None:
+    if key is None:
+        return
+    # 버킷이 끝나는 시점에 만료 (다음 버킷은 다른 키)
+    ttl = max(1, int(window.end.timestamp() - time.time()))
+    try:
+        redis_client.setex(key, ttl, json.dumps([a.to_dict() for a in articles], ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"피드 캐시 저장 실패 ({key}): {e}")
@@ -1,25 +1,25 @@
 import datetime
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from uuid import UUID
 from dotenv.main import logger
+from sqlalchemy import Row, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.article_history import ArticleHistory
-from app.models.news_article import NewsArticle
+from app.models.news_article import MEDIA_READY, NewsArticle
+from app.core.dimension_cache import category_cache
 from app.models.user_preferred_press import UserPreferredPress
 from app.core.save import KST
 from app.models.user_preferred_press import UserPreferredPress
 from app.models.user_category import UserCategory
-from app.utils.datetime_utils import get_today_range_kst
+from app.core.feed_cache import FeedArticle, FeedWindow, current_feed_window, feed_cache_key, read_feed_cache, write_feed_cache
 
-start, end = get_today_range_kst()
 # 실시간 뉴스 조회 20개까지
 def get_article_recent(db: Session, limit: int = 20) -> List[NewsArticle]:
-    # 모든 주요 필드가 None/빈 문자열이 아닌 기사만 반환
+    # 오디오/썸네일이 모두 준비된 기사만 반환
     return db.query(NewsArticle).filter(
         NewsArticle.is_deleted == False,
-        NewsArticle.male_audio_url.isnot(None), NewsArticle.male_audio_url != '',
-        NewsArticle.female_audio_url.isnot(None), NewsArticle.female_audio_url != '',
-        NewsArticle.thumbnail_image_url.isnot(None), NewsArticle.thumbnail_image_url != '',
+        NewsArticle.media_status == MEDIA_READY,
     ).order_by(NewsArticle.published_at.desc()).limit(limit).all()
 
 # 뉴스 상세 조회
@@ -27,38 +27,106 @@ def get_article_by_id(db: Session, article_id: UUID):
     return db.query(NewsArticle).filter(
         NewsArticle.id == article_id,
         NewsArticle.is_deleted == False,
-        NewsArticle.male_audio_url.isnot(None), NewsArticle.male_audio_url != '',
-        NewsArticle.female_audio_url.isnot(None), NewsArticle.female_audio_url != '',
-        NewsArticle.thumbnail_image_url.isnot(None), NewsArticle.thumbnail_image_url != '',
+        NewsArticle.media_status == MEDIA_READY,
     ).first()
 
-# 사용자 관심 카테고리 기사 조회
-def get_articles_by_category_and_user_press(db: Session, user_id: str, category_name: str):
-    preferred_press_ids = (
-        db.query(UserPreferredPress.press_id)
-        .filter(
-            UserPreferredPress.user_id == user_id,
-            UserPreferredPress.is_deleted == False
-        )
-        .subquery()
+# 사용자 관심 카테고리 + 선호 언론사 피드 (최근 창 안의 ready 기사)
+def _category_feed_query(user_id: str, category_id: UUID, window: FeedWindow):
+    preferred_press_ids = select(UserPreferredPress.press_id).where(
+        UserPreferredPress.user_id == user_id,
+        UserPreferredPress.is_deleted == False
     )
-    articles = (
-        db.query(NewsArticle)
-        .filter(
-            NewsArticle.category_name == category_name,
-            NewsArticle.press_id.in_(preferred_press_ids),
-            NewsArticle.is_deleted == False,
-            NewsArticle.male_audio_url.isnot(None), NewsArticle.male_audio_url != '',
-            NewsArticle.female_audio_url.isnot(None), NewsArticle.female_audio_url != '',
-            NewsArticle.thumbnail_image_url.isnot(None), NewsArticle.thumbnail_image_url != '',
-            NewsArticle.published_at >= start,
-            NewsArticle.published_at < end
-        )
-        .order_by(NewsArticle.published_at.desc())
-        .all()
+    # (category_id, press_id, published_at) 부분 인덱스를 타도록 카테고리 이름 대신 id로 조회
+    return select(NewsArticle).where(
+        NewsArticle.category_id == category_id,
+        NewsArticle.press_id.in_(preferred_press_ids),
+        NewsArticle.is_deleted == False,
+        NewsArticle.media_status == MEDIA_READY,
+        NewsArticle.published_at >= window.start,
+        NewsArticle.published_at < window.end
+    ).order_by(NewsArticle.published_at.desc())
+
+# 선호 언론사 + 관심 카테고리 피드 (최근 창 안의 기사)
+def _preferred_feed_query(user_id: str, window: FeedWindow):
+    press_ids = select(UserPreferredPress.press_id).where(
+        UserPreferredPress.user_id == user_id,
+        UserPreferredPress.is_deleted == False
+    )
+    category_ids = select(UserCategory.category_id).where(
+        UserCategory.user_id == user_id,
+        UserCategory.is_deleted == False
     )
+    return select(NewsArticle).where(
+        NewsArticle.press_id.in_(press_ids),
+        NewsArticle.category_id.in_(category_ids),
+        NewsArticle.is_deleted == False,
+        NewsArticle.published_at >= window.start,
+        NewsArticle.published_at < window.end
+    ).order_by(NewsArticle.published_at.desc())
+
+# 사용자 관심 카테고리 기사 조회 (같은 시간 버킷 안에서는 캐시 결과 반환)
+def get_articles_by_category_and_user_press(db: Session, user_id: str, category_name: str) -> List[FeedArticle]:
+    window = current_feed_window()
+    key = feed_cache_key("category", user_id, window, category_name)
+    cached = read_feed_cache(key)
+    if cached is not None:
+        return cached
+    category_id = category_cache.get_id(db, category_name)
+    articles = [] if category_id is None else [
+        FeedArticle.from_article(a) for a in db.execute(_category_feed_query(user_id, category_id, window)).scalars()
+    ]
+    write_feed_cache(key, window, articles)
     return articles
 
+# 전체 기사 목록 컬럼 (ORM 객체 대신 행으로 읽어 직렬화 비용을 줄임)
+ARTICLE_LIST_COLUMNS = (
+    NewsArticle.id, NewsArticle.title, NewsArticle.url, NewsArticle.published_at, NewsArticle.summary_text,
+    NewsArticle.category_name, NewsArticle.author, NewsArticle.original_image_url, NewsArticle.thumbnail_image_url,
+    NewsArticle.male_audio_url, NewsArticle.female_audio_url, NewsArticle.media_status,
+    NewsArticle.press_id, NewsArticle.category_id, NewsArticle.created_at, NewsArticle.updated_at,
+)
+
+# 이전 GET /articles 응답용 (ORM 객체를 그대로 반환하던 때와 같은 전체 컬럼)
+ARTICLE_ALL_COLUMNS = tuple(NewsArticle.__table__.columns)
+
+def _article_list_query(after: Optional[Tuple[datetime.datetime, UUID]], columns=ARTICLE_LIST_COLUMNS):
+    # (published_at DESC, id DESC) 인덱스 순서 그대로 after 이후 행만 읽음 (OFFSET 없이 페이지 크기만큼만 스캔)
+    stmt = select(*columns).where(NewsArticle.is_deleted == False)
+    if after is not None:
+        stmt = stmt.where(tuple_(NewsArticle.published_at, NewsArticle.id) < tuple(after))
+    return stmt.order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
+
+# 전체 기사 목록 키셋 페이지 (after: 이전 페이지 마지막 행의 (published_at, id))
+def get_articles_page(db: Session, limit: int, after: Optional[Tuple[datetime.datetime, UUID]] = None) -> List[Row]:
+    return db.execute(_article_list_query(after).limit(limit)).all()
+
+# 전체 기사 내보내기 (서버 사이드 커서로 batch_size행씩 읽어 메모리 사용량 일정)
+def iter_articles(db: Session, after: Optional[Tuple[datetime.datetime, UUID]] = None, batch_size: int = 1000, columns=ARTICLE_LIST_COLUMNS) -> Iterator[Row]:
+    result = db.execute(_article_list_query(after, columns).execution_options(yield_per=batch_size))
+    try:
+        yield from result
+    finally:
+        result.close()
+
+# 이미 저장된 기사 URL 일괄 조회 (IN 쿼리 1회)
+def get_existing_article_urls(db: Session, urls: Iterable[str]) -> Set[str]:
+    urls = list(urls)
+    if not urls:
+        return set()
+    rows = db.query(NewsArticle.url).filter(
+        NewsArticle.url.in_(urls),
+        NewsArticle.is_deleted == False
+    ).all()
+    return {row[0] for row in rows}
+
+# URL로 기사 요약 조회 (근접 중복 기사의 정본 요약 재사용)
+def get_article_summary_by_url(db: Session, url: str) -> Optional[str]:
+    row = db.query(NewsArticle.summary_text).filter(
+        NewsArticle.url == url,
+        NewsArticle.is_deleted == False
+    ).first()
+    return row[0] if row and row[0] else None
+
 # 기사 삭제 
 def delete_article(db: Session, article_id: str) -> bool:
     try:
@@ -105,29 +173,74 @@ def mark_article_as_viewed(db: Session, user_id: str, article_id: str) -> bool:
         logger.error(f"기사 읽음 처리 실패: {e}")
         return False
 
-def get_user_preferred_articles(db: Session, user_id: str) -> List[NewsArticle]:
+def get_user_preferred_articles(db: Session, user_id: str) -> List[FeedArticle]:
     """
-    사용자가 지정한 언론사와 관심 카테고리의 '오늘' 기사만 반환
+    사용자가 지정한 언론사와 관심 카테고리의 최근 기사만 반환 (같은 시간 버킷 안에서는 캐시 결과 반환)
     """
-    # 1. 사용자의 선호 언론사 id 목록
-    press_ids = db.query(UserPreferredPress.press_id).filter(
-        UserPreferredPress.user_id == user_id,
-        UserPreferredPress.is_deleted == False
-    ).all()
-    press_ids = [pid[0] for pid in press_ids]
-    # 2. 사용자의 관심 카테고리 id 목록
-    category_ids = db.query(UserCategory.category_id).filter(
-        UserCategory.user_id == user_id,
-        UserCategory.is_deleted == False
-    ).all()
-    category_ids = [cid[0] for cid in category_ids]
-    # 4. 해당 언론사+카테고리+오늘 기사만 반환
-    articles = db.query(NewsArticle).filter(
-        NewsArticle.press_id.in_(press_ids),
-        NewsArticle.category_id.in_(category_ids),
-        NewsArticle.is_deleted == False,
-        NewsArticle.published_at >= start,
-        NewsArticle.published_at < end
-    ).order_by(NewsArticle.published_at.desc()).all()
+    window = current_feed_window()
+    key = feed_cache_key("preferred", user_id, window)
+    cached = read_feed_cache(key)
+    if cached is not None:
+        return cached
+    articles = [FeedArticle.from_article(a) for a in db.execute(_preferred_feed_query(user_id, window)).scalars()]
+    write_feed_cache(key, window, articles)
     return articles
 
+
+# ---- async 엔드포인트용 (AsyncSession, 동기 버전과 같은 조건) ----
+
+async def get_article_recent_async(db: AsyncSession, limit: int = 20) -> List[NewsArticle]:
+    result = await db.execute(
+        select(NewsArticle).where(
+            NewsArticle.is_deleted == False,
+            NewsArticle.media_status == MEDIA_READY,
+        ).order_by(NewsArticle.published_at.desc()).limit(limit)
+    )
+    return list(result.scalars())
+
+async def get_article_by_id_async(db: AsyncSession, article_id: UUID) -> Optional[NewsArticle]:
+    result = await db.execute(
+        select(NewsArticle).where(
+            NewsArticle.id == article_id,
+            NewsArticle.is_deleted == False,
+            NewsArticle.media_status == MEDIA_READY,
+        )
+    )
+    return result.scalars().first()
+
+async def get_articles_by_category_and_user_press_async(db: AsyncSession, user_id: str, category_name: str) -> List[FeedArticle]:
+    window = current_feed_window()
+    key = feed_cache_key("category", user_id, window, category_name)
+    cached = read_feed_cache(key)
+    if cached is not None:
+        return cached
+    # 차원 캐시는 동기 Session을 받으므로 run_sync로 조회 (캐시 적중 시 DB 접근 없음)
+    category_id = await db.run_sync(category_cache.get_id, category_name)
+    articles = [] if category_id is None else [
+        FeedArticle.from_article(a) for a in (await db.execute(_category_feed_query(user_id, category_id, window))).scalars()
+    ]
+    write_feed_cache(key, window, articles)
+    return articles
+
+async def get_user_preferred_articles_async(db: AsyncSession, user_id: str) -> List[FeedArticle]:
+    window = current_feed_window()
+    key = feed_cache_key("preferred", user_id, window)
+    cached = read_feed_cache(key)
+    if cached is not None:
+        return cached
+    articles = [FeedArticle.from_article(a) for a in (await db.execute(_preferred_feed_query(user_id, window))).scalars()]
+    write_feed_cache(key, window, articles)
+    return articles
+
+async def get_articles_by_ids_async(db: AsyncSession, article_ids: Iterable[str]) -> Dict[str, NewsArticle]:
+    """삭제되지 않은 기사를 id 목록으로 한 번에 조회 ({문자열 id: 기사})"""
+    article_ids = [UUID(str(article_id)) for article_id in article_ids]
+    if not article_ids:
+        return {}
+    result = await db.execute(
+        select(NewsArticle).where(
+            NewsArticle.id.in_(article_ids),
+            NewsArticle.is_deleted == False
+        )
+    )
+    return {str(article.id): article for article in result.scalars()}
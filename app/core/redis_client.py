@@ -0,0 +1,22 @@
+"""공용 Redis 클라이언트
+
+- 모듈마다 redis.Redis를 따로 만들면 모듈 수만큼 커넥션 풀이 생기므로 프로세스에서 하나만 만들어 공유
+- 연결 설정은 REDIS_HOST/REDIS_PORT/REDIS_DB 환경변수 한 곳에서 읽음
+- redis-py 풀은 fork 후 pid가 바뀌면 커넥션을 새로 만들므로 워커 프로세스에서도 그대로 사용 가능
+"""
+import os
+from functools import lru_cache
+import redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> redis.Redis:
+    """프로세스 공용 클라이언트 (처음 호출 시 생성, 실제 연결은 첫 명령 때)"""
+    return redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB, decode_responses=True)
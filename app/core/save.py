@@ -3,16 +3,21 @@ import uuid
 import logging
 import hashlib
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 from dateutil import parser
-from app.models.news_article import NewsArticle
-from app.models.press import Press
-from app.models.category import Category
-from app.celery_app import process_image_to_gcs_async_task, generate_tts_audio_async_task
+from app.models.news_article import MEDIA_PENDING, NewsArticle
+from app.core.dimension_cache import category_cache, press_cache
+from app.celery_app import dispatch_post_save_tasks
+from app.services.crawling.dedup import index_fingerprint
 
 logger = logging.getLogger(__name__)
 KST = datetime.timezone(datetime.timedelta(hours=9))
+# 요약은 컬럼 길이(String(500))에 맞춰 자름 (한 행이라도 넘치면 일괄 INSERT 전체가 실패하므로)
+SUMMARY_MAX_LENGTH = NewsArticle.__table__.c.summary_text.type.length
 
 
 def parse_published_time(time_str: Optional[str]) -> datetime.datetime:
@@ -35,125 +40,198 @@ def parse_published_time(time_str: Optional[str]) -> datetime.datetime:
         return datetime.datetime.now(KST)
 
 
-def get_or_create_press(db: Session, press_name: str) -> Press:
-    press = db.query(Press).filter(
-        Press.press_name == press_name,
-        Press.is_deleted == False
-    ).first()
-    if not press:
-        press = Press(press_name=press_name)
-        db.add(press)
-        db.commit()
-        db.refresh(press)
-        logger.info(f"새 언론사 생성: {press.press_name}")
-    return press
-
-
-def get_or_create_category(db: Session, category_name: str) -> Category:
-    category = db.query(Category).filter(
-        Category.category_name == category_name,
-        Category.is_deleted == False
-    ).first()
-    if not category:
-        category = Category(category_name=category_name)
-        db.add(category)
-        db.commit()
-        db.refresh(category)
-        logger.info(f"새 카테고리 생성: {category.category_name}")
-    return category
+def get_canonical_article_ids(db: Session, canonical_urls: Iterable[str]) -> Dict[str, uuid.UUID]:
+    """근접 중복 기사의 정본 id를 한 번에 조회 (정본이 다시 중복이면 최초 정본으로 연결)"""
+    canonical_urls = set(u for u in canonical_urls if u)
+    if not canonical_urls:
+        return {}
+    rows = db.query(NewsArticle.url, NewsArticle.id, NewsArticle.canonical_article_id).filter(
+        NewsArticle.url.in_(canonical_urls),
+        NewsArticle.is_deleted == False
+    ).all()
+    return {url: root_id or id_ for url, id_, root_id in rows}
 
 
-def save_article_to_db(db: Session, article_data: Dict) -> Optional[NewsArticle]:
+def _build_article_row(article_data: Dict, article_id: uuid.UUID, press_id, category_id, canonical_id, now: datetime.datetime) -> Dict:
+    # 기자명 처리
+    reporter_name = article_data.get('reporter_name')
+    return {
+        'id': article_id,
+        'title': (article_data.get('title') or '')[:255],
+        'url': (article_data.get('url') or '')[:225],
+        'published_at': parse_published_time(article_data.get('published_time')),
+        'summary_text': (article_data.get('content') or '')[:SUMMARY_MAX_LENGTH],
+        'male_audio_url': "",
+        'female_audio_url': "",
+        'category_name': (article_data.get('category') or '')[:30],
+        'original_image_url': (article_data.get('image_url') or '')[:200],
+        'thumbnail_image_url': "",
+        'content_simhash': article_data.get('content_simhash'),
+        'canonical_article_id': canonical_id,
+        'media_status': MEDIA_PENDING,
+        'author': reporter_name[:20] if reporter_name else '기자명 미제공',
+        'created_at': now,
+        'updated_at': now,
+        'is_deleted': False,
+        'press_id': press_id,
+        'category_id': category_id,
+    }
+
+
+def _link_batch_canonicals(db: Session, inserted: List[Dict], pending_canonical: Dict[uuid.UUID, str]) -> None:
+    """
+    정본이 같은 배치에 있던 기사를 INSERT 후 실제 저장된 행과 url로 연결
+    (배치에서 만든 id를 바로 넣으면 정본 행이 ON CONFLICT로 빠졌을 때 FK 위반으로 배치 전체가 실패)
+    """
+    pending = {row['id']: pending_canonical[row['id']] for row in inserted if row['id'] in pending_canonical}
+    if not pending:
+        return
+    canonical_ids = get_canonical_article_ids(db, pending.values())
+    updates = []
+    for row in inserted:
+        canonical_id = canonical_ids.get(pending.get(row['id']))
+        if canonical_id is None or canonical_id == row['id']:
+            continue
+        row['canonical_article_id'] = canonical_id
+        updates.append({'id': row['id'], 'canonical_article_id': canonical_id})
+    if updates:
+        db.execute(update(NewsArticle), updates)
+
+
+def _insert_rows(db: Session, rows: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
     """
-    기사 데이터를 DB에 저장하고, 후처리 태스크(TTS, 이미지)를 비동기로 실행
+    한 번의 INSERT ... ON CONFLICT (url) DO NOTHING RETURNING으로 저장하고 (저장된 행, 실패한 행) 반환
+    - 일괄 INSERT가 DB 오류로 실패하면 기사별 SAVEPOINT로 다시 저장 (문제 있는 행만 건너뜀)
     """
+    def _insert(batch: List[Dict]) -> set:
+        stmt = insert(NewsArticle).values(batch).on_conflict_do_nothing(
+            index_elements=[NewsArticle.url],
+            index_where=text('is_deleted = false'),
+        ).returning(NewsArticle.id)
+        with db.begin_nested():
+            return {row_id for (row_id,) in db.execute(stmt)}
+
+    failed: List[Dict] = []
     try:
-        # 필수 필드 검증
-        if not article_data.get('title') or not article_data.get('url'):
-            logger.warning(f"필수 필드 누락: title={article_data.get('title')}, url={article_data.get('url')}")
-            return None
-        # URL 중복 체크
-        existing_article = db.query(NewsArticle).filter(
-            NewsArticle.url == article_data['url'],
-            NewsArticle.is_deleted == False
-        ).first()
-        if existing_article:
-            logger.info(f"이미 존재하는 기사: {article_data['url']}")
-            return existing_article
-        # 언론사/카테고리
-        press = get_or_create_press(db, article_data.get('press_name', 'unknown'))
-        category = get_or_create_category(db, article_data.get('category', 'general'))
-        # 발행 시간
-        published_at = parse_published_time(article_data.get('published_time'))
-        if not published_at:
-            published_at = datetime.datetime.now(KST)
-        article_id = str(uuid.uuid4())
-        # 기자명 처리
-        reporter_name = article_data.get('reporter_name')
-        author = reporter_name[:20] if reporter_name else '기자명 미제공'
-        # NewsArticle 생성
-        news_article = NewsArticle(
-            id=uuid.UUID(article_id),
-            title=(article_data.get('title') or '')[:255],
-            url=(article_data.get('url') or '')[:225],
-            published_at=published_at,
-            summary_text=(article_data.get('content') or '')[:10000],
-            male_audio_url="",
-            female_audio_url="",
-            category_name=(article_data.get('category') or '')[:30],
-            original_image_url=(article_data.get('image_url') or '')[:200],
-            thumbnail_image_url="",
-            author=author,
-            is_deleted=False,
-            press_id=press.id,
-            category_id=category.id
-        )
-        db.add(news_article)
-        db.commit()
-        db.refresh(news_article)
-        # TTS 생성 Celery 태스크
-        try:
-            tts_task = generate_tts_audio_async_task(str(news_article.id))
-            logger.info(f"TTS Celery 태스크 시작: {tts_task['task_id']}")
-        except Exception as e:
-            logger.error(f"TTS Celery 태스크 시작 실패: {e}")
-        # 썸네일 이미지 생성 Celery 태스크
-        try:
-            image_task = process_image_to_gcs_async_task(str(news_article.id))
-            logger.info(f"이미지 썸네일 생성 태스크 시작: {image_task['task_id']}")
-        except Exception as e:
-            logger.error(f"이미지 썸네일 태스크 시작 실패: {e}")
-        logger.info(f"기사 저장 완료: {news_article.title[:50]}...")
-        return news_article
+        inserted_ids = _insert(rows)
+    except DBAPIError as e:
+        if len(rows) == 1:
+            raise
+        logger.warning(f"일괄 INSERT 실패, 기사별로 다시 저장: {e.orig}")
+        inserted_ids = set()
+        for row in rows:
+            try:
+                inserted_ids |= _insert([row])
+            except DBAPIError as row_error:
+                logger.error(f"기사 저장 실패 ({row['url']}): {row_error.orig}")
+                failed.append(row)
+    return [row for row in rows if row['id'] in inserted_ids], failed
+
+
+def _start_post_processing(rows: List[Dict]) -> None:
+    """새로 저장된 기사들의 후처리 태스크를 한 번에 발행 (중복 기사는 정본 미디어 복사, 나머지는 TTS/썸네일 생성)"""
+    if not rows:
+        return
+    article_ids, duplicate_ids = [], []
+    for row in rows:
+        if row['canonical_article_id'] is not None:
+            # 정본 미디어 재사용 (TTS/썸네일 생성 생략)
+            duplicate_ids.append(str(row['id']))
+            continue
+        if row['content_simhash']:
+            index_fingerprint(int(row['content_simhash'], 16), row['url'])
+        article_ids.append(str(row['id']))
+    try:
+        dispatched = dispatch_post_save_tasks(article_ids, duplicate_ids)
+        logger.info(f"후처리 태스크 발행: {dispatched['tasks']}개 (group {dispatched['group_id']}, 신규 {len(article_ids)}개, 중복 {len(duplicate_ids)}개)")
     except Exception as e:
-        logger.error(f"기사 저장 실패: {e}")
-        db.rollback()
-    finally:
-        db.close()
-    return None
+        logger.error(f"후처리 태스크 발행 실패: {e}")
 
 
-def save_articles_batch(db: Session, articles: List[Dict]) -> Dict[str, int]:
+def save_articles_batch(db: Session, articles: List[Dict]) -> Dict:
     """
-    여러 기사를 일괄 저장
-    Returns: 저장 결과 통계
+    여러 기사를 한 트랜잭션으로 일괄 저장하고, 새로 저장된 기사만 후처리 태스크(TTS, 이미지) 실행
+    - 언론사/카테고리는 차원 캐시에서 조회 (없는 것만 생성)
+    - 기사는 한 번의 INSERT ... ON CONFLICT (url) DO NOTHING RETURNING으로 저장 (이미 있는 URL은 중복으로 집계)
+    - 일괄 INSERT가 실패하면 기사별로 다시 저장해 실패한 기사만 failed로 집계
+    - 근접 중복 기사(canonical_url 지정)는 정본 id를 연결
+    Returns: 저장 결과 통계 (failed_urls: 저장하지 못한 기사 URL)
     """
-    saved_count = 0
     failed_count = 0
+    failed_urls: List[str] = []
     duplicate_count = 0
+    valid: List[Dict] = []
+    seen_urls = set()
     for article_data in articles:
+        # 필수 필드 검증
+        if not article_data.get('title') or not article_data.get('url'):
+            logger.warning(f"필수 필드 누락: title={article_data.get('title')}, url={article_data.get('url')}")
+            failed_count += 1
+            if article_data.get('url'):
+                failed_urls.append(article_data['url'])
+            continue
+        url = article_data['url'][:225]
+        if url in seen_urls:
+            duplicate_count += 1
+            continue
+        seen_urls.add(url)
+        valid.append(article_data)
+    inserted: List[Dict] = []
+    if valid:
         try:
-            result = save_article_to_db(db, article_data)
-            if result:
-                saved_count += 1
-            else:
-                failed_count += 1
+            press_ids = press_cache.get_or_create_ids(db, (a.get('press_name') or 'unknown' for a in valid))
+            category_ids = category_cache.get_or_create_ids(db, (a.get('category') or 'general' for a in valid))
+            canonical_ids = get_canonical_article_ids(db, (a.get('canonical_url') for a in valid))
+            now = datetime.datetime.utcnow()
+            rows = []
+            # 정본이 같은 배치에 있는 기사 (INSERT 후 url로 연결)
+            pending_canonical: Dict[uuid.UUID, str] = {}
+            for article_data in valid:
+                article_id = uuid.uuid4()
+                canonical_url = article_data.get('canonical_url')
+                canonical_id = canonical_ids.get(canonical_url)
+                if canonical_url and canonical_id is None:
+                    pending_canonical[article_id] = canonical_url[:225]
+                rows.append(_build_article_row(
+                    article_data,
+                    article_id,
+                    press_ids[article_data.get('press_name') or 'unknown'],
+                    category_ids[article_data.get('category') or 'general'],
+                    canonical_id,
+                    now,
+                ))
+            inserted, failed_rows = _insert_rows(db, rows)
+            _link_batch_canonicals(db, inserted, pending_canonical)
+            db.commit()
+            failed_count += len(failed_rows)
+            failed_ids = {row['id'] for row in failed_rows}
+            failed_urls += [a['url'] for a, row in zip(valid, rows) if row['id'] in failed_ids]
+            duplicate_count += len(rows) - len(inserted) - len(failed_rows)
         except Exception as e:
-            logger.error(f"기사 저장 중 오류: {e}")
-            failed_count += 1
+            logger.error(f"기사 일괄 저장 실패: {e}")
+            db.rollback()
+            inserted = []
+            failed_count += len(valid)
+            failed_urls += [a['url'] for a in valid]
+    _start_post_processing(inserted)
     return {
-        'saved': saved_count,
+        'saved': len(inserted),
         'failed': failed_count,
         'duplicate': duplicate_count,
-        'total': len(articles)
-    }
\ No newline at end of file
+        'total': len(articles),
+        'failed_urls': failed_urls,
+    }
+
+
+def save_article_to_db(db: Session, article_data: Dict) -> Optional[NewsArticle]:
+    """
+    기사 1개 저장 (save_articles_batch 사용, 세션은 호출한 쪽에서 닫음)
+    - 이미 저장된 URL이면 기존 기사 반환
+    """
+    result = save_articles_batch(db, [article_data])
+    if result['failed']:
+        return None
+    return db.query(NewsArticle).filter(
+        NewsArticle.url == article_data['url'][:225],
+        NewsArticle.is_deleted == False
+    ).first()
@@ -0,0 +1,154 @@
+"""
+create_all이 기존 테이블에 반영하지 못하는 컬럼/인덱스 추가와 데이터 보정 (배포마다 한 번 실행)
+
+- 앱/워커 import 시에는 실행하지 않음 (ALTER TABLE이 ACCESS EXCLUSIVE 락을 잡으므로 워커 수만큼 반복되면 안 됨)
+- 배포 시 `python -m app.core.schema_upgrades`로 한 번 실행 (docker-compose의 migrate 서비스)
+- 적용한 단계는 schema_migrations 테이블에 기록해 다음 배포부터 건너뜀 (백필 UPDATE도 한 번만 실행)
+- 동시에 여러 번 실행돼도 advisory lock으로 한 프로세스만 적용
+"""
+import logging
+from typing import List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_ID = 7_241_001
+
+
+def _merge_duplicate_names(table: str, name_column: str, references: List[Tuple[str, str]], link_table: str, link_column: str) -> List[str]:
+    """
+    같은 이름의 차원 행(언론사/카테고리)을 하나로 합친 뒤 이름 UNIQUE 제약 추가
+    - 남길 행: 삭제되지 않은 행 중 가장 먼저 만든 행 / references의 FK를 남길 행으로 옮긴 뒤 나머지 삭제
+    - 합친 뒤 사용자 선호(link_table)가 같은 행을 두 번 가리키면 뒤의 것을 soft delete
+    """
+    ranked = (
+        f"SELECT id, first_value(id) OVER (PARTITION BY {name_column} ORDER BY is_deleted, created_at, id) AS keep_id "
+        f"FROM {table}"
+    )
+    statements = [
+        f"UPDATE {ref_table} t SET {ref_column} = r.keep_id FROM ({ranked}) r "
+        f"WHERE t.{ref_column} = r.id AND r.id <> r.keep_id"
+        for ref_table, ref_column in references
+    ]
+    statements += [
+        f"DELETE FROM {table} d USING ({ranked}) r WHERE d.id = r.id AND r.id <> r.keep_id",
+        f"""
+        UPDATE {link_table} SET is_deleted = true, updated_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (PARTITION BY user_id, {link_column} ORDER BY created_at, id) AS rn
+                FROM {link_table} WHERE is_deleted = false
+            ) ranked WHERE rn > 1
+        )
+        """,
+        # create_all로 새로 만든 테이블(unique=True)과 같은 제약 이름
+        f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{table}_{name_column}_key') THEN
+                ALTER TABLE {table} ADD CONSTRAINT {table}_{name_column}_key UNIQUE ({name_column});
+            END IF;
+        END $$
+        """,
+    ]
+    return statements
+
+
+# (단계 이름, SQL 목록) - 이미 배포된 단계는 수정하지 말고 새 단계를 뒤에 추가
+SCHEMA_UPGRADES: List[Tuple[str, List[str]]] = [
+    # 근접 중복 기사 연결
+    ("0001_near_duplicate_columns", [
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS content_simhash VARCHAR(16)",
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS canonical_article_id UUID REFERENCES news_articles(id)",
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_canonical_article_id ON news_articles (canonical_article_id) WHERE canonical_article_id IS NOT NULL",
+    ]),
+    # URL 유니크 인덱스: 기존 중복 URL은 가장 먼저 저장된 기사만 남기고 soft delete 후 생성
+    ("0002_unique_active_url", [
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'ux_news_articles_url_active') THEN
+                UPDATE news_articles SET is_deleted = true, updated_at = now()
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, row_number() OVER (PARTITION BY url ORDER BY created_at, id) AS rn
+                        FROM news_articles WHERE is_deleted = false
+                    ) ranked WHERE rn > 1
+                );
+                CREATE UNIQUE INDEX ux_news_articles_url_active ON news_articles (url) WHERE is_deleted = false;
+            END IF;
+        END $$
+        """,
+    ]),
+    # 미디어 준비 상태: 기존 기사는 오디오/썸네일 URL로 채움 (pending인데 미디어가 있는 행만 갱신)
+    ("0003_media_status", [
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS media_status VARCHAR(16) NOT NULL DEFAULT 'pending'",
+        """
+        UPDATE news_articles SET media_status = CASE
+            WHEN COALESCE(male_audio_url, '') <> '' AND COALESCE(female_audio_url, '') <> '' AND COALESCE(thumbnail_image_url, '') <> '' THEN 'ready'
+            WHEN COALESCE(male_audio_url, '') <> '' AND COALESCE(female_audio_url, '') <> '' THEN 'audio_ready'
+            WHEN COALESCE(thumbnail_image_url, '') <> '' THEN 'thumbnail_ready'
+            ELSE 'pending' END
+        WHERE media_status = 'pending'
+          AND ((COALESCE(male_audio_url, '') <> '' AND COALESCE(female_audio_url, '') <> '') OR COALESCE(thumbnail_image_url, '') <> '')
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_ready_published_at ON news_articles (published_at DESC) WHERE media_status = 'ready' AND is_deleted = false",
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_ready_category_press_published_at ON news_articles (category_id, press_id, published_at DESC) WHERE media_status = 'ready' AND is_deleted = false",
+    ]),
+    # 전체 기사 목록 키셋 페이지네이션
+    ("0004_articles_keyset_index", [
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_published_at_id ON news_articles (published_at DESC, id DESC) WHERE is_deleted = false",
+    ]),
+    # 피드는 이름이 아니라 id로 조회하므로 같은 이름의 언론사/카테고리가 여러 개면 일부 기사가 빠짐
+    ("0005_unique_dimension_names",
+        _merge_duplicate_names("categories", "category_name", [("news_articles", "category_id"), ("user_categories", "category_id")], "user_categories", "category_id")
+        + _merge_duplicate_names("presses", "press_name", [("news_articles", "press_id"), ("user_preferred_presses", "press_id")], "user_preferred_presses", "press_id")),
+]
+
+
+def apply_schema_upgrades(engine: Engine) -> List[str]:
+    """아직 적용하지 않은 단계만 단계별 트랜잭션으로 적용하고, 적용한 단계 이름 반환"""
+    applied_now: List[str] = []
+    with engine.connect() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "name VARCHAR(100) PRIMARY KEY, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        ))
+        conn.commit()
+        # 세션 단위 락: 다른 프로세스가 적용 중이면 끝날 때까지 대기
+        conn.execute(text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+        try:
+            applied = set(conn.execute(text("SELECT name FROM schema_migrations")).scalars())
+            conn.commit()
+            for name, statements in SCHEMA_UPGRADES:
+                if name in applied:
+                    continue
+                for statement in statements:
+                    conn.execute(text(statement))
+                conn.execute(text("INSERT INTO schema_migrations (name) VALUES (:name)"), {"name": name})
+                conn.commit()
+                applied_now.append(name)
+                logger.info(f"스키마 업그레이드 적용: {name}")
+        finally:
+            conn.rollback()
+            conn.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+            conn.commit()
+    logger.info(f"스키마 업그레이드 완료: 새로 적용 {len(applied_now)}개 / 전체 {len(SCHEMA_UPGRADES)}개")
+    return applied_now
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    import app.models  # noqa: F401  모든 테이블 등록
+    from app.core.database import Base, engine
+    Base.metadata.create_all(bind=engine)
+    if "0005_unique_dimension_names" in apply_schema_upgrades(engine):
+        # 합쳐서 없어진 id를 들고 있는 워커가 있으면 다시 읽도록
+        from app.core.dimension_cache import publish_invalidation
+        publish_invalidation("categories")
+        publish_invalidation("presses")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from app.middleware.auth_middleware import AuthMiddleware
 from app.routers import router
+from app.routers.article import stream_articles_json_array
 from app.utils.scheduler import start_scheduler
 from .core.database import engine, SessionLocal
-from sqlalchemy.orm import Session
 from app.core.database import Base
+from app.core.db_pool import API_THREADPOOL_SIZE
+from app.core.dimension_cache import warm_dimension_caches
 from app.models.news_article import NewsArticle
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
+import anyio
 import os
 from dotenv import load_dotenv
 
@@ -47,29 +51,39 @@ instrumentator.expose(app, include_in_schema=False) # 메트릭 정보 확인
 
 # Create tables
 Base.metadata.create_all(bind=engine)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 컬럼/인덱스 추가와 데이터 보정은 배포 시 migrate 서비스가 한 번만 실행 (python -m app.core.schema_upgrades)
 
 @app.get("/")
 def root():
     return {"message": "News Briefing Backend is running."} 
 
-@app.get("/articles")
-def read_articles(db: Session = Depends(get_db)):
-    return db.query(NewsArticle).all()
-
+# 기존 클라이언트용 전체 기사 목록 (응답 형태 유지: 전체 컬럼 기사 객체의 JSON 배열, 삭제된 기사 제외)
+# 새 클라이언트는 페이지 단위로 조회하는 /api/v1/articles 사용
+@app.get("/articles", deprecated=True)
+def read_articles():
+    return StreamingResponse(
+        stream_articles_json_array(),
+        media_type="application/json",
+        headers={"Deprecation": "true", "Link": '</api/v1/articles>; rel="successor-version"'},
+    )
 
 # 서버 시작 시 전체 기사 크롤링 한번 실행
 # 이후 매 15분마다 자동 크롤링
 
+@app.on_event("startup")
+async def configure_threadpool():
+    # 동기 엔드포인트 스레드 수를 API DB 풀 기본 크기 계산에 쓴 값과 맞춤
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+
 @app.on_event("startup")
 def startup_event():
    start_scheduler(app)
+   # 언론사/카테고리 이름 ↔ id 캐시 미리 로드
+   db = SessionLocal()
+   try:
+       warm_dimension_caches(db)
+   finally:
+       db.close()
   #  서버 시작 시 즉시 한 번 실행은 제거됨
     # import asyncio
     # loop = asyncio.get_event_loop()
@@ -7,6 +7,7 @@ from .user_preferred_press import UserPreferredPress
 from .article_history import ArticleHistory
 from .category import Category
 from .user_category import UserCategory
+from .summary_cache import SummaryCache
 
 __all__ = [
     "User",
@@ -17,4 +18,5 @@ __all__ = [
     "ArticleHistory",
     "Category",
     "UserCategory",
+    "SummaryCache",
 ]
@@ -9,7 +9,7 @@ class Category(Base):
     __tablename__ = "categories"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    category_name = Column(String(30), nullable=False)
+    category_name = Column(String(30), nullable=False, unique=True)
 
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
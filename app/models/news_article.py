@@ -1,12 +1,22 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, and_, case, text, true
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from datetime import datetime
 import uuid
 
+# 미디어(오디오/썸네일) 준비 상태
+MEDIA_PENDING = "pending"
+MEDIA_AUDIO_READY = "audio_ready"
+MEDIA_THUMBNAIL_READY = "thumbnail_ready"
+MEDIA_READY = "ready"
+
 class NewsArticle(Base):
     __tablename__ = "news_articles"
+    __table_args__ = (
+        # 삭제되지 않은 기사 URL 중복 방지 (일괄 저장의 ON CONFLICT (url) 대상)
+        Index("ux_news_articles_url_active", "url", unique=True, postgresql_where=text("is_deleted = false")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
@@ -19,6 +29,11 @@ class NewsArticle(Base):
     thumbnail_image_url = Column(String(300))
     author = Column(String(20), nullable=False)
     category_name = Column(String(30), nullable=False)
+    # 근접 중복 판정용 본문 SimHash(16진수)와 중복일 경우 정본 기사
+    content_simhash = Column(String(16), nullable=True)
+    canonical_article_id = Column(UUID(as_uuid=True), ForeignKey("news_articles.id"), nullable=True)
+    # 오디오(남/여)와 썸네일이 모두 준비되면 ready (피드 조회는 ready인 기사만 대상)
+    media_status = Column(String(16), nullable=False, default=MEDIA_PENDING, server_default=MEDIA_PENDING)
 
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -31,3 +46,40 @@ class NewsArticle(Base):
     category = relationship("Category", back_populates="news_articles")
 
     histories = relationship("ArticleHistory", back_populates="article")
+
+
+# 피드 조회용 부분 인덱스 (ready이고 삭제되지 않은 기사만, 최신순 top-N)
+_FEED_INDEX_WHERE = text(f"media_status = '{MEDIA_READY}' AND is_deleted = false")
+Index("ix_news_articles_ready_published_at", NewsArticle.published_at.desc(), postgresql_where=_FEED_INDEX_WHERE)
+Index(
+    "ix_news_articles_ready_category_press_published_at",
+    NewsArticle.category_id, NewsArticle.press_id, NewsArticle.published_at.desc(),
+    postgresql_where=_FEED_INDEX_WHERE,
+)
+# 전체 기사 목록 키셋 페이지네이션용 ((published_at, id) 커서)
+Index(
+    "ix_news_articles_published_at_id",
+    NewsArticle.published_at.desc(), NewsArticle.id.desc(),
+    postgresql_where=text("is_deleted = false"),
+)
+
+
+def media_status_update(audio_ready: bool = False, thumbnail_ready: bool = False):
+    """
+    media_status에 대입할 CASE 식
+    - 이번 UPDATE에서 채운 미디어는 True로 넘기고, 나머지는 UPDATE 시점의 행 값으로 판단
+    - 오디오/썸네일 태스크가 동시에 끝나도 마지막 UPDATE가 최신 행을 보고 ready를 결정
+    """
+    audio = true() if audio_ready else and_(
+        NewsArticle.male_audio_url.isnot(None), NewsArticle.male_audio_url != '',
+        NewsArticle.female_audio_url.isnot(None), NewsArticle.female_audio_url != '',
+    )
+    thumbnail = true() if thumbnail_ready else and_(
+        NewsArticle.thumbnail_image_url.isnot(None), NewsArticle.thumbnail_image_url != '',
+    )
+    return case(
+        (and_(audio, thumbnail), MEDIA_READY),
+        (audio, MEDIA_AUDIO_READY),
+        (thumbnail, MEDIA_THUMBNAIL_READY),
+        else_=MEDIA_PENDING,
+    )
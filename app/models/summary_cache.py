@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Text, DateTime
+from app.core.database import Base
+from datetime import datetime
+
+class SummaryCache(Base):
+    __tablename__ = "summary_cache"
+
+    # 정규화한 본문의 sha256과 요약 프롬프트 버전
+    content_hash = Column(String(64), primary_key=True)
+    prompt_version = Column(String(20), primary_key=True)
+    summary = Column(Text, nullable=False)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
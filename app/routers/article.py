@@ -1,24 +1,77 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 from uuid import UUID
-from app.core.database import get_db
-from app.schemas.article import ArticleDetailResponse, ArticleRecentResponse, ArticleDeleteResponse
+from app.core.db_replicas import mark_user_write
+from app.core.database import create_read_session, get_async_read_db, get_db, get_read_db
+from app.schemas.article import ArticleDetailResponse, ArticleRecentResponse, ArticleDeleteResponse, ArticlePageResponse
 from app.schemas.article_recommend import ArticleRecommendResponse
-from app.core.query import get_article_by_id, get_article_recent, get_articles_by_category_and_user_press, delete_article, mark_article_as_viewed
+from app.core.query import ARTICLE_ALL_COLUMNS, ARTICLE_LIST_COLUMNS, get_article_by_id, get_article_recent, get_articles_by_category_and_user_press, delete_article, mark_article_as_viewed, get_articles_page, iter_articles
 import redis
 import json
 from app.services.recommend.article_recommender import index_user_preferred_articles, recommend_articles_for_user_async
 from app.services.recommend.opensearch import create_news_index
+from app.utils.cursor import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/articles",tags=["Articles"])
 
 redis_client = redis.Redis(host='redis', port=6379, db=0, decode_responses=True)
 
+def _article_row_to_dict(row) -> Dict:
+    article = dict(row._mapping)
+    for key in ("id", "press_id", "category_id"):
+        article[key] = str(article[key])
+    return article
+
+def _stream_articles(after: Optional[Tuple[datetime, UUID]], columns=ARTICLE_LIST_COLUMNS) -> Iterator[str]:
+    # 응답을 보내는 동안 쓸 세션 (Depends 세션은 스트리밍 시작 전에 닫힘)
+    db = create_read_session()
+    try:
+        for row in iter_articles(db, after, columns=columns):
+            # 일반 JSON 응답과 같은 직렬화 (datetime은 ISO 8601, UUID는 문자열)
+            yield json.dumps(jsonable_encoder(dict(row._mapping)), ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+def stream_articles_json_array() -> Iterator[str]:
+    """
+    이전 GET /articles 응답 형태(NewsArticle 전체 컬럼 객체의 JSON 배열)를 전체를 메모리에 올리지 않고 스트리밍
+    - 이전 응답과 다른 점: 삭제된 기사 제외, 최신순 정렬
+    """
+    yield "["
+    for i, line in enumerate(_stream_articles(None, ARTICLE_ALL_COLUMNS)):
+        yield ("," if i else "") + line.rstrip("\n")
+    yield "]"
+
+
+#전체 기사 목록 (최신순, cursor로 다음 페이지 조회 / stream=true면 cursor 이후 전체를 NDJSON으로 스트리밍)
+@router.get("", response_model=ArticlePageResponse)
+def list_articles(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    db: Session = Depends(get_read_db),
+):
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+    if stream:
+        return StreamingResponse(_stream_articles(after), media_type="application/x-ndjson")
+    # 한 행 더 읽어서 다음 페이지 존재 여부 판단
+    rows = get_articles_page(db, limit + 1, after)
+    next_cursor = encode_cursor(rows[limit - 1].published_at, rows[limit - 1].id) if len(rows) > limit else None
+    return ArticlePageResponse(items=[_article_row_to_dict(row) for row in rows[:limit]], next_cursor=next_cursor)
+
+
 #실시간 뉴스 가져오기 (20개)ㄴ
 @router.get("/recent", response_model=List[ArticleRecentResponse])
-def read_recent_articles(limit: int = 20, db: Session = Depends(get_db)):
+def read_recent_articles(limit: int = 20, db: Session = Depends(get_read_db)):
     cache_key = f"recent_articles:{limit}"
     cached = redis_client.get(cache_key)
     if cached:
@@ -43,7 +96,7 @@ def read_recent_articles(limit: int = 20, db: Session = Depends(get_db)):
 
 #사용자 관심 카테고리 뉴스 가져오기
 @router.get("/preferred-category", response_model=List[ArticleRecentResponse])
-def get_articles_by_category_and_user_press_router(request: Request, category_name: str, db: Session = Depends(get_db)):
+def get_articles_by_category_and_user_press_router(request: Request, category_name: str, db: Session = Depends(get_read_db)):
     user_id = getattr(request.state, 'user_id', None)
     if user_id is None:
         raise HTTPException(status_code=401, detail="인증이 필요합니다.")
@@ -70,7 +123,7 @@ def get_articles_by_category_and_user_press_router(request: Request, category_na
 
 #키워드 관련 기사 조회
 @router.get("/recommend", response_model=List[ArticleRecommendResponse])
-async def recommend_articles(request: Request, db: Session = Depends(get_db)):
+async def recommend_articles(request: Request, db: AsyncSession = Depends(get_async_read_db)):
     user_id=request.state.user_id
     create_news_index()  # 인덱스가 없으면 생성, 있으면 무시
     await index_user_preferred_articles(db, user_id)  # 필터링 된 DB의 기사들을 OpenSearch에 인덱싱 (await 추가)
@@ -87,7 +140,7 @@ async def recommend_articles(request: Request, db: Session = Depends(get_db)):
 
 #뉴스 상세 조회 하기
 @router.get("/{article_id}", response_model=ArticleDetailResponse)
-def get_article_detail(request: Request,article_id: UUID, db: Session = Depends(get_db)):
+def get_article_detail(request: Request,article_id: UUID, db: Session = Depends(get_read_db)):
     # user_id를 안전하게 가져오기
     user_id = getattr(request.state, 'user_id', None)
 
@@ -96,7 +149,10 @@ def get_article_detail(request: Request,article_id: UUID, db: Session = Depends(
         raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
     # 읽음 기록 저장 (user_id가 None이면 건너뛰기)
     if user_id:
+        # 읽음 기록 조회/저장은 primary에서 (복제 지연으로 기존 기록을 못 보고 중복 생성하지 않도록)
+        db.info["use_primary"] = True
         read_status = mark_article_as_viewed(db, user_id, article_id)
+        mark_user_write(user_id)
         if not read_status:
             raise HTTPException(status_code=400, detail="읽음 기록 저장 실패")
     # 수동으로 필요한 필드들을 딕셔너리에 추가
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, Request
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.db_replicas import mark_user_write
 from app.services.users.user_service import create_user, get_user_by_email, login_process
 from app.models.user import User
 from app.services.auth.jwt_utils import create_access_token, create_refresh_token, verify_token
@@ -37,6 +38,8 @@ def register_user(user_data: UserBase, db: Session = Depends(get_db)):
         
         user.refresh_token = refresh_token
         db.commit()
+        # 가입 직후 요청이 복제본에서 사용자를 못 찾지 않도록 primary로 고정
+        mark_user_write(user.id)
         
         return RegisterResponse(
             message="회원가입이 완료되었습니다.", 
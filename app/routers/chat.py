@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.services.chatgpt.news_chatbot import NewsChatBot
 from app.schemas.chat_bot import ChatMessage, ChatResponse
 
@@ -12,15 +12,15 @@ chat_bot = NewsChatBot()
 @router.post("/start", response_model=ChatResponse)
 async def start_new_conversation(
     chat_message: ChatMessage,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         if chat_message.article_id:
-            article_context = chat_bot.get_article_context(db, chat_message.article_id)
+            article_context = await chat_bot.get_article_context_async(db, chat_message.article_id)
             if not article_context:
                 raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
             
-            result = chat_bot.chat_with_article(
+            result = await chat_bot.chat_with_article(
                 chat_message.message, 
                 article_context, 
                 None  
@@ -31,7 +31,7 @@ async def start_new_conversation(
                 article_context=result["article_context"]
             )
         else:
-            result = chat_bot.chat_general(
+            result = await chat_bot.chat_general(
                 chat_message.message, 
                 None  
             )
@@ -46,7 +46,7 @@ async def start_new_conversation(
 @router.post("/message", response_model=ChatResponse)
 async def send_message(
     chat_message: ChatMessage,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         if not chat_message.conversation_id:
@@ -63,11 +63,11 @@ async def send_message(
             )
         
         if chat_message.article_id:
-            article_context = chat_bot.get_article_context(db, chat_message.article_id)
+            article_context = await chat_bot.get_article_context_async(db, chat_message.article_id)
             if not article_context:
                 raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다")
             
-            result = chat_bot.chat_with_article(
+            result = await chat_bot.chat_with_article(
                 chat_message.message, 
                 article_context, 
                 chat_message.conversation_id
@@ -78,7 +78,7 @@ async def send_message(
                 article_context=result["article_context"]
             )
         else:
-            result = chat_bot.chat_general(
+            result = await chat_bot.chat_general(
                 chat_message.message, 
                 chat_message.conversation_id
             )
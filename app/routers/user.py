@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, Request, HTTPException
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.schemas.user_setting import UserSetting, UserHistory
 from app.models.user_category import UserCategory
-from app.models.category import Category
-from app.models.press import Press
 from app.models.user_preferred_press import UserPreferredPress
 from app.models.user_keyword import UserKeyword
 from app.models.user import User
 from app.services.users import get_user_history, UserPreferencesCache
+from app.core.dimension_cache import category_cache, press_cache
+from app.core.feed_cache import bump_feed_version
+from app.core.db_replicas import mark_user_write
 
 router = APIRouter(prefix="/user", tags=["user"])
 
@@ -24,47 +25,47 @@ def clear_user_relations(db: Session, model, user_id: str):
     """사용자의 특정 관계 데이터를 삭제합니다."""
     db.query(model).filter(model.user_id == user_id).delete()
     db.commit()
+    mark_user_write(user_id)
 
-def get_selected_names(db: Session, user, relation_attr: str, model, name_field: str, id_field: str):
-    """관계 테이블에서 선택된 이름들을 가져옵니다."""
+def get_selected_names(db: Session, user, relation_attr: str, cache, id_field: str):
+    """관계 테이블에서 선택된 이름들을 가져옵니다. (이름은 차원 캐시에서 조회)"""
     ids = [getattr(rel, id_field) for rel in getattr(user, relation_attr)]
     if not ids:
         return []
-    objs = db.query(model).filter(getattr(model, 'id').in_(ids)).all()
-    return [getattr(obj, name_field) for obj in objs]
+    return cache.get_names(db, ids)
 
 # ==================== GET 엔드포인트들 ====================
 
 @router.get("/press", response_model=UserSetting)
-def get_user_press(request: Request, db: Session = Depends(get_db)):
+def get_user_press(request: Request, db: Session = Depends(get_read_db)):
     """사용자의 관심 언론사를 조회합니다."""
     user = get_current_user(request, db)
     press_names = UserPreferencesCache.get_user_press(user.id, db)
     return UserSetting(press=press_names)
 
 @router.get("/category", response_model=UserSetting)
-def get_user_category(request: Request, db: Session = Depends(get_db)):
+def get_user_category(request: Request, db: Session = Depends(get_read_db)):
     """사용자의 관심 카테고리를 조회합니다."""
     user = get_current_user(request, db)
     category_names = UserPreferencesCache.get_user_category(user.id, db)
     return UserSetting(category=category_names)
 
 @router.get("/keyword", response_model=UserSetting)
-def get_user_keyword(request: Request, db: Session = Depends(get_db)):
+def get_user_keyword(request: Request, db: Session = Depends(get_read_db)):
     """사용자의 관심 키워드를 조회합니다."""
     user = get_current_user(request, db)
     keyword_list = UserPreferencesCache.get_user_keyword(user.id, db)
     return UserSetting(keyword=keyword_list)
 
 @router.get("/voice-type", response_model=UserSetting)
-def get_user_voice_type(request: Request, db: Session = Depends(get_db)):
+def get_user_voice_type(request: Request, db: Session = Depends(get_read_db)):
     """사용자의 음성 타입을 조회합니다."""
     user = get_current_user(request, db)
     voice_type = UserPreferencesCache.get_user_voice_type(user.id, db)
     return UserSetting(voice_type=voice_type)
 
 @router.get("/history", response_model=UserHistory)
-def user_history(request: Request, db: Session = Depends(get_db)):
+def user_history(request: Request, db: Session = Depends(get_read_db)):
     """사용자의 조회 기록을 가져옵니다."""
     user = get_current_user(request, db)
     histories = get_user_history(user.id, db)
@@ -102,18 +103,22 @@ def user_press_setting(request: Request, user_setting: UserSetting, db: Session
     
     # 새로운 관계 추가
     for press_name in user_setting.press:
-        press = db.query(Press).filter(Press.press_name == press_name).first()
-        if press:
-            db.add(UserPreferredPress(user_id=user.id, press_id=press.id))
+        press_id = press_cache.get_id(db, press_name)
+        if press_id:
+            db.add(UserPreferredPress(user_id=user.id, press_id=press_id))
     
     db.commit()
+    # 캐시를 지우기 전에 고정해야 다음 GET이 복제본의 이전 값으로 캐시를 채우지 않음
+    mark_user_write(user.id)
     db.refresh(user)
     
     # 캐시 삭제
     UserPreferencesCache.clear_press_cache(user.id)
+    # 버킷 단위 피드 캐시도 새 설정으로 다시 조회하도록 버전 증가
+    bump_feed_version(user.id)
     
     # 설정된 언론사 이름들 반환
-    selected_press_names = get_selected_names(db, user, 'preferred_presses', Press, 'press_name', 'press_id')
+    selected_press_names = get_selected_names(db, user, 'preferred_presses', press_cache, 'press_id')
     return UserSetting(press=selected_press_names)
 
 @router.put("/category", response_model=UserSetting)
@@ -129,18 +134,22 @@ def user_category_setting(request: Request, user_setting: UserSetting, db: Sessi
     
     # 새로운 관계 추가
     for category_name in user_setting.category:
-        category = db.query(Category).filter(Category.category_name == category_name).first()
-        if category:
-            db.add(UserCategory(user_id=user.id, category_id=category.id))
+        category_id = category_cache.get_id(db, category_name)
+        if category_id:
+            db.add(UserCategory(user_id=user.id, category_id=category_id))
     
     db.commit()
+    # 캐시를 지우기 전에 고정해야 다음 GET이 복제본의 이전 값으로 캐시를 채우지 않음
+    mark_user_write(user.id)
     db.refresh(user)
     
     # 캐시 삭제
     UserPreferencesCache.clear_category_cache(user.id)
+    # 버킷 단위 피드 캐시도 새 설정으로 다시 조회하도록 버전 증가
+    bump_feed_version(user.id)
     
     # 설정된 카테고리 이름들 반환
-    selected_category_names = get_selected_names(db, user, 'user_categories', Category, 'category_name', 'category_id')
+    selected_category_names = get_selected_names(db, user, 'user_categories', category_cache, 'category_id')
     return UserSetting(category=selected_category_names)
 
 @router.put("/keyword", response_model=UserSetting)
@@ -159,6 +168,8 @@ def user_keyword_setting(request: Request, user_setting: UserSetting, db: Sessio
         db.add(UserKeyword(user_id=user.id, keyword=keyword))
     
     db.commit()
+    # 캐시를 지우기 전에 고정해야 다음 GET이 복제본의 이전 값으로 캐시를 채우지 않음
+    mark_user_write(user.id)
     db.refresh(user)
     
     # 캐시 삭제
@@ -183,6 +194,8 @@ def user_voice_type_setting(request: Request, voice_setting: UserSetting, db: Se
     # voice_type 업데이트
     user.voice_type = voice_setting.voice_type
     db.commit()
+    # 캐시를 지우기 전에 고정해야 다음 GET이 복제본의 이전 값으로 캐시를 채우지 않음
+    mark_user_write(user.id)
     db.refresh(user)
     
     # 캐시 삭제
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 class ArticleDetailResponse(BaseModel):
     id: str
@@ -34,3 +34,25 @@ class ArticleRecentResponse(BaseModel):
 class ArticleDeleteResponse(BaseModel):
     message: str
     article_id: str
+
+class ArticleListItem(BaseModel):
+    id: str
+    title: str
+    url: str
+    published_at: datetime
+    summary_text: Optional[str] = None
+    category_name: Optional[str] = None
+    author: Optional[str] = None
+    original_image_url: Optional[str] = None
+    thumbnail_image_url: Optional[str] = None
+    male_audio_url: Optional[str] = None
+    female_audio_url: Optional[str] = None
+    media_status: Optional[str] = None
+    press_id: str
+    category_id: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class ArticlePageResponse(BaseModel):
+    items: List[ArticleListItem]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
@@ -0,0 +1,82 @@
+"""로컬 추출 요약 (TextRank, API 호출 없음)
+
+LLM 요약이 실패하거나 SUMMARY_MODE=fast일 때 사용합니다.
+문장별 글자 2-gram 벡터의 코사인 유사도 그래프에서 PageRank 점수가 높은 문장을 원래 순서대로 고릅니다.
+"""
+import os
+import numpy as np
+from typing import Dict, List, Tuple
+from app.services.chatgpt.token_budget import split_sentences
+
+EXTRACTIVE_MAX_CHARS = int(os.getenv("EXTRACTIVE_MAX_CHARS", 500))
+DAMPING = 0.85
+# 기사 특성상 앞 문장에 가중치를 주는 정도 (0이면 순수 TextRank)
+LEAD_BIAS = 0.3
+MAX_ITERATIONS = 50
+# 이미 고른 문장과 유사도가 이보다 높으면 중복으로 보고 제외
+REDUNDANCY_THRESHOLD = 0.8
+TOLERANCE = 1e-6
+
+
+def _bigram_matrix(sentences: List[str]) -> np.ndarray:
+    vocab: Dict[str, int] = {}
+    rows = []
+    for sentence in sentences:
+        compact = sentence.replace(' ', '')
+        counts: Dict[int, int] = {}
+        for i in range(len(compact) - 1):
+            idx = vocab.setdefault(compact[i:i + 2], len(vocab))
+            counts[idx] = counts.get(idx, 0) + 1
+        rows.append(counts)
+    matrix = np.zeros((len(sentences), max(1, len(vocab))), dtype=np.float32)
+    for row, counts in enumerate(rows):
+        if counts:
+            matrix[row, list(counts.keys())] = list(counts.values())
+    return matrix
+
+
+def rank_sentences(sentences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문장별 TextRank 점수와 문장 간 코사인 유사도 행렬"""
+    n = len(sentences)
+    matrix = _bigram_matrix(sentences)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized = matrix / np.where(norms == 0, 1, norms)
+    similarity = normalized @ normalized.T
+    np.fill_diagonal(similarity, 0)
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 겹치지 않는 문장은 균등하게 연결
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums == 0, 1, row_sums), 1.0 / n)
+    position_prior = 1.0 / np.arange(1, n + 1)
+    prior = (1 - LEAD_BIAS) / n + LEAD_BIAS * position_prior / position_prior.sum()
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) * prior + DAMPING * transition.T @ scores
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            scores = updated
+            break
+        scores = updated
+    return scores, similarity
+
+
+def summarize_extractive(content: str, max_chars: int = EXTRACTIVE_MAX_CHARS) -> str:
+    """점수가 높은 문장을 max_chars 안에서 골라 원래 순서로 이어 붙임"""
+    sentences = split_sentences(content)
+    if not sentences:
+        return (content or '')[:max_chars]
+    if len(' '.join(sentences)) <= max_chars:
+        return ' '.join(sentences)
+    scores, similarity = rank_sentences(sentences)
+    chosen: List[int] = []
+    used = 0
+    for idx in np.argsort(-scores, kind='stable'):
+        length = len(sentences[idx]) + (1 if chosen else 0)
+        if used + length > max_chars:
+            continue
+        if chosen and similarity[idx, chosen].max() > REDUNDANCY_THRESHOLD:
+            continue
+        chosen.append(int(idx))
+        used += length
+    if not chosen:
+        # 모든 문장이 max_chars보다 길면 최고점 문장을 잘라서 사용
+        return sentences[int(np.argmax(scores))][:max_chars]
+    return ' '.join(sentences[i] for i in sorted(chosen))
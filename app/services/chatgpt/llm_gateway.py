@@ -0,0 +1,238 @@
+"""프로세스 공용 OpenAI 호출 게이트웨이
+
+- 이벤트 루프별 AsyncOpenAI 클라이언트 재사용 (커넥션 풀 공유)
+- 모델별 RPM/TPM 토큰 버킷과 동시 요청 수 제한
+- 429/5xx/연결 오류 시 지터를 준 지수 백오프 재시도
+- 모델별 지연시간/토큰 사용량 Prometheus 메트릭
+"""
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+import openai
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from prometheus_client import Counter, Histogram
+from app.services.chatgpt.token_budget import count_tokens
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", 500))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", 200000))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", 16))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", 4))
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", 60))
+# 예산(RPM/TPM) 대기가 이보다 길어지면 호출하지 않고 LLMBudgetExceeded 발생
+OPENAI_MAX_BUDGET_WAIT = float(os.getenv("OPENAI_MAX_BUDGET_WAIT", 30))
+# 재시도 대기 상한 (서버가 보낸 Retry-After가 더 길어도 이 시간까지만 대기)
+LLM_MAX_RETRY_DELAY = float(os.getenv("LLM_MAX_RETRY_DELAY", 20))
+
+LLM_REQUEST_LATENCY = Histogram(
+    "llm_request_latency_seconds",
+    "OpenAI 요청 지연시간 (재시도 포함)",
+    ["model", "operation", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, 64),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "OpenAI 토큰 사용량",
+    ["model", "kind"],
+)
+LLM_RETRIES = Counter(
+    "llm_retries_total",
+    "OpenAI 요청 재시도 횟수",
+    ["model", "reason"],
+)
+LLM_BUDGET_WAIT = Histogram(
+    "llm_budget_wait_seconds",
+    "RPM/TPM 예산 확보 대기시간",
+    ["model"],
+    buckets=(0, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30),
+)
+
+
+class LLMBudgetExceeded(Exception):
+    """RPM/TPM 예산을 OPENAI_MAX_BUDGET_WAIT 안에 확보하지 못함"""
+
+
+class LLMNotConfigured(Exception):
+    """OPENAI_API_KEY가 설정되지 않음 (live provider에서만 필요)"""
+
+
+class _TokenBucket:
+    """분당 한도를 초당 보충량으로 나눠 쓰는 버킷 (잠금은 _ModelBudget에서 처리)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # 한도보다 큰 요청은 버킷이 가득 찼을 때 통과시킴
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _ModelBudget:
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = _TokenBucket(rpm)
+        self.tokens = _TokenBucket(tpm)
+        self.lock = threading.Lock()
+
+    async def acquire(self, model: str, estimated_tokens: int) -> None:
+        started = time.monotonic()
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(estimated_tokens, now))
+                if wait <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(estimated_tokens)
+                    LLM_BUDGET_WAIT.labels(model=model).observe(now - started)
+                    return
+            if now - started + wait > OPENAI_MAX_BUDGET_WAIT:
+                raise LLMBudgetExceeded(f"{model} RPM/TPM 예산 대기 초과 ({wait:.1f}초 필요)")
+            await asyncio.sleep(wait)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """추정치와 실제 사용량 차이를 반영"""
+        with self.lock:
+            diff = estimated_tokens - actual_tokens
+            if diff > 0:
+                self.tokens.give_back(diff)
+            else:
+                self.tokens.take(-diff)
+
+
+_budgets: Dict[str, _ModelBudget] = {}
+_budgets_lock = threading.Lock()
+# 이벤트 루프마다 클라이언트/세마포어를 따로 둠 (httpx 커넥션은 루프에 묶여 있음)
+_loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[AsyncOpenAI, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+_loop_state_lock = threading.Lock()
+
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError)
+
+
+def _get_budget(model: str) -> _ModelBudget:
+    with _budgets_lock:
+        if model not in _budgets:
+            _budgets[model] = _ModelBudget(OPENAI_RPM_LIMIT, OPENAI_TPM_LIMIT)
+        return _budgets[model]
+
+
+def _get_loop_state() -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        state = _loop_state.get(loop)
+        if state is None:
+            client = AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                timeout=OPENAI_TIMEOUT,
+                max_retries=0,  # 재시도는 게이트웨이에서 처리
+            )
+            state = (client, asyncio.Semaphore(OPENAI_MAX_CONCURRENCY))
+            _loop_state[loop] = state
+        return state
+
+
+def estimate_tokens(texts: List[str], max_output_tokens: int = 0) -> int:
+    """예산 확보용 토큰 추정 (입력 토큰 + 최대 출력 토큰)"""
+    return sum(count_tokens(t) for t in texts) + max_output_tokens
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return max(0.0, min(float(retry_after), LLM_MAX_RETRY_DELAY))
+        except ValueError:
+            pass
+    # full jitter 지수 백오프
+    return random.uniform(0, min(LLM_MAX_RETRY_DELAY, 2 ** attempt))
+
+
+def _retry_reason(error: Exception) -> str:
+    if isinstance(error, openai.RateLimitError):
+        return "429"
+    if isinstance(error, openai.InternalServerError):
+        return "5xx"
+    return "connection"
+
+
+async def _call(model: str, operation: str, estimated_tokens: int, request):
+    if not os.getenv("OPENAI_API_KEY"):
+        raise LLMNotConfigured("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+    budget = _get_budget(model)
+    client, semaphore = _get_loop_state()
+    started = time.monotonic()
+    outcome = "error"
+    try:
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            await budget.acquire(model, estimated_tokens)
+            try:
+                async with semaphore:
+                    response = await request(client)
+            except RETRYABLE_ERRORS as e:
+                # 실패한 요청은 토큰을 쓰지 않았으므로 추정치를 돌려줌 (요청 수는 그대로 차감)
+                budget.reconcile(estimated_tokens, 0)
+                if attempt >= OPENAI_MAX_RETRIES:
+                    raise
+                delay = _retry_delay(attempt, e)
+                LLM_RETRIES.labels(model=model, reason=_retry_reason(e)).inc()
+                logger.warning(f"OpenAI {operation} 재시도 {attempt + 1}/{OPENAI_MAX_RETRIES} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+                continue
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+                completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+                LLM_TOKENS.labels(model=model, kind="prompt").inc(prompt_tokens)
+                LLM_TOKENS.labels(model=model, kind="completion").inc(completion_tokens)
+                budget.reconcile(estimated_tokens, prompt_tokens + completion_tokens)
+            outcome = "success"
+            return response
+    except LLMBudgetExceeded:
+        outcome = "budget_exceeded"
+        raise
+    finally:
+        LLM_REQUEST_LATENCY.labels(model=model, operation=operation, outcome=outcome).observe(time.monotonic() - started)
+
+
+async def chat_completion(model: str, messages: List[Dict[str, str]], max_tokens: Optional[int] = None, **kwargs):
+    """chat.completions.create 호출 (예산/재시도/메트릭 적용)"""
+    estimated = estimate_tokens([m.get("content", "") for m in messages], max_tokens or 500)
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+
+    async def request(client: AsyncOpenAI):
+        return await client.chat.completions.create(model=model, messages=messages, **kwargs)
+
+    return await _call(model, "chat", estimated, request)
+
+
+async def create_embeddings(model: str, inputs: List[str]):
+    """embeddings.create 호출 (예산/재시도/메트릭 적용)"""
+    estimated = estimate_tokens(inputs)
+
+    async def request(client: AsyncOpenAI):
+        return await client.embeddings.create(model=model, input=inputs)
+
+    return await _call(model, "embedding", estimated, request)
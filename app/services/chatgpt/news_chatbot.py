@@ -1,6 +1,6 @@
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage, AIMessage
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from app.models.news_article import NewsArticle
 from typing import List, Optional, Dict
 import os
@@ -9,16 +9,14 @@ import redis
 import uuid
 from datetime import datetime
 from dotenv import load_dotenv
+from app.services.providers import get_llm_provider
 
 load_dotenv()
 
 class NewsChatBot:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-3.5-turbo",
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.model = "gpt-3.5-turbo"
+        self.temperature = 0.7
         
         # Redis 연결
         self.redis_client = redis.Redis(
@@ -60,6 +58,19 @@ class NewsChatBot:
             NewsArticle.is_deleted == False
         ).first()
         
+        return self._build_article_context(article)
+
+    async def get_article_context_async(self, db: AsyncSession, article_id: str) -> dict:
+        """기사 정보를 가져와서 컨텍스트로 만듭니다. (async 엔드포인트용, 언론사는 같은 쿼리에서 조인)"""
+        result = await db.execute(
+            select(NewsArticle).options(joinedload(NewsArticle.press)).where(
+                NewsArticle.id == article_id,
+                NewsArticle.is_deleted == False
+            )
+        )
+        return self._build_article_context(result.scalars().first())
+
+    def _build_article_context(self, article: Optional[NewsArticle]) -> Optional[dict]:
         if not article:
             return None
             
@@ -73,6 +84,11 @@ class NewsChatBot:
             "url": article.url
         }
     
+    async def _complete(self, messages: List[Dict[str, str]]) -> str:
+        """LLM provider로 응답 생성 (live: 공용 게이트웨이)"""
+        response = await get_llm_provider().chat_completion(model=self.model, messages=messages, temperature=self.temperature)
+        return response.choices[0].message.content
+
     def create_conversation_id(self) -> str:
         """새로운 대화 ID를 생성합니다."""
         return str(uuid.uuid4())
@@ -101,7 +117,7 @@ class NewsChatBot:
         except Exception as e:
             print(f"대화 기록 저장 오류: {e}")
     
-    def chat_with_article(self, message: str, article_context: dict, conversation_id: str = None) -> Dict:
+    async def chat_with_article(self, message: str, article_context: dict, conversation_id: str = None) -> Dict:
         """기사 컨텍스트와 함께 챗봇과 대화합니다."""
         # 새로운 대화 ID 생성 (제공되지 않은 경우)
         if not conversation_id:
@@ -111,19 +127,16 @@ class NewsChatBot:
         
         system_message = self.system_prompt.format(**article_context)
         
-        messages = [SystemMessage(content=system_message)]
+        messages = [{"role": "system", "content": system_message}]
         
         for msg in conversation_history:
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                messages.append(AIMessage(content=msg["content"]))
+            if msg["role"] in ("user", "assistant"):
+                messages.append({"role": msg["role"], "content": msg["content"]})
         
-        messages.append(HumanMessage(content=message))
+        messages.append({"role": "user", "content": message})
         
         try:
-            response = self.llm.invoke(messages)
-            ai_response = response.content
+            ai_response = await self._complete(messages)
             
             conversation_history.append({"role": "user", "content": message, "timestamp": datetime.now().isoformat()})
             conversation_history.append({"role": "assistant", "content": ai_response, "timestamp": datetime.now().isoformat()})
@@ -165,7 +178,7 @@ class NewsChatBot:
                 "article_context": article_context,
             }
     
-    def chat_general(self, message: str, conversation_id: str = None) -> Dict:
+    async def chat_general(self, message: str, conversation_id: str = None) -> Dict:
         """일반적인 뉴스 관련 질문에 답변합니다."""
         # 새로운 대화 ID 생성 (제공되지 않은 경우)
         if not conversation_id:
@@ -176,19 +189,16 @@ class NewsChatBot:
         general_system_prompt = """당신은 뉴스에 대한 일반적인 질문에 답변하는 AI 어시스턴트입니다.
         한국어로 답변하고, 이전 대화 내용을 참고하여 연속적인 대화를 유지하세요."""
         
-        messages = [SystemMessage(content=general_system_prompt)]
+        messages = [{"role": "system", "content": general_system_prompt}]
         
         for msg in conversation_history:
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                messages.append(AIMessage(content=msg["content"]))
+            if msg["role"] in ("user", "assistant"):
+                messages.append({"role": msg["role"], "content": msg["content"]})
 
-        messages.append(HumanMessage(content=message))
+        messages.append({"role": "user", "content": message})
         
         try:
-            response = self.llm.invoke(messages)
-            ai_response = response.content
+            ai_response = await self._complete(messages)
             
             conversation_history.append({"role": "user", "content": message, "timestamp": datetime.now().isoformat()})
             conversation_history.append({"role": "assistant", "content": ai_response, "timestamp": datetime.now().isoformat()})
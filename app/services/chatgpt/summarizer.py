@@ -1,21 +1,26 @@
-import openai, os, logging
+import os, time, asyncio, logging
 from typing import Optional
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+from app.services.providers import get_llm_provider
+from app.services.chatgpt.token_budget import (
+    SUMMARY_CHUNK_TOKENS, SUMMARY_LEAD_TOKENS, SUMMARY_MAP_REDUCE_THRESHOLD, SUMMARY_MAX_CHUNKS, SUMMARY_MODEL,
+    chunk_by_tokens, count_tokens, trim_to_tokens,
+)
 load_dotenv()
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def summarize_article_with_gpt_async(content: str) -> Optional[str]:
-    try:
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            logger.error("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
-            return None
-       
-        client = AsyncOpenAI(api_key=api_key)
-        prompt = f"""
+# 프롬프트/모델/입력 예산을 바꾸면 버전을 올려 이전 요약 캐시를 무효화
+PROMPT_VERSION = "v2"
+
+SYSTEM_PROMPT = "당신은 뉴스 기사를 요약하는 전문가입니다. 핵심 내용을 간결하고 명확하게 요약해주세요."
+# map 단계(청크별 요약) 출력 토큰 상한
+SUMMARY_CHUNK_MAX_TOKENS = int(os.getenv("SUMMARY_CHUNK_MAX_TOKENS", 250))
+
+
+def build_summary_prompt(content: str) -> str:
+    return f"""
         해당 기사 본문을 읽고 요구사항에 맞게 요약해
 본문:
 {content}
@@ -26,18 +31,59 @@ async def summarize_article_with_gpt_async(content: str) -> Optional[str]:
 4. 불필요한 수식어나 반복 제거
 5. 반말 형식이 아닌 ~했습니다 형식으로 말하기
 """
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "당신은 뉴스 기사를 요약하는 전문가입니다. 핵심 내용을 간결하고 명확하게 요약해주세요."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=500,
-            temperature=0.3
-        )
-        summary = response.choices[0].message.content.strip()
-        logger.info("기사 요약 완료 (async)")
+
+
+def build_chunk_prompt(chunk: str, index: int, total: int) -> str:
+    return f"""
+        다음은 긴 기사 본문의 {index}/{total} 부분입니다. 이 부분의 사실과 수치만 3~5문장으로 정리해
+본문:
+{chunk}
+"""
+
+
+async def _complete(prompt: str, max_tokens: int) -> str:
+    response = await get_llm_provider().chat_completion(
+        model=SUMMARY_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=max_tokens,
+        temperature=0.3
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def _map_reduce_summary(content: str) -> Optional[str]:
+    """청크별 요약을 동시에 만든 뒤 합쳐서 최종 요약 (청크 수는 SUMMARY_MAX_CHUNKS로 제한)"""
+    chunks = chunk_by_tokens(content, SUMMARY_CHUNK_TOKENS)[:SUMMARY_MAX_CHUNKS]
+    partials = await asyncio.gather(
+        *(_complete(build_chunk_prompt(chunk, i + 1, len(chunks)), SUMMARY_CHUNK_MAX_TOKENS) for i, chunk in enumerate(chunks)),
+        return_exceptions=True
+    )
+    partials = [p for p in partials if isinstance(p, str) and p]
+    if not partials:
+        return None
+    return await _complete(build_summary_prompt("\n".join(partials)), 500)
+
+
+async def summarize_article_with_gpt_async(content: str) -> Optional[str]:
+    """
+    토큰 예산에 맞춰 기사 요약
+    - SUMMARY_MAP_REDUCE_THRESHOLD 이하: 앞부분 SUMMARY_LEAD_TOKENS만 잘라 한 번에 요약
+    - 그보다 길면: 청크별 요약 후 다시 요약 (map-reduce)
+    """
+    try:
+        started = time.monotonic()
+        tokens = count_tokens(content)
+        if tokens > SUMMARY_MAP_REDUCE_THRESHOLD:
+            mode = "map-reduce"
+            summary = await _map_reduce_summary(content)
+        else:
+            mode = "lead"
+            summary = await _complete(build_summary_prompt(trim_to_tokens(content, SUMMARY_LEAD_TOKENS)), 500)
+        logger.info(f"기사 요약 완료 (async, {mode}, 입력 {tokens}토큰, {time.monotonic() - started:.1f}초)")
         return summary
     except Exception as e:
         logger.error(f"기사 요약 중 오류 발생 (async): {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,86 @@
+"""본문 해시 기반 요약 캐시 (Redis 핫 캐시 + Postgres 영구 저장)"""
+import os
+import re
+import hashlib
+import logging
+import unicodedata
+from typing import Optional
+from dotenv import load_dotenv
+from sqlalchemy.dialects.postgresql import insert
+from app.core.database import create_crawler_session
+from app.core.redis_client import get_redis_client
+from app.models.summary_cache import SummaryCache
+from app.services.chatgpt.summarizer import PROMPT_VERSION
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+redis_client = get_redis_client()
+
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", 60 * 60 * 24 * 7))  # Redis 보관 기간 (기본 7일)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_content(content: str) -> str:
+    """유니코드 정규화(NFC) 후 공백을 하나로 합침"""
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', content or '')).strip()
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(normalize_content(content).encode('utf-8')).hexdigest()
+
+
+def _redis_key(digest: str, prompt_version: str) -> str:
+    return f"summary_cache:{prompt_version}:{digest}"
+
+
+def get_cached_summary(content: str, prompt_version: str = PROMPT_VERSION) -> Optional[str]:
+    """Redis → Postgres 순으로 요약 조회 (Postgres에서 찾으면 Redis에 다시 적재)"""
+    digest = content_hash(content)
+    key = _redis_key(digest, prompt_version)
+    try:
+        cached = redis_client.get(key)
+        if cached:
+            return cached
+    except Exception as e:
+        logger.warning(f"요약 캐시 Redis 조회 실패: {e}")
+    db = create_crawler_session()
+    try:
+        row = db.query(SummaryCache.summary).filter(
+            SummaryCache.content_hash == digest,
+            SummaryCache.prompt_version == prompt_version
+        ).first()
+    except Exception as e:
+        logger.warning(f"요약 캐시 DB 조회 실패: {e}")
+        return None
+    finally:
+        db.close()
+    if not row:
+        return None
+    try:
+        redis_client.setex(key, SUMMARY_CACHE_TTL, row[0])
+    except Exception as e:
+        logger.warning(f"요약 캐시 Redis 저장 실패: {e}")
+    return row[0]
+
+
+def store_summary(content: str, summary: str, prompt_version: str = PROMPT_VERSION) -> None:
+    """요약을 Redis와 Postgres에 저장 (같은 본문/버전이 이미 있으면 유지)"""
+    digest = content_hash(content)
+    try:
+        redis_client.setex(_redis_key(digest, prompt_version), SUMMARY_CACHE_TTL, summary)
+    except Exception as e:
+        logger.warning(f"요약 캐시 Redis 저장 실패: {e}")
+    db = create_crawler_session()
+    try:
+        db.execute(
+            insert(SummaryCache)
+            .values(content_hash=digest, prompt_version=prompt_version, summary=summary)
+            .on_conflict_do_nothing(index_elements=['content_hash', 'prompt_version'])
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"요약 캐시 DB 저장 실패: {e}")
+    finally:
+        db.close()
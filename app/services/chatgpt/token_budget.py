@@ -0,0 +1,88 @@
+"""요약 입력 토큰 예산 (tiktoken 기준 토큰 수 계산, 리드 절단, 청크 분할)"""
+import os
+import re
+import logging
+from functools import lru_cache
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "gpt-3.5-turbo")
+# 이 토큰 수까지는 기사 앞부분(리드)만 잘라 한 번에 요약
+SUMMARY_LEAD_TOKENS = int(os.getenv("SUMMARY_LEAD_TOKENS", 1500))
+# 이 토큰 수를 넘는 기사는 청크별 요약 후 합쳐서 다시 요약 (map-reduce)
+SUMMARY_MAP_REDUCE_THRESHOLD = int(os.getenv("SUMMARY_MAP_REDUCE_THRESHOLD", 4000))
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", 1500))
+SUMMARY_MAX_CHUNKS = int(os.getenv("SUMMARY_MAX_CHUNKS", 4))
+
+# 문장 끝(마침표/물음표/느낌표, 한국어 종결어미 뒤 마침표 포함) 기준 분할
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        # 인코딩 파일을 받을 수 없는 환경에서는 글자 수로 대신 계산
+        logger.warning(f"tiktoken 인코딩 로드 실패, 글자 수 기준으로 계산: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = SUMMARY_MODEL) -> int:
+    """토큰 수 (tiktoken 사용 불가 시 글자 수 = 한글 기준 보수적 추정)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _truncate_tokens(text: str, max_tokens: int, model: str) -> str:
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text or '') if s.strip()]
+
+
+def trim_to_tokens(text: str, max_tokens: int, model: str = SUMMARY_MODEL) -> str:
+    """앞 문장부터 max_tokens 안에 들어가는 만큼만 남김 (첫 문장이 넘치면 토큰 단위로 자름)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    kept: List[str] = []
+    used = 0
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence, model) + 1
+        if used + tokens > max_tokens:
+            break
+        kept.append(sentence)
+        used += tokens
+    if not kept:
+        return _truncate_tokens(text, max_tokens, model)
+    return ' '.join(kept)
+
+
+def chunk_by_tokens(text: str, chunk_tokens: int, model: str = SUMMARY_MODEL) -> List[str]:
+    """문장 경계를 지키며 chunk_tokens 이하의 청크로 분할"""
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence, model) + 1
+        if tokens > chunk_tokens:
+            sentence = _truncate_tokens(sentence, chunk_tokens - 1, model)
+            tokens = chunk_tokens
+        if current and used + tokens > chunk_tokens:
+            chunks.append(' '.join(current))
+            current, used = [], 0
+        current.append(sentence)
+        used += tokens
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
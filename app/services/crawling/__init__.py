@@ -0,0 +1,2 @@
+# 언론사별 추출 스펙 등록 (import 시 extractor.PRESS_REGISTRY에 추가됨)
+from . import hankyung_article_handler, sbs_article_handler, mbn_article_handler
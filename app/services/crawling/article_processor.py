@@ -1,62 +1,76 @@
 """기사 처리 및 요약"""
+import os
 import asyncio
 import aiohttp
 from typing import Optional, Dict
-from app.services.crawling.hankyung_article_handler import extract_hankyung_article_async
-from app.services.crawling.sbs_article_handler import extract_sbs_article_async
-from app.services.crawling.mbn_article_handler import extract_mbn_article_async
+from app.services.crawling.extractor import extract_article_async, get_press_spec
 from app.services.chatgpt.summarizer import summarize_article_with_gpt_async
-from app.core.database import get_db
-from app.models.news_article import NewsArticle
+from app.services.chatgpt.summary_cache import get_cached_summary, store_summary
+from app.services.chatgpt.extractive_summarizer import summarize_extractive
+
+# llm(기본): GPT 요약, 실패 시 로컬 추출 요약 / fast: 로컬 추출 요약만 사용
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "llm").lower()
+
+def build_article_details(details: Optional[Dict], article_url: str, category: str, press: str) -> Optional[Dict]:
+    """추출 결과를 검증하고 카테고리/언론사 정보를 채움 (제목/본문이 없으면 None)"""
+    if not details or not isinstance(details, dict):
+        print(f"   ❌ 기사 추출 실패: {article_url}")
+        return None
+    if not details.get('title') or not details.get('content'):
+        print(f"   ❌ 기사 내용 부족: {article_url}")
+        return None
+    details['category'] = category
+    details['press_name'] = press
+    if details.get('url') != article_url:
+        details['url'] = article_url
+    return details
+
+async def summarize_article_details(details: Dict) -> Dict:
+    """
+    본문을 요약으로 교체
+    - 같은 본문의 캐시된 GPT 요약이 있으면 재사용
+    - GPT 요약 실패 또는 SUMMARY_MODE=fast이면 로컬 추출 요약 사용 (원문이 그대로 남지 않도록)
+    """
+    content = details['content']
+    if SUMMARY_MODE == "fast":
+        details['content'] = summarize_extractive(content)
+        print(f"   ⚡ 추출 요약 완료 (fast)")
+        return details
+    summary = None
+    try:
+        cached = await asyncio.to_thread(get_cached_summary, content)
+        if cached:
+            details['content'] = cached
+            print(f"   ⚡ 요약 캐시 사용")
+            return details
+        summary = await summarize_article_with_gpt_async(content)
+        if summary:
+            await asyncio.to_thread(store_summary, content, summary)
+            print(f"   ✅ GPT 요약 완료")
+    except Exception as summary_error:
+        print(f"   ❌ 요약 중 오류: {summary_error}")
+    if not summary:
+        # 추출 요약은 캐시에 저장하지 않음 (다음 실행에서 GPT 요약 재시도)
+        summary = summarize_extractive(content)
+        print(f"   ⚠️ GPT 요약 실패, 추출 요약으로 대체")
+    details['content'] = summary
+    return details
 
 async def process_article_with_summary(session: aiohttp.ClientSession, article_url: str, category: str, press: str, article_index: int, total_articles: int) -> Optional[Dict]:
+    """단일 기사 추출 + 요약 (크롤링 파이프라인은 각 단계를 나눠서 실행)"""
     try:
-        # URL 중복 검사 (DB에 이미 존재하는 기사면 스킵)
-        db = next(get_db())
-        try:
-            exists = db.query(NewsArticle).filter(
-                NewsArticle.url == article_url,
-                NewsArticle.is_deleted == False
-            ).first()
-            if exists:
-                print(f"   ⚠️ 이미 존재하는 기사: {article_url}")
-                return None
-        finally:
-            db.close()
-        # 언론사별 extractor 선택
-        if press == "한국경제":
-            details = await extract_hankyung_article_async(session, article_url)
-        elif press == "SBS뉴스":
-            details = await extract_sbs_article_async(session, article_url)
-        elif press == "매일경제":
-            details = await extract_mbn_article_async(session, article_url)
-        else:
+        # URL 중복 검사는 크롤링 파이프라인의 일괄 중복 제거 단계에서 수행
+        if get_press_spec(press) is None:
             print(f"   ⚠️ 지원하지 않는 언론사: {press}")
             return None
-        if details and isinstance(details, dict):
-            title = details.get('title')
-            content = details.get('content')
-            if title and content:
-                details['category'] = category
-                details['press_name'] = press
-                if details.get('url') != article_url:
-                    details['url'] = article_url
-                try:
-                    summary = await summarize_article_with_gpt_async(content)
-                    if summary:
-                        details['content'] = summary
-                        print(f"   ✅ GPT 요약 완료")
-                except Exception as summary_error:
-                    print(f"   ❌ 요약 중 오류: {summary_error}")
-                print(f"   ✅ 기사 추출 완료:")
-                print(f"   " + "-" * 70)
-                return details
-            else:
-                print(f"   ❌ 기사 내용 부족: {article_url}")
-                return None
-        else:
-            print(f"   ❌ 기사 추출 실패: {article_url}")
+        details = await extract_article_async(session, press, article_url)
+        details = build_article_details(details, article_url, category, press)
+        if details is None:
             return None
+        details = await summarize_article_details(details)
+        print(f"   ✅ 기사 추출 완료:")
+        print(f"   " + "-" * 70)
+        return details
     except Exception as e:
         print(f"   ❌ 기사 처리 실패 ({article_url}): {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,99 @@
+"""기사 본문 SimHash 지문과 최근 기사 근접 중복 인덱스
+
+64비트 SimHash를 8비트 밴드 8개로 나눠 Redis에 색인합니다.
+해밍 거리가 7 이하인 지문은 적어도 한 밴드가 같으므로 밴드 후보만 비교하면 됩니다.
+"""
+import os
+import re
+import time
+import hashlib
+import numpy as np
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+from app.core.redis_client import get_redis_client
+
+load_dotenv()
+
+redis_client = get_redis_client()
+
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+DEDUP_MAX_HAMMING = int(os.getenv("DEDUP_MAX_HAMMING", 6))
+DEDUP_WINDOW_HOURS = int(os.getenv("DEDUP_WINDOW_HOURS", 48))
+# 이보다 짧은 본문은 지문이 불안정하므로 중복 판정에서 제외
+DEDUP_MIN_LENGTH = int(os.getenv("DEDUP_MIN_LENGTH", 200))
+
+SHINGLE_SIZE = 3
+BAND_BITS = 8
+BAND_COUNT = 64 // BAND_BITS
+# 밴드 N개 중 적어도 하나가 같다는 보장은 해밍 거리 N-1까지만 성립 (그 이상은 후보에서 빠질 수 있음)
+if not 0 <= DEDUP_MAX_HAMMING < BAND_COUNT:
+    raise ValueError(f"DEDUP_MAX_HAMMING은 0 이상 {BAND_COUNT - 1} 이하여야 합니다 (밴드 {BAND_COUNT}개 기준): {DEDUP_MAX_HAMMING}")
+_NON_WORD_RE = re.compile(r'[^\w]+')
+_BIT_SHIFTS = np.arange(64, dtype=np.uint64)
+
+
+def compute_simhash(text: str) -> Optional[int]:
+    """공백/기호를 제거한 본문의 글자 3-gram으로 64비트 SimHash 계산 (본문이 짧으면 None)"""
+    if not text or len(text) < DEDUP_MIN_LENGTH:
+        return None
+    normalized = _NON_WORD_RE.sub('', text.lower())
+    if len(normalized) < SHINGLE_SIZE:
+        return None
+    shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    digests = b''.join(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest() for s in shingles)
+    hashes = np.frombuffer(digests, dtype='<u8')
+    # 비트별로 1인 shingle 수가 절반을 넘으면 1
+    ones = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).sum(axis=0)
+    bits = ones * 2 > len(hashes)
+    return sum(1 << int(i) for i in np.flatnonzero(bits))
+
+
+def simhash_to_hex(value: int) -> str:
+    return f"{value:016x}"
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def _band_keys(simhash: int):
+    mask = (1 << BAND_BITS) - 1
+    return [f"simhash_band:{i}:{(simhash >> (i * BAND_BITS)) & mask:02x}" for i in range(BAND_COUNT)]
+
+
+def find_near_duplicate(simhash: int, max_distance: int = DEDUP_MAX_HAMMING) -> Optional[Tuple[str, int]]:
+    """최근 DEDUP_WINDOW_HOURS 안에 색인된 기사 중 가장 가까운 (url, 거리) 반환 (max_distance는 BAND_COUNT 미만)"""
+    if not 0 <= max_distance < BAND_COUNT:
+        raise ValueError(f"max_distance는 0 이상 {BAND_COUNT - 1} 이하여야 합니다: {max_distance}")
+    cutoff = time.time() - DEDUP_WINDOW_HOURS * 3600
+    try:
+        pipe = redis_client.pipeline()
+        for key in _band_keys(simhash):
+            pipe.zrangebyscore(key, cutoff, '+inf')
+        candidates = set(member for members in pipe.execute() for member in members)
+    except Exception as e:
+        print(f"⚠️ 중복 지문 조회 실패: {e}")
+        return None
+    best = None
+    for member in candidates:
+        hex_value, _, url = member.partition('|')
+        distance = hamming_distance(simhash, int(hex_value, 16))
+        if distance <= max_distance and (best is None or distance < best[1]):
+            best = (url, distance)
+    return best
+
+
+def index_fingerprint(simhash: int, url: str) -> None:
+    """정본(canonical) 기사 지문을 밴드 인덱스에 추가하고 오래된 항목 정리"""
+    now = time.time()
+    cutoff = now - DEDUP_WINDOW_HOURS * 3600
+    member = f"{simhash_to_hex(simhash)}|{url}"
+    try:
+        pipe = redis_client.pipeline()
+        for key in _band_keys(simhash):
+            pipe.zadd(key, {member: now})
+            pipe.zremrangebyscore(key, 0, cutoff)
+            pipe.expire(key, DEDUP_WINDOW_HOURS * 3600)
+        pipe.execute()
+    except Exception as e:
+        print(f"⚠️ 중복 지문 색인 실패 {url}: {e}")
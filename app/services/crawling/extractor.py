@@ -0,0 +1,260 @@
+"""언론사 추출 스펙 레지스트리와 공용 추출 엔진
+
+언론사는 PressSpec(셀렉터/정리 정규식/이미지 호스트)만 등록하면 되고,
+셀렉터와 정규식은 등록(import) 시점에 한 번만 컴파일됩니다.
+"""
+import re
+import aiohttp
+import lxml.html
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urljoin
+from lxml.cssselect import CSSSelector
+from app.services.crawling.parse_executor import run_parser
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 텍스트 추출 시 내용을 무시하는 태그
+SKIP_TEXT_TAGS = frozenset(['script', 'style', 'iframe', 'template', 'noscript'])
+IMAGE_ATTRS = ('srcset', 'data-srcset', 'data-src', 'src')
+ONERROR_SRC_RE = re.compile(r'this\.src=(["\'])([^"\']+)\1')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@dataclass(frozen=True)
+class PressSpec:
+    """언론사별 기사 추출 설정"""
+    name: str
+    image_host: str  # '/'로 시작하는 이미지 경로 앞에 붙일 호스트 (예: https://img.hankyung.com)
+    title: Tuple[str, ...]
+    content: Tuple[str, ...]
+    image: Tuple[str, ...]
+    time: Tuple[str, ...]
+    reporter: Tuple[str, ...]
+    time_meta: Tuple[str, ...] = ()  # content 속성을 우선 사용할 meta 셀렉터
+    content_cleanup: Tuple[str, ...] = ()  # 본문에서 제거할 정규식
+    time_cleanup: Tuple[str, ...] = ()  # 발행시간 텍스트에서 제거할 정규식
+    reporter_cleanup: Tuple[str, ...] = ()  # 기자명 텍스트에서 제거할 정규식
+    reporter_must_contain: Tuple[Tuple[str, str], ...] = ()  # (reporter 셀렉터, 문자열): 해당 셀렉터 텍스트는 문자열을 포함할 때만 기자명으로 사용
+    image_url_contains: Tuple[str, ...] = ()  # 지정 시 해당 문자열을 포함한 이미지 URL만 허용
+    image_onerror: bool = False  # onerror="this.src='...'" 대체 이미지 경로 사용 여부
+    content_min_length: int = 20
+
+
+@dataclass
+class CompiledPressSpec:
+    spec: PressSpec
+    title: List[CSSSelector]
+    content: List[CSSSelector]
+    image: List[CSSSelector]
+    time: List[CSSSelector]
+    time_meta: List[CSSSelector]
+    reporter: List[CSSSelector]
+    content_cleanup: List[Pattern] = field(default_factory=list)
+    time_cleanup: List[Pattern] = field(default_factory=list)
+    reporter_cleanup: List[Pattern] = field(default_factory=list)
+    reporter_required: List[Optional[str]] = field(default_factory=list)  # reporter 셀렉터 순서대로 필수 문자열
+
+
+PRESS_REGISTRY: Dict[str, CompiledPressSpec] = {}
+
+
+def _compile_selectors(selectors: Tuple[str, ...]) -> List[CSSSelector]:
+    return [CSSSelector(sel, translator='html') for sel in selectors]
+
+
+def _compile_patterns(patterns: Tuple[str, ...]) -> List[Pattern]:
+    return [re.compile(pat, re.IGNORECASE) for pat in patterns]
+
+
+def register_press(spec: PressSpec) -> PressSpec:
+    """언론사 스펙을 컴파일해 레지스트리에 등록합니다."""
+    must_contain = dict(spec.reporter_must_contain)
+    unknown = set(must_contain) - set(spec.reporter)
+    if unknown:
+        raise ValueError(f"{spec.name}: reporter_must_contain 셀렉터가 reporter에 없음: {sorted(unknown)}")
+    PRESS_REGISTRY[spec.name] = CompiledPressSpec(
+        spec=spec,
+        title=_compile_selectors(spec.title),
+        content=_compile_selectors(spec.content),
+        image=_compile_selectors(spec.image),
+        time=_compile_selectors(spec.time),
+        time_meta=_compile_selectors(spec.time_meta),
+        reporter=_compile_selectors(spec.reporter),
+        content_cleanup=_compile_patterns(spec.content_cleanup),
+        time_cleanup=_compile_patterns(spec.time_cleanup),
+        reporter_cleanup=_compile_patterns(spec.reporter_cleanup),
+        reporter_required=[must_contain.get(sel) for sel in spec.reporter],
+    )
+    return spec
+
+
+def get_press_spec(press: str) -> Optional[CompiledPressSpec]:
+    return PRESS_REGISTRY.get(press)
+
+
+def _collect_text(el, out: List[str]) -> None:
+    """BeautifulSoup get_text와 같이 script/style/주석을 제외한 텍스트 조각 수집"""
+    if not isinstance(el.tag, str) or el.tag in SKIP_TEXT_TAGS:
+        return
+    if el.text:
+        out.append(el.text)
+    for child in el:
+        _collect_text(child, out)
+        if child.tail:
+            out.append(child.tail)
+
+
+def element_text(el, separator: str = '') -> str:
+    parts: List[str] = []
+    _collect_text(el, parts)
+    return separator.join(p.strip() for p in parts if p.strip())
+
+
+def _apply_cleanup(text: str, patterns: List[Pattern]) -> str:
+    for pat in patterns:
+        text = pat.sub('', text)
+    return text
+
+
+def _first_text(doc, selectors: List[CSSSelector], cleanup: List[Pattern], required: Optional[List[Optional[str]]] = None) -> Optional[str]:
+    """셀렉터 순서대로 첫 요소의 텍스트 반환 (required[i]가 있으면 정리 전 텍스트에 그 문자열이 있어야 사용)"""
+    for i, sel in enumerate(selectors):
+        for el in sel(doc):
+            raw = element_text(el)
+            if required and required[i] and required[i] not in raw:
+                break
+            text = _apply_cleanup(raw, cleanup).strip()
+            if text:
+                return text
+            break
+    return None
+
+
+def _normalize_image_url(src: str, spec: PressSpec, page_url: str) -> Optional[str]:
+    src = src.strip()
+    if not src or src.startswith('data:'):
+        return None
+    if src.startswith('//'):
+        url = f'https:{src}'
+    elif src.startswith('http'):
+        url = src
+    elif src.startswith('/'):
+        url = f'{spec.image_host}{src}'
+    else:
+        url = urljoin(page_url, src)
+    if spec.image_url_contains and not any(s in url for s in spec.image_url_contains):
+        return None
+    return url
+
+
+def _image_candidates(el, spec: PressSpec):
+    """srcset(가장 큰 후보) → data-src → src → onerror 순으로 후보 경로 반환"""
+    for attr in IMAGE_ATTRS:
+        value = el.get(attr)
+        if not value:
+            continue
+        if attr.endswith('srcset'):
+            candidates = [s.strip().split(' ')[0] for s in value.split(',') if s.strip()]
+            yield from reversed(candidates)
+        else:
+            yield value
+    if spec.image_onerror:
+        match = ONERROR_SRC_RE.search(el.get('onerror') or '')
+        if match:
+            yield match.group(2)
+
+
+def _select_image_url(doc, compiled: CompiledPressSpec, page_url: str) -> Optional[str]:
+    for sel in compiled.image:
+        for el in sel(doc):
+            for src in _image_candidates(el, compiled.spec):
+                url = _normalize_image_url(src, compiled.spec, page_url)
+                if url:
+                    return url
+    return None
+
+
+def _select_content(doc, compiled: CompiledPressSpec) -> Optional[str]:
+    for sel in compiled.content:
+        for el in sel(doc):
+            text = _apply_cleanup(element_text(el, separator=' '), compiled.content_cleanup)
+            text = WHITESPACE_RE.sub(' ', text).strip()
+            if len(text) > compiled.spec.content_min_length:
+                return text
+            break
+    return None
+
+
+def _select_time(doc, compiled: CompiledPressSpec) -> Optional[str]:
+    for sel in compiled.time_meta:
+        for el in sel(doc):
+            content = (el.get('content') or '').strip()
+            if content:
+                return content
+    return _first_text(doc, compiled.time, compiled.time_cleanup)
+
+
+def empty_article(url: Optional[str] = None, error: Optional[str] = None) -> Dict[str, Optional[str]]:
+    result = {
+        "title": None,
+        "url": url,
+        "image_url": None,
+        "content": None,
+        "published_time": None,
+        "reporter_name": None,
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def _parse_document(raw: bytes, charset: Optional[str]):
+    if charset:
+        try:
+            return lxml.html.document_fromstring(raw, parser=lxml.html.HTMLParser(encoding=charset))
+        except LookupError:
+            pass
+    return lxml.html.document_fromstring(raw)
+
+
+def parse_article(press: str, raw: bytes, url: str, charset: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """등록된 스펙으로 기사 HTML을 파싱합니다 (파싱 프로세스 풀에서 실행)."""
+    compiled = get_press_spec(press)
+    if compiled is None:
+        return empty_article(error=f"지원하지 않는 언론사: {press}")
+    try:
+        doc = _parse_document(raw, charset)
+    except Exception as e:
+        return empty_article(error=f"HTML 파싱 실패: {e}")
+    return {
+        "title": _first_text(doc, compiled.title, []),
+        "url": url,
+        "image_url": _select_image_url(doc, compiled, url),
+        "content": _select_content(doc, compiled),
+        "published_time": _select_time(doc, compiled),
+        "reporter_name": _first_text(doc, compiled.reporter, compiled.reporter_cleanup, compiled.reporter_required),
+    }
+
+
+async def fetch_article_page(session: aiohttp.ClientSession, url: str) -> Tuple[bytes, Optional[str]]:
+    """기사 페이지 원본 바이트와 응답 charset을 가져옵니다."""
+    async with session.get(url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        if response.status != 200:
+            # 속도 제한기가 429/5xx를 구분할 수 있도록 상태 코드를 담아 전달
+            raise aiohttp.ClientResponseError(
+                response.request_info, response.history, status=response.status, message=f"HTTP {response.status}"
+            )
+        return await response.read(), response.charset
+
+
+async def extract_article_async(session: aiohttp.ClientSession, press: str, url: str) -> Dict[str, Optional[str]]:
+    """기사 페이지를 내려받아 언론사 스펙으로 추출합니다."""
+    try:
+        raw, charset = await fetch_article_page(session, url)
+        return await run_parser(parse_article, press, raw, url, charset)
+    except Exception as e:
+        print(f"      ❌ {press} 기사 추출 중 예외 발생: {e}")
+        return empty_article(error=str(e))
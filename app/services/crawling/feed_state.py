@@ -0,0 +1,66 @@
+"""RSS 피드별 조건부 요청 상태(ETag/Last-Modified/워터마크)와 이월 항목 저장소"""
+import os
+import json
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+from app.core.redis_client import get_redis_client
+
+load_dotenv()
+
+redis_client = get_redis_client()
+
+FEED_STATE_FIELDS = ("etag", "last_modified", "last_guid", "last_pub_date")
+# 피드별 이월(backlog) 항목 최대 보관 수
+RSS_BACKLOG_MAX = int(os.getenv("RSS_BACKLOG_MAX", 200))
+
+
+def _get_state_key(rss_url: str) -> str:
+    return f"rss_feed_state:{rss_url}"
+
+
+def get_feed_state(rss_url: str) -> Dict[str, str]:
+    """피드의 마지막 조회 상태를 가져옵니다. Redis 장애 시 빈 상태를 반환합니다."""
+    try:
+        state = redis_client.hgetall(_get_state_key(rss_url))
+        return {k: v for k, v in state.items() if k in FEED_STATE_FIELDS and v}
+    except Exception as e:
+        print(f"⚠️ RSS 피드 상태 조회 실패 {rss_url}: {e}")
+        return {}
+
+
+def save_feed_state(rss_url: str, **fields: Optional[str]) -> None:
+    """값이 있는 필드만 피드 상태에 기록합니다."""
+    mapping = {k: v for k, v in fields.items() if k in FEED_STATE_FIELDS and v}
+    if not mapping:
+        return
+    try:
+        redis_client.hset(_get_state_key(rss_url), mapping=mapping)
+    except Exception as e:
+        print(f"⚠️ RSS 피드 상태 저장 실패 {rss_url}: {e}")
+
+
+def _get_backlog_key(rss_url: str) -> str:
+    return f"rss_feed_backlog:{rss_url}"
+
+
+def get_feed_backlog(rss_url: str) -> List[Dict]:
+    """이전 실행에서 처리 한도를 넘어 이월된 항목을 가져옵니다."""
+    try:
+        return [json.loads(raw) for raw in redis_client.lrange(_get_backlog_key(rss_url), 0, -1)]
+    except Exception as e:
+        print(f"⚠️ RSS 피드 backlog 조회 실패 {rss_url}: {e}")
+        return []
+
+
+def save_feed_backlog(rss_url: str, items: List[Dict]) -> None:
+    """다음 실행으로 이월할 항목을 저장합니다 (최대 RSS_BACKLOG_MAX개, 오래된 항목부터 버림)."""
+    key = _get_backlog_key(rss_url)
+    items = items[-RSS_BACKLOG_MAX:]
+    try:
+        pipe = redis_client.pipeline()
+        pipe.delete(key)
+        if items:
+            pipe.rpush(key, *[json.dumps(item, ensure_ascii=False) for item in items])
+        pipe.execute()
+    except Exception as e:
+        print(f"⚠️ RSS 피드 backlog 저장 실패 {rss_url}: {e}")
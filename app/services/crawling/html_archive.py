@@ -0,0 +1,141 @@
+"""수집한 기사 원본 HTML 보관소 (재추출/리플레이용)
+
+원본은 zstd로 압축해 `{수집일}/{sha256(url)}/{수집시각}.html.zst` 키로 로컬 디렉터리 또는 GCS에 저장합니다.
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import zstandard
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# off(기본) / local / gcs
+CRAWL_ARCHIVE_MODE = os.getenv("CRAWL_ARCHIVE_MODE", "off").lower()
+CRAWL_ARCHIVE_DIR = os.getenv("CRAWL_ARCHIVE_DIR", "html_archive")
+CRAWL_ARCHIVE_BUCKET = os.getenv("CRAWL_ARCHIVE_BUCKET") or os.getenv("GOOGLE_CLOUD_STORAGE_BUCKET")
+CRAWL_ARCHIVE_PREFIX = os.getenv("CRAWL_ARCHIVE_PREFIX", "html_archive")
+CRAWL_ARCHIVE_ZSTD_LEVEL = int(os.getenv("CRAWL_ARCHIVE_ZSTD_LEVEL", 3))
+
+ARCHIVE_SUFFIX = ".html.zst"
+
+
+@dataclass
+class ArchiveRecord:
+    url: str
+    press: str
+    category: str
+    charset: Optional[str]
+    fetched_at: str  # ISO 8601 (UTC)
+    raw: bytes
+
+    def to_bytes(self) -> bytes:
+        """메타데이터 JSON 한 줄 + 원본 바이트"""
+        meta = {k: v for k, v in asdict(self).items() if k != "raw"}
+        return json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n" + self.raw
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ArchiveRecord":
+        header, _, raw = data.partition(b"\n")
+        return cls(raw=raw, **json.loads(header))
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def build_archive_key(url: str, fetched_at: datetime) -> str:
+    return f"{fetched_at:%Y-%m-%d}/{url_hash(url)}/{fetched_at:%Y%m%dT%H%M%S%fZ}{ARCHIVE_SUFFIX}"
+
+
+class LocalArchiveBackend:
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    def get(self, key: str) -> bytes:
+        return (self.root / key).read_bytes()
+
+    def list_keys(self, prefix: str) -> List[str]:
+        base = self.root / prefix
+        if not base.exists():
+            return []
+        return sorted(p.relative_to(self.root).as_posix() for p in base.rglob(f"*{ARCHIVE_SUFFIX}"))
+
+
+class GCSArchiveBackend:
+    def __init__(self, bucket_name: str, prefix: str):
+        from google.cloud import storage
+        self.bucket = storage.Client().bucket(bucket_name)
+        self.prefix = prefix.strip("/")
+
+    def _blob_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def put(self, key: str, data: bytes) -> None:
+        self.bucket.blob(self._blob_name(key)).upload_from_string(data, content_type="application/zstd")
+
+    def get(self, key: str) -> bytes:
+        return self.bucket.blob(self._blob_name(key)).download_as_bytes()
+
+    def list_keys(self, prefix: str) -> List[str]:
+        strip = len(self.prefix) + 1 if self.prefix else 0
+        return sorted(
+            blob.name[strip:]
+            for blob in self.bucket.list_blobs(prefix=self._blob_name(prefix))
+            if blob.name.endswith(ARCHIVE_SUFFIX)
+        )
+
+
+class HtmlArchive:
+    def __init__(self, backend, level: int = CRAWL_ARCHIVE_ZSTD_LEVEL):
+        self.backend = backend
+        self.level = level
+
+    def save(self, url: str, press: str, category: str, raw: bytes, charset: Optional[str], fetched_at: Optional[datetime] = None) -> str:
+        """원본 HTML을 압축 저장하고 키를 반환합니다."""
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        record = ArchiveRecord(url=url, press=press, category=category, charset=charset, fetched_at=fetched_at.isoformat(), raw=raw)
+        key = build_archive_key(url, fetched_at)
+        # ZstdCompressor는 스레드 간 공유가 안전하지 않으므로 호출마다 생성
+        self.backend.put(key, zstandard.ZstdCompressor(level=self.level).compress(record.to_bytes()))
+        return key
+
+    def load(self, key: str) -> ArchiveRecord:
+        return ArchiveRecord.from_bytes(zstandard.ZstdDecompressor().decompress(self.backend.get(key)))
+
+    def iter_latest(self, date: str) -> Iterator[ArchiveRecord]:
+        """해당 수집일(YYYY-MM-DD)의 URL별 최신 원본을 순회합니다."""
+        latest: Dict[str, str] = {}
+        for key in self.backend.list_keys(date):
+            # 키가 수집시각 순으로 정렬되어 있으므로 마지막 값이 최신
+            latest[key.rsplit("/", 1)[0]] = key
+        for key in latest.values():
+            try:
+                yield self.load(key)
+            except Exception as e:
+                print(f"⚠️ 아카이브 원본 읽기 실패 {key}: {e}")
+
+
+_archive: Optional[HtmlArchive] = None
+
+
+def get_html_archive() -> Optional[HtmlArchive]:
+    """CRAWL_ARCHIVE_MODE에 맞는 보관소를 반환합니다 (off이면 None)."""
+    global _archive
+    if _archive is None:
+        if CRAWL_ARCHIVE_MODE == "local":
+            _archive = HtmlArchive(LocalArchiveBackend(CRAWL_ARCHIVE_DIR))
+        elif CRAWL_ARCHIVE_MODE == "gcs" and CRAWL_ARCHIVE_BUCKET:
+            _archive = HtmlArchive(GCSArchiveBackend(CRAWL_ARCHIVE_BUCKET, CRAWL_ARCHIVE_PREFIX))
+    return _archive
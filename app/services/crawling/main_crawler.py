@@ -1,45 +1,53 @@
-import asyncio
-import aiohttp
 import time
 from datetime import datetime
-from typing import Dict, List
-from app.core.save import save_articles_batch
-from app.services.crawling.rss_fetcher import fetch_rss_feed_async
-from app.core.database import SessionLocal
-from app.services.crawling.article_processor import process_article_with_summary
+from typing import Dict, Optional
+from app.services.crawling.pipeline import CrawlPipeline, PipelineConfig, StageStats, percentile
+from app.services.providers import resolve_feeds
 
+# 언론사별 설정
+# - rate_limit: 기사 페이지 요청 속도 제한 (rate_limiter.RateLimitConfig 필드, 생략 시 환경변수 기본값)
+# - feeds: 카테고리별 RSS 주소
 RSS_FEEDS = {
     "한국경제": {
-        "증권": "https://www.hankyung.com/feed/finance",
-        "경제": "https://www.hankyung.com/feed/economy",
-        "부동산": "https://www.hankyung.com/feed/realestate",
-        "IT": "https://www.hankyung.com/feed/it",
-        "정치": "https://www.hankyung.com/feed/politics",
-        "국제": "https://www.hankyung.com/feed/international",
-        "사회": "https://www.hankyung.com/feed/society",
-        "문화": "https://www.hankyung.com/feed/life",
-        "스포츠": "https://www.hankyung.com/feed/sports",
-        "연예": "https://www.hankyung.com/feed/entertainment"
+        "rate_limit": {"initial_rate": 2.0, "max_rate": 8.0},
+        "feeds": {
+            "증권": "https://www.hankyung.com/feed/finance",
+            "경제": "https://www.hankyung.com/feed/economy",
+            "부동산": "https://www.hankyung.com/feed/realestate",
+            "IT": "https://www.hankyung.com/feed/it",
+            "정치": "https://www.hankyung.com/feed/politics",
+            "국제": "https://www.hankyung.com/feed/international",
+            "사회": "https://www.hankyung.com/feed/society",
+            "문화": "https://www.hankyung.com/feed/life",
+            "스포츠": "https://www.hankyung.com/feed/sports",
+            "연예": "https://www.hankyung.com/feed/entertainment"
+        },
     },
     "SBS뉴스": {
-        "정치": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=01&plink=RSSREADER",
-        "경제": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=02&plink=RSSREADER",
-        "사회": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=03&plink=RSSREADER",
-        "국제": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=07&plink=RSSREADER",
-        "문화": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=08&plink=RSSREADER",
-        "연예": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=14&plink=RSSREADER",
-        "스포츠": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=09&plink=RSSREADER"
+        "rate_limit": {"initial_rate": 1.0, "max_rate": 5.0},
+        "feeds": {
+            "정치": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=01&plink=RSSREADER",
+            "경제": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=02&plink=RSSREADER",
+            "사회": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=03&plink=RSSREADER",
+            "국제": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=07&plink=RSSREADER",
+            "문화": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=08&plink=RSSREADER",
+            "연예": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=14&plink=RSSREADER",
+            "스포츠": "https://news.sbs.co.kr/news/SectionRssFeed.do?sectionId=09&plink=RSSREADER"
+        },
     },
-    "매일경제":{
-        "경제":"https://www.mk.co.kr/rss/30100041",
-        "정치":"https://www.mk.co.kr/rss/30200030",
-        "사회":"https://www.mk.co.kr/rss/50400012",
-        "국제":"https://www.mk.co.kr/rss/30300018",
-        "증권":"https://www.mk.co.kr/rss/50200011",
-        "부동산":"https://www.mk.co.kr/rss/50300009",
-        "문화":"https://www.mk.co.kr/rss/30000023",
-        "스포츠":"https://www.mk.co.kr/rss/71000001",
-        "IT":"https://www.mk.co.kr/rss/50700001"
+    "매일경제": {
+        "rate_limit": {"initial_rate": 2.0, "max_rate": 8.0},
+        "feeds": {
+            "경제":"https://www.mk.co.kr/rss/30100041",
+            "정치":"https://www.mk.co.kr/rss/30200030",
+            "사회":"https://www.mk.co.kr/rss/50400012",
+            "국제":"https://www.mk.co.kr/rss/30300018",
+            "증권":"https://www.mk.co.kr/rss/50200011",
+            "부동산":"https://www.mk.co.kr/rss/50300009",
+            "문화":"https://www.mk.co.kr/rss/30000023",
+            "스포츠":"https://www.mk.co.kr/rss/71000001",
+            "IT":"https://www.mk.co.kr/rss/50700001"
+        },
     },
 }
 
@@ -48,62 +56,32 @@ def print_section(title: str):
     print(title)
     print("=" * 80)
 
-async def scrape_category_async(
-    session: aiohttp.ClientSession,
-    category: str,
-    rss_url: str,
-    press: str,
-    semaphore: asyncio.Semaphore
-) -> List[Dict]:
-    """
-    카테고리별 비동기 크롤링 (동시성 제한)
-    """
-    print(f"📰 {press} - {category} 카테고리 크롤링 중...")
-    start_time = time.time()
-    article_urls = await fetch_rss_feed_async(session, rss_url)
-    if not article_urls:
-        print(f"   ❌ {category} 카테고리에서 기사를 찾을 수 없습니다.")
-        return []
-    print(f"   📊 {category} 카테고리: {len(article_urls)}개 기사 발견")
-    async def process_with_semaphore(url, index):
-        async with semaphore:
-            await asyncio.sleep(0.5)  # 서버 부하 방지
-            return await process_article_with_summary(session, url, category, press, index, len(article_urls))
-    tasks = [process_with_semaphore(url, i + 1) for i, url in enumerate(article_urls)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    successful_articles = [r for r in results if r and not isinstance(r, Exception) and isinstance(r, dict)]
-    elapsed = time.time() - start_time
-    print(f"   🎯 {category} 완료: {len(successful_articles)}개 성공 (소요시간: {elapsed:.1f}초)")
-    print("   " + "-" * 70)
-    return successful_articles
-
-async def scrape_all_articles_async(max_concurrent: int = 10, save_to_db: bool = True):
+async def scrape_all_articles_async(max_concurrent: int = 10, save_to_db: bool = True, max_items_per_feed: Optional[int] = None, replay_date: Optional[str] = None, feeds: Optional[Dict[str, Dict]] = None, stats: Optional[Dict[str, StageStats]] = None):
     """
     전체 언론사/카테고리 비동기 크롤링 및 DB 저장
+    - discover → fetch → parse → summarize → persist 파이프라인으로 실행되며, 요약이 끝난 기사부터 바로 저장
+    - max_concurrent: 기사 HTML 다운로드 워커 수
+    - max_items_per_feed: 피드당 실행 1회 처리 한도 (기본값 RSS_MAX_ITEMS_PER_RUN, 초과분은 다음 실행으로 이월)
+    - replay_date: 지정 시(YYYY-MM-DD) 네트워크 없이 원본 HTML 아카이브로 재추출만 수행 (요약/DB 저장 생략)
+    - feeds: 크롤링할 언론사/피드 (기본값 RSS_FEEDS)
+    - stats: 넘기면 단계별 처리 통계(StageStats)를 이 dict에 채움 (벤치마크용)
     """
-    scraped_articles = []
+    if replay_date:
+        save_to_db = False
     start_time = time.time()
-    processed_articles = 0
-    failed_articles = 0
     print_section(f"🚀 크롤링 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"⚡ 동시 처리 수: {max_concurrent}")
-    semaphore = asyncio.Semaphore(min(max_concurrent, 10))
-    connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-    timeout = aiohttp.ClientTimeout(total=60)
-    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-        category_tasks = [
-            scrape_category_async(session, category, rss_url, press, semaphore)
-            for press, categories in RSS_FEEDS.items()
-            for category, rss_url in categories.items()
-        ]
-        category_results = await asyncio.gather(*category_tasks, return_exceptions=True)
-        for result in category_results:
-            if isinstance(result, Exception):
-                print(f"❌ 카테고리 처리 실패: {result}")
-                failed_articles += 1
-            elif isinstance(result, list):
-                scraped_articles.extend(result)
-                processed_articles += len(result)
+    config = PipelineConfig(
+        fetch_workers=max_concurrent,
+        max_items_per_feed=max_items_per_feed,
+        save_to_db=save_to_db,
+        replay_date=replay_date,
+    )
+    print(f"⚡ 단계별 워커 수: fetch={config.fetch_workers}, parse={config.parse_workers}, summarize={config.summarize_workers}")
+    # PROVIDER_MODE=fake이면 로컬 가짜 언론사 서버의 RSS를 사용
+    pipeline = CrawlPipeline(feeds=resolve_feeds(feeds or RSS_FEEDS), config=config, stats=stats if stats is not None else {})
+    scraped_articles = await pipeline.run()
+    processed_articles = len(scraped_articles)
+    failed_articles = sum(stage_stats.failed for stage_stats in pipeline.stats.values())
     total_time = time.time() - start_time
     success_rate = (processed_articles / (processed_articles + failed_articles) * 100) if (processed_articles + failed_articles) > 0 else 0
     print_section(f"🎉 비동기 크롤링 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -116,17 +94,14 @@ async def scrape_all_articles_async(max_concurrent: int = 10, save_to_db: bool =
         print(f"   • 평균 처리시간: {total_time/processed_articles:.1f}초/기사")
     else:
         print(f"   • 평균 처리시간: 계산 불가")
-    if scraped_articles and save_to_db:
-        print("\n💾 데이터베이스 저장 시작...")
-        db = SessionLocal()
-        try:
-            save_result = save_articles_batch(db, scraped_articles)
-            print(f"📊 데이터베이스 저장 결과:")
-            print(f"   • 저장 성공: {save_result['saved']}개")
-        except Exception as e:
-            print(f"❌ 데이터베이스 저장 실패: {e}")
-        finally:
-            db.close()
-    elif scraped_articles and not save_to_db:
+    for stage, stage_stats in pipeline.stats.items():
+        line = f"   • [{stage}] 처리 {stage_stats.processed}개 / 실패 {stage_stats.failed}개"
+        if stage_stats.latencies:
+            line += f" / p50 {percentile(stage_stats.latencies, 50) * 1000:.0f}ms, p99 {percentile(stage_stats.latencies, 99) * 1000:.0f}ms"
+        print(line)
+    if save_to_db:
+        print(f"📊 데이터베이스 저장 결과:")
+        print(f"   • 저장 성공: {pipeline.saved_count}개")
+    elif scraped_articles:
         print("\n💾 데이터베이스 저장 건너뜀 (save_to_db=False)")
-    return scraped_articles
\ No newline at end of file
+    return scraped_articles
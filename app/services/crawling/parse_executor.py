@@ -0,0 +1,55 @@
+"""기사 HTML 파싱 전용 프로세스 풀 (원본 바이트를 넘기고 추출 결과 dict만 돌려받음)"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# 0 이하이면 풀 없이 이벤트 루프에서 바로 파싱 (디버깅용)
+CRAWL_PARSE_WORKERS = int(os.getenv("CRAWL_PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """파싱 프로세스 풀을 처음 사용할 때 생성합니다."""
+    global _executor
+    if CRAWL_PARSE_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # DB 커넥션/스레드를 가진 부모 프로세스를 fork하지 않도록 spawn 사용
+            _executor = ProcessPoolExecutor(
+                max_workers=CRAWL_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            print(f"🧵 파싱 프로세스 풀 시작: workers={CRAWL_PARSE_WORKERS}")
+        return _executor
+
+
+def shutdown_parse_executor() -> None:
+    """파싱 프로세스 풀을 종료합니다."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def run_parser(parse_fn: Callable[..., Any], *args: Any) -> Any:
+    """파싱 함수를 프로세스 풀에서 실행합니다. parse_fn과 인자는 pickle 가능해야 합니다."""
+    executor = get_parse_executor()
+    if executor is None:
+        return parse_fn(*args)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, parse_fn, *args)
+    except BrokenProcessPool:
+        # 워커가 비정상 종료되면 풀을 새로 만들고 이번 요청은 한 번 더 시도
+        print("⚠️ 파싱 프로세스 풀이 손상되어 재생성합니다.")
+        shutdown_parse_executor()
+        executor = get_parse_executor()
+        return await loop.run_in_executor(executor, parse_fn, *args)
@@ -0,0 +1,438 @@
+"""단계별 생산자/소비자 크롤링 파이프라인
+
+discover → fetch → parse → summarize → persist 단계를 크기 제한 큐로 연결하고 단계마다 워커 수를 따로 둡니다.
+"""
+import asyncio
+import concurrent.futures
+import math
+import os
+import threading
+import aiohttp
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from app.core.database import create_crawler_session
+from app.core.query import get_article_summary_by_url, get_existing_article_urls
+from app.core.save import save_articles_batch
+from app.services.crawling.article_processor import build_article_details, summarize_article_details
+from app.services.crawling.dedup import DEDUP_ENABLED, DEDUP_MAX_HAMMING, compute_simhash, find_near_duplicate, hamming_distance, simhash_to_hex
+from app.services.crawling.extractor import fetch_article_page, get_press_spec, parse_article
+from app.services.crawling.html_archive import CRAWL_ARCHIVE_DIR, HtmlArchive, LocalArchiveBackend, get_html_archive
+from app.services.crawling.parse_executor import CRAWL_PARSE_WORKERS, run_parser
+from app.services.crawling.rate_limiter import HostRateLimiter, get_host_rate_limiter
+from app.services.crawling.rss_fetcher import FeedFetchResult, commit_feed_result, fetch_rss_feed_async
+
+# 큐 종료 신호
+_STOP = object()
+# 리플레이 읽기 스레드가 큐 자리를 기다리는 동안 중단 여부를 확인하는 주기(초)
+ARCHIVE_PUT_POLL_SECONDS = 0.5
+
+
+@dataclass
+class PipelineConfig:
+    """단계별 워커 수와 큐 크기 (환경변수로 기본값 조정)"""
+    fetch_workers: int = int(os.getenv("CRAWL_FETCH_WORKERS", 10))
+    parse_workers: int = int(os.getenv("CRAWL_PARSE_CONCURRENCY", max(1, CRAWL_PARSE_WORKERS)))
+    summarize_workers: int = int(os.getenv("CRAWL_SUMMARIZE_WORKERS", 5))
+    queue_size: int = int(os.getenv("CRAWL_QUEUE_SIZE", 50))
+    limit_per_host: int = int(os.getenv("CRAWL_LIMIT_PER_HOST", 5))  # 호스트별 동시 연결 상한 (요청 속도는 rate_limiter가 조절)
+    persist_batch_size: int = int(os.getenv("CRAWL_PERSIST_BATCH_SIZE", 20))
+    persist_flush_seconds: float = float(os.getenv("CRAWL_PERSIST_FLUSH_SECONDS", 2.0))
+    max_items_per_feed: Optional[int] = None
+    save_to_db: bool = True
+    replay_date: Optional[str] = None  # 지정 시(YYYY-MM-DD) 네트워크 없이 해당 날짜 아카이브 원본으로 재추출
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 백분위수 (q: 0~100, 값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+@dataclass
+class StageStats:
+    processed: int = 0
+    failed: int = 0
+    latencies: List[float] = field(default_factory=list)  # 기사별 처리 시간(초)
+    queue_waits: List[float] = field(default_factory=list)  # 기사별 입력 큐 대기 시간(초)
+    first_started: Optional[float] = None
+    last_finished: Optional[float] = None
+
+    def record(self, queue_wait: float, started: float, finished: float) -> None:
+        self.queue_waits.append(queue_wait)
+        self.latencies.append(finished - started)
+        if self.first_started is None or started < self.first_started:
+            self.first_started = started
+        if self.last_finished is None or finished > self.last_finished:
+            self.last_finished = finished
+
+    def throughput(self) -> float:
+        """단계가 일한 구간(첫 시작 ~ 마지막 완료) 기준 초당 처리 건수"""
+        if self.first_started is None or self.last_finished is None or self.last_finished <= self.first_started:
+            return 0.0
+        return self.processed / (self.last_finished - self.first_started)
+
+
+@dataclass
+class ArticleJob:
+    """파이프라인을 따라 흐르는 기사 단위 작업"""
+    url: str
+    press: str
+    category: str
+    raw: Optional[bytes] = None
+    charset: Optional[str] = None
+    details: Optional[Dict] = None
+    simhash: Optional[int] = None
+    enqueued_at: float = 0.0  # 현재 입력 큐에 들어간 시각 (loop.time())
+
+
+@dataclass
+class CrawlPipeline:
+    feeds: Dict[str, Dict]  # {언론사: {"rate_limit": {...}, "feeds": {카테고리: RSS URL}}}
+    config: PipelineConfig = field(default_factory=PipelineConfig)
+    stats: Dict[str, StageStats] = field(default_factory=dict)
+    articles: List[Dict] = field(default_factory=list)
+    saved_count: int = 0
+    rate_limiter: Optional[HostRateLimiter] = None
+    archive: Optional[HtmlArchive] = None
+    # 이번 실행에서 요약 중/완료된 기사 지문 (simhash, url, 요약 결과 future)
+    run_fingerprints: List[Tuple[int, str, asyncio.Future]] = field(default_factory=list)
+    # 피드 조회 결과와 처리에 실패한 URL (실행이 끝난 뒤 워터마크/backlog 반영에 사용)
+    feed_results: List[FeedFetchResult] = field(default_factory=list)
+    failed_urls: Set[str] = field(default_factory=set)
+
+    def __post_init__(self):
+        if self.rate_limiter is None:
+            # 실행마다 새로 만들지 않고 프로세스 공용 제한기 재사용 (조정된 호스트별 속도 유지)
+            self.rate_limiter = get_host_rate_limiter({press: cfg.get("rate_limit", {}) for press, cfg in self.feeds.items()})
+        if self.archive is None:
+            self.archive = get_html_archive()
+        if self.config.replay_date and self.archive is None:
+            # 보관소 설정이 꺼져 있어도 리플레이는 로컬 아카이브 디렉터리에서 읽음
+            self.archive = HtmlArchive(LocalArchiveBackend(CRAWL_ARCHIVE_DIR))
+
+    def _stage_stats(self, name: str) -> StageStats:
+        return self.stats.setdefault(name, StageStats())
+
+    # ==================== discover ====================
+
+    async def _discover_feed(self, session: aiohttp.ClientSession, press: str, category: str, rss_url: str) -> Tuple[str, str, List[str]]:
+        result = await fetch_rss_feed_async(session, rss_url, max_items=self.config.max_items_per_feed)
+        self.feed_results.append(result)
+        return press, category, result.urls
+
+    async def discover(self, session: aiohttp.ClientSession, fetch_q: asyncio.Queue) -> None:
+        """피드 응답이 오는 순서대로 신규 URL만 골라 바로 fetch 큐에 넣음 (느린 피드가 나머지 피드를 막지 않도록)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stats = self._stage_stats("discover")
+        # 이번 실행에서 DB에 이미 있거나 다른 피드에 배정된 URL (여러 카테고리에 나온 URL은 먼저 끝난 피드에 배정)
+        assigned: Set[str] = set()
+        found = 0
+        tasks = [
+            asyncio.create_task(self._discover_feed(session, press, category, rss_url))
+            for press, press_config in self.feeds.items()
+            for category, rss_url in press_config["feeds"].items()
+        ]
+        try:
+            for next_feed in asyncio.as_completed(tasks):
+                try:
+                    press, category, urls = await next_feed
+                except Exception:
+                    continue
+                if get_press_spec(press) is None:
+                    print(f"   ⚠️ 지원하지 않는 언론사: {press}")
+                    continue
+                found += len(urls)
+                # DB 조회는 이벤트 루프를 막지 않도록 스레드에서 피드마다 한 번
+                new_urls = await asyncio.to_thread(filter_unseen_urls, urls, assigned)
+                for url in new_urls:
+                    stats.processed += 1
+                    await fetch_q.put(ArticleJob(url=url, press=press, category=category, enqueued_at=loop.time()))
+        finally:
+            for task in tasks:
+                task.cancel()
+        print(f"🔎 URL 중복 제거: 발견 {found}개 → 신규 {stats.processed}개")
+        stats.first_started, stats.last_finished = started, loop.time()
+
+    async def discover_from_archive(self, fetch_q: asyncio.Queue) -> None:
+        """리플레이 모드: 아카이브 원본을 읽는 대로 fetch 큐에 넣음 (전체 원본을 메모리에 올리지 않음)"""
+        loop = asyncio.get_running_loop()
+        stopped = threading.Event()
+
+        def read_records() -> int:
+            count = 0
+            for record in self.archive.iter_latest(self.config.replay_date):
+                if stopped.is_set():
+                    break
+                count += 1
+                if get_press_spec(record.press) is None:
+                    print(f"   ⚠️ 지원하지 않는 언론사: {record.press}")
+                    continue
+                job = ArticleJob(url=record.url, press=record.press, category=record.category, raw=record.raw, charset=record.charset)
+                # 큐가 가득 차면 자리가 날 때까지 읽기를 멈춤
+                if not put_record(job):
+                    break
+            return count
+
+        def put_record(job: ArticleJob) -> bool:
+            """큐에 넣을 때까지 대기 (파이프라인이 취소되거나 이벤트 루프가 멈추면 포기하고 False)"""
+            try:
+                future = asyncio.run_coroutine_threadsafe(self._put_discovered(fetch_q, job), loop)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘
+                return False
+            while True:
+                try:
+                    future.result(timeout=ARCHIVE_PUT_POLL_SECONDS)
+                    return True
+                except concurrent.futures.CancelledError:
+                    return False
+                except concurrent.futures.TimeoutError:
+                    if stopped.is_set() or not loop.is_running():
+                        future.cancel()
+                        return False
+
+        try:
+            count = await asyncio.to_thread(read_records)
+        finally:
+            stopped.set()
+        print(f"📦 아카이브 리플레이 ({self.config.replay_date}): {count}개 원본")
+
+    async def _put_discovered(self, fetch_q: asyncio.Queue, job: ArticleJob) -> None:
+        self._stage_stats("discover").processed += 1
+        job.enqueued_at = asyncio.get_running_loop().time()
+        await fetch_q.put(job)
+
+    # ==================== 단계별 처리 ====================
+
+    def _archive_page(self, job: ArticleJob) -> None:
+        try:
+            self.archive.save(job.url, job.press, job.category, job.raw, job.charset)
+        except Exception as e:
+            print(f"   ⚠️ 원본 HTML 보관 실패 ({job.url}): {e}")
+
+    async def fetch(self, session: aiohttp.ClientSession, job: ArticleJob) -> Optional[ArticleJob]:
+        if job.raw is not None:
+            # 아카이브에서 읽은 원본은 다시 내려받지 않음
+            return job
+        bucket = self.rate_limiter.bucket(job.url, job.press)
+        await bucket.acquire()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        status = None
+        try:
+            job.raw, job.charset = await fetch_article_page(session, job.url)
+            status = 200
+        except aiohttp.ClientResponseError as e:
+            status = e.status
+            raise
+        finally:
+            bucket.record(status, loop.time() - started)
+        if self.archive is not None:
+            await asyncio.to_thread(self._archive_page, job)
+        return job
+
+    async def parse(self, job: ArticleJob) -> Optional[ArticleJob]:
+        details = await run_parser(parse_article, job.press, job.raw, job.url, job.charset)
+        job.raw = None  # 원본 HTML은 더 이상 필요 없으므로 메모리 해제
+        job.details = build_article_details(details, job.url, job.category, job.press)
+        if not job.details:
+            return None
+        if DEDUP_ENABLED:
+            job.simhash = compute_simhash(job.details['content'])
+            if job.simhash is not None:
+                job.details['content_simhash'] = simhash_to_hex(job.simhash)
+        return job
+
+    def _load_canonical_summary(self, url: str) -> Optional[str]:
+        db = create_crawler_session()
+        try:
+            return get_article_summary_by_url(db, url)
+        finally:
+            db.close()
+
+    def _reuse_summary(self, job: ArticleJob, canonical_url: str, summary: str) -> ArticleJob:
+        job.details['content'] = summary
+        job.details['canonical_url'] = canonical_url
+        self._stage_stats("dedup").processed += 1
+        print(f"   ♻️ 근접 중복 기사, 정본 요약 재사용: {job.url} → {canonical_url}")
+        return job
+
+    async def summarize(self, job: ArticleJob) -> Optional[ArticleJob]:
+        if self.config.replay_date:
+            # 리플레이는 추출 결과만 다시 만들고 외부 API는 호출하지 않음
+            return job
+        if job.simhash is None:
+            job.details = await summarize_article_details(job.details)
+            return job
+        # 같은 실행 안의 근접 중복은 정본 요약이 끝나기를 기다렸다가 재사용
+        for simhash, url, future in self.run_fingerprints:
+            if hamming_distance(job.simhash, simhash) <= DEDUP_MAX_HAMMING:
+                summary = await future
+                if summary:
+                    return self._reuse_summary(job, url, summary)
+                break
+        future = asyncio.get_running_loop().create_future()
+        self.run_fingerprints.append((job.simhash, job.url, future))
+        try:
+            # 이전 실행에서 저장된 최근 기사와 비교
+            match = await asyncio.to_thread(find_near_duplicate, job.simhash)
+            summary = await asyncio.to_thread(self._load_canonical_summary, match[0]) if match else None
+            if summary:
+                self._reuse_summary(job, match[0], summary)
+            else:
+                job.details = await summarize_article_details(job.details)
+            future.set_result(job.details['content'])
+        except BaseException:
+            future.set_result(None)
+            raise
+        return job
+
+    async def _run_stage(
+        self,
+        name: str,
+        in_q: asyncio.Queue,
+        out_q: Optional[asyncio.Queue],
+        handler: Callable[[ArticleJob], Awaitable[Optional[ArticleJob]]],
+    ) -> None:
+        stats = self._stage_stats(name)
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await in_q.get()
+            if job is _STOP:
+                return
+            started = loop.time()
+            try:
+                result = await handler(job)
+            except Exception as e:
+                print(f"   ❌ [{name}] 기사 처리 실패 ({job.url}): {e}")
+                result = None
+            if result is None:
+                stats.failed += 1
+                self.failed_urls.add(job.url)
+                continue
+            stats.processed += 1
+            stats.record(started - job.enqueued_at, started, loop.time())
+            if out_q is not None:
+                result.enqueued_at = loop.time()
+                await out_q.put(result)
+
+    # ==================== persist ====================
+
+    def _save_batch(self, batch: List[Dict]) -> None:
+        db = create_crawler_session()
+        try:
+            result = save_articles_batch(db, batch)
+            self.saved_count += result['saved']
+            print(f"💾 DB 저장: {result['saved']}/{result['total']}개 (중복 {result['duplicate']}개, 실패 {result['failed']}개)")
+            # 저장하지 못한 기사만 재시도 대상으로
+            self.failed_urls.update(result['failed_urls'])
+        except Exception as e:
+            print(f"❌ 데이터베이스 저장 실패: {e}")
+            self.failed_urls.update(article['url'] for article in batch)
+        finally:
+            db.close()
+
+    async def persist(self, in_q: asyncio.Queue) -> None:
+        """요약이 끝난 기사를 모아 batch_size 또는 flush 주기마다 저장"""
+        stats = self._stage_stats("persist")
+        batch: List[Dict] = []
+        # 배치 안 기사별 (큐 대기 시간, 큐에서 꺼낸 시각): 저장이 끝난 시점까지를 처리 시간으로 기록
+        timings: List[Tuple[float, float]] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.persist_flush_seconds
+        stopped = False
+        while not stopped:
+            try:
+                job = await asyncio.wait_for(in_q.get(), timeout=max(0.0, deadline - loop.time()))
+                if job is _STOP:
+                    stopped = True
+                else:
+                    now = loop.time()
+                    self.articles.append(job.details)
+                    batch.append(job.details)
+                    timings.append((now - job.enqueued_at, now))
+                    stats.processed += 1
+            except asyncio.TimeoutError:
+                pass
+            if batch and (stopped or len(batch) >= self.config.persist_batch_size or loop.time() >= deadline):
+                if self.config.save_to_db:
+                    await asyncio.to_thread(self._save_batch, batch)
+                finished = loop.time()
+                for queue_wait, started in timings:
+                    stats.record(queue_wait, started, finished)
+                batch, timings = [], []
+            if loop.time() >= deadline:
+                deadline = loop.time() + self.config.persist_flush_seconds
+
+    # ==================== 실행 ====================
+
+    async def _close_stage(self, tasks: List[asyncio.Task], next_q: asyncio.Queue, next_workers: int) -> None:
+        """현재 단계 워커가 모두 끝나면 다음 단계 워커 수만큼 종료 신호 전달"""
+        await asyncio.gather(*tasks)
+        for _ in range(next_workers):
+            await next_q.put(_STOP)
+
+    def _commit_feeds(self) -> None:
+        for result in self.feed_results:
+            commit_feed_result(result, self.failed_urls)
+        if self.failed_urls:
+            print(f"🔁 처리 실패 {len(self.failed_urls)}개 URL은 다음 실행에서 재시도")
+
+    async def run(self) -> List[Dict]:
+        cfg = self.config
+        fetch_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        parse_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        summarize_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        persist_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        connector = aiohttp.TCPConnector(limit=cfg.fetch_workers, limit_per_host=cfg.limit_per_host)
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            fetch_tasks = [asyncio.create_task(self._run_stage("fetch", fetch_q, parse_q, lambda job: self.fetch(session, job))) for _ in range(cfg.fetch_workers)]
+            parse_tasks = [asyncio.create_task(self._run_stage("parse", parse_q, summarize_q, self.parse)) for _ in range(cfg.parse_workers)]
+            summarize_tasks = [asyncio.create_task(self._run_stage("summarize", summarize_q, persist_q, self.summarize)) for _ in range(cfg.summarize_workers)]
+            persist_task = asyncio.create_task(self.persist(persist_q))
+            try:
+                if cfg.replay_date:
+                    await self.discover_from_archive(fetch_q)
+                else:
+                    await self.discover(session, fetch_q)
+                for _ in range(cfg.fetch_workers):
+                    await fetch_q.put(_STOP)
+                await self._close_stage(fetch_tasks, parse_q, cfg.parse_workers)
+                await self._close_stage(parse_tasks, summarize_q, cfg.summarize_workers)
+                await self._close_stage(summarize_tasks, persist_q, 1)
+                await persist_task
+                # 저장까지 끝난 뒤에만 피드 워터마크 전진 (실패한 기사는 backlog로 재시도)
+                await asyncio.to_thread(self._commit_feeds)
+                if self.rate_limiter.rates():
+                    print(f"🚦 호스트별 최종 요청 속도: " + ", ".join(f"{host}={rate:.2f}/s" for host, rate in self.rate_limiter.rates().items()))
+            except BaseException:
+                for task in fetch_tasks + parse_tasks + summarize_tasks + [persist_task]:
+                    task.cancel()
+                raise
+        return self.articles
+
+
+def filter_unseen_urls(urls: List[str], assigned: Set[str]) -> List[str]:
+    """
+    한 피드의 URL을 한 번의 IN 쿼리로 DB와 대조해 처음 보는 URL만 남김
+    - assigned: 이번 실행에서 이미 처리한 URL (DB에 있던 URL과 반환한 URL을 추가함)
+    """
+    # 순서를 유지하며 피드 안 중복 제거
+    candidates = [url for url in dict.fromkeys(urls) if url not in assigned]
+    if not candidates:
+        return []
+    db = create_crawler_session()
+    try:
+        existing = get_existing_article_urls(db, candidates)
+    except Exception as e:
+        # 조회 실패 시 전체를 신규로 보고 진행 (저장 단계에서 다시 중복 검사)
+        print(f"⚠️ URL 중복 조회 실패, 전체 URL 처리: {e}")
+        existing = set()
+    finally:
+        db.close()
+    assigned.update(candidates)
+    return [url for url in candidates if url not in existing]
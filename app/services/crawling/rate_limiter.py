@@ -0,0 +1,157 @@
+"""언론사 호스트별 적응형(AIMD) 토큰 버킷 요청 속도 제한기
+
+- 버킷은 프로세스에 하나씩 두고(get_host_rate_limiter) 크롤링 실행이 바뀌어도 재사용
+  (429/5xx로 낮춘 속도를 다음 실행에서 다시 최대 속도로 시작하지 않도록)
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass, fields
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from prometheus_client import Counter, Gauge
+
+CRAWL_HOST_RATE = Gauge(
+    "crawl_host_rate_limit",
+    "호스트별 현재 허용 요청 속도 (req/s)",
+    ["host"],
+)
+CRAWL_HOST_THROTTLED = Counter(
+    "crawl_host_throttled_total",
+    "호스트별 속도 감소 횟수",
+    ["host", "reason"],
+)
+
+
+@dataclass
+class RateLimitConfig:
+    """RSS_FEEDS의 언론사별 rate_limit 설정 (지정하지 않은 값은 환경변수 기본값 사용)"""
+    initial_rate: float = float(os.getenv("CRAWL_RATE_INITIAL", 2.0))  # 시작 속도 (req/s)
+    min_rate: float = float(os.getenv("CRAWL_RATE_MIN", 0.2))
+    max_rate: float = float(os.getenv("CRAWL_RATE_MAX", 10.0))
+    burst: float = float(os.getenv("CRAWL_RATE_BURST", 2.0))  # 버킷 최대 토큰 수
+    increase_step: float = float(os.getenv("CRAWL_RATE_INCREASE", 0.5))  # 초당 가산 증가량
+    decrease_factor: float = float(os.getenv("CRAWL_RATE_DECREASE", 0.5))  # 429/5xx/지연 시 곱셈 감소 비율
+    latency_target: float = float(os.getenv("CRAWL_RATE_LATENCY_TARGET", 2.0))  # 이 응답시간(초)을 넘으면 감속
+    decrease_cooldown: float = 1.0  # 동시에 실패한 요청들로 연속 감속되지 않도록 하는 최소 간격(초)
+
+    @classmethod
+    def from_dict(cls, values: Optional[Dict]) -> "RateLimitConfig":
+        allowed = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in (values or {}).items() if k in allowed})
+
+
+class AdaptiveTokenBucket:
+    """토큰 버킷으로 요청 간격을 맞추고, 응답 상태/지연에 따라 속도를 AIMD로 조정"""
+
+    def __init__(self, host: str, config: RateLimitConfig):
+        self.host = host
+        self.config = config
+        self.rate = min(max(config.initial_rate, config.min_rate), config.max_rate)
+        self.tokens = min(1.0, config.burst)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        CRAWL_HOST_RATE.labels(host=host).set(self.rate)
+
+    def reconfigure(self, config: RateLimitConfig) -> None:
+        """설정만 바꾸고 지금까지 조정한 속도는 새 범위 안에서 유지"""
+        self.config = config
+        self.rate = min(max(self.rate, config.min_rate), config.max_rate)
+        self.tokens = min(self.tokens, config.burst)
+        CRAWL_HOST_RATE.labels(host=self.host).set(self.rate)
+
+    def _loop_lock(self) -> asyncio.Lock:
+        # 스케줄러는 실행마다 새 이벤트 루프를 쓰므로 루프가 바뀌면 락만 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.config.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기 (대기 순서대로 처리)"""
+        async with self._loop_lock():
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.config.decrease_cooldown:
+            return
+        self._last_decrease = now
+        old_rate = self.rate
+        self.rate = max(self.config.min_rate, self.rate * self.config.decrease_factor)
+        CRAWL_HOST_THROTTLED.labels(host=self.host, reason=reason).inc()
+        CRAWL_HOST_RATE.labels(host=self.host).set(self.rate)
+        print(f"   🐢 {self.host} 요청 속도 감소 ({reason}): {old_rate:.2f} → {self.rate:.2f} req/s")
+
+    def record(self, status: Optional[int], latency: float) -> None:
+        """
+        요청 결과 반영
+        - status가 None이면 타임아웃/연결 오류
+        - 429/5xx/연결 오류/지연 초과 시 곱셈 감소, 그 외 성공 시 가산 증가
+        """
+        if status is None:
+            self._decrease("error")
+        elif status == 429:
+            self._decrease("429")
+        elif status >= 500:
+            self._decrease("5xx")
+        elif latency > self.config.latency_target:
+            self._decrease("latency")
+        elif status < 400:
+            # 요청 1건당 step/rate만큼 올려 초당 약 increase_step씩 증가
+            self.rate = min(self.config.max_rate, self.rate + self.config.increase_step / self.rate)
+            CRAWL_HOST_RATE.labels(host=self.host).set(self.rate)
+
+
+class HostRateLimiter:
+    """호스트별 버킷 관리 (설정은 기사 URL의 언론사 기준)"""
+
+    def __init__(self, press_configs: Dict[str, Dict]):
+        self._configs: Dict[str, RateLimitConfig] = {}
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+        # 호스트별 버킷을 만든 언론사 (설정이 바뀌면 해당 버킷에 반영)
+        self._bucket_press: Dict[str, str] = {}
+        self.configure(press_configs)
+
+    def configure(self, press_configs: Dict[str, Dict]) -> None:
+        self._configs.update({press: RateLimitConfig.from_dict(values) for press, values in press_configs.items()})
+        for host, press in self._bucket_press.items():
+            config = self._configs.get(press)
+            if config is not None and config != self._buckets[host].config:
+                self._buckets[host].reconfigure(config)
+
+    def bucket(self, url: str, press: str) -> AdaptiveTokenBucket:
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            config = self._configs.get(press) or RateLimitConfig()
+            self._buckets[host] = AdaptiveTokenBucket(host, config)
+            self._bucket_press[host] = press
+        return self._buckets[host]
+
+    def rates(self) -> Dict[str, float]:
+        return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+
+_shared_limiter: Optional[HostRateLimiter] = None
+
+
+def get_host_rate_limiter(press_configs: Dict[str, Dict]) -> HostRateLimiter:
+    """프로세스 공용 제한기 (처음 호출 시 생성, 이후에는 언론사 설정만 갱신해 재사용)"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = HostRateLimiter(press_configs)
+    else:
+        _shared_limiter.configure(press_configs)
+    return _shared_limiter
@@ -1,29 +1,159 @@
+import os
 import aiohttp
 import xml.etree.ElementTree as ET
-from typing import List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+from app.services.crawling.extractor import HEADERS
+from app.services.crawling.feed_state import get_feed_state, save_feed_state, get_feed_backlog, save_feed_backlog
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
+# 피드당 한 번의 실행에서 처리할 최대 기사 수 (나머지는 backlog로 이월)
+RSS_MAX_ITEMS_PER_RUN = int(os.getenv("RSS_MAX_ITEMS_PER_RUN", 20))
+# 처리에 실패한 항목을 backlog로 다시 넣어 시도할 최대 횟수
+RSS_MAX_ATTEMPTS = int(os.getenv("RSS_MAX_ATTEMPTS", 3))
 
-"""RSS 피드에서 기사 URL 목록 가져오기"""
-async def fetch_rss_feed_async(session: aiohttp.ClientSession, rss_url: str) -> List[str]:
+def parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    """RSS pubDate(RFC 822) 또는 ISO 형식 문자열을 timezone-aware datetime으로 변환"""
+    if not value:
+        return None
     try:
-        async with session.get(rss_url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
-            if response.status != 200:
+        dt = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def parse_rss_items(content: str) -> List[Dict]:
+    """RSS 본문에서 link/guid/pubDate 목록 추출 (피드 순서 유지)"""
+    root = ET.fromstring(content)
+    items = []
+    for item in root.findall('.//item'):
+        link = (item.findtext('link') or '').strip()
+        if not link:
+            continue
+        guid = (item.findtext('guid') or '').strip() or link
+        items.append({
+            "link": link,
+            "guid": guid,
+            "pub_date": parse_pub_date(item.findtext('pubDate')),
+        })
+    return items
+
+def select_new_items(items: List[Dict], state: Dict[str, str]) -> List[Dict]:
+    """저장된 워터마크(최신 GUID/pubDate) 이후의 항목만 반환"""
+    watermark = parse_pub_date(state.get("last_pub_date"))
+    new_items = []
+    for item in items:
+        # 피드는 최신순이므로 마지막으로 본 GUID부터는 이미 처리된 항목
+        if item["guid"] == state.get("last_guid"):
+            break
+        if watermark and item["pub_date"] and item["pub_date"] < watermark:
+            continue
+        new_items.append(item)
+    return new_items
+
+def get_newest_item(items: List[Dict]) -> Optional[Dict]:
+    """pubDate 기준 가장 최신 항목 (pubDate가 없으면 피드 첫 항목)"""
+    dated = [item for item in items if item["pub_date"] is not None]
+    if dated:
+        return max(dated, key=lambda item: item["pub_date"])
+    return items[0] if items else None
+
+def _serialize_item(item: Dict) -> Dict:
+    return {
+        "link": item["link"],
+        "guid": item["guid"],
+        "pub_date": item["pub_date"].isoformat() if item["pub_date"] else None,
+    }
+
+def merge_with_backlog(backlog: List[Dict], new_items: List[Dict]) -> List[Dict]:
+    """이월 항목 뒤에 신규 항목을 오래된 순으로 이어 붙인 처리 대기열 (GUID 중복 제거)"""
+    pending = []
+    seen = set()
+    # 피드는 최신순이므로 뒤집어서 오래된 항목부터 처리
+    for item in list(backlog) + [_serialize_item(item) for item in reversed(new_items)]:
+        if item["guid"] in seen:
+            continue
+        seen.add(item["guid"])
+        pending.append(item)
+    return pending
+
+@dataclass
+class FeedFetchResult:
+    """한 피드의 조회 결과 (워터마크/backlog는 파이프라인이 끝난 뒤 commit_feed_result로 반영)"""
+    rss_url: str
+    urls: List[str] = field(default_factory=list)
+    selected: List[Dict] = field(default_factory=list)  # 이번 실행에서 처리할 항목
+    carried: List[Dict] = field(default_factory=list)  # 다음 실행으로 이월할 항목
+    state: Dict[str, Optional[str]] = field(default_factory=dict)  # 반영할 ETag/Last-Modified/워터마크
+    fetched: bool = False  # 조회 실패 시 False (상태를 바꾸지 않음)
+
+"""RSS 피드에서 워터마크 이후의 신규 기사 URL 목록 가져오기 (조건부 요청 + 커서 기반 증분 수집)"""
+async def fetch_rss_feed_async(session: aiohttp.ClientSession, rss_url: str, max_items: Optional[int] = None) -> FeedFetchResult:
+    max_items = max_items or RSS_MAX_ITEMS_PER_RUN
+    result = FeedFetchResult(rss_url=rss_url)
+    try:
+        state = get_feed_state(rss_url)
+        backlog = get_feed_backlog(rss_url)
+        headers = dict(HEADERS)
+        if state.get("etag"):
+            headers['If-None-Match'] = state["etag"]
+        if state.get("last_modified"):
+            headers['If-Modified-Since'] = state["last_modified"]
+        async with session.get(rss_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 304:
+                print(f"   ⏭️ 변경 없음 (304): {rss_url}")
+                content = None
+            elif response.status != 200:
                 raise Exception(f"HTTP {response.status}")
-            content = await response.text()
-            root = ET.fromstring(content)
-            # 기사 URL 목록 추출
-            # 일단 각 URL당 10개만 추출하고 추후 수정 필요
-            urls = []
-            for i, item in enumerate(root.findall('.//item/link')):
-                if i >= 3:
-                    break
-                if item.text:
-                    urls.append(item.text)
-            print(f"   🔍 추출된 URL 개수: {len(urls)}")
-            return urls
+            else:
+                content = await response.text()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        new_items = []
+        if content is not None:
+            new_items = select_new_items(parse_rss_items(content), state)
+            newest = get_newest_item(new_items)
+            result.state = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "last_guid": newest["guid"] if newest else None,
+                "last_pub_date": newest["pub_date"].isoformat() if newest and newest["pub_date"] else None,
+            }
+        result.fetched = True
+        if not new_items and not backlog:
+            return result
+        # 실행당 처리 한도를 넘는 항목은 다음 실행으로 이월
+        pending = merge_with_backlog(backlog, new_items)
+        result.selected, result.carried = pending[:max_items], pending[max_items:]
+        result.urls = [item["link"] for item in result.selected]
+        print(f"   🔍 추출된 URL 개수: {len(result.urls)} (신규 {len(new_items)}개, 이월 {len(result.carried)}개)")
+        return result
     except Exception as e:
         print(f"❌ RSS 피드 요청 실패 {rss_url}: {e}")
-        return []
\ No newline at end of file
+        return FeedFetchResult(rss_url=rss_url)
+
+def commit_feed_result(result: FeedFetchResult, failed_urls: Set[str]) -> None:
+    """
+    파이프라인 저장이 끝난 뒤 피드 워터마크를 전진시키고 backlog를 갱신
+    - 처리에 실패한 항목은 backlog 앞에 다시 넣어 다음 실행에서 재시도 (RSS_MAX_ATTEMPTS회 실패하면 버림)
+    - 반영 전에 프로세스가 죽으면 상태가 그대로라 다음 실행에서 같은 항목을 다시 가져옴 (저장된 기사는 DB 중복 검사로 제외)
+    """
+    if not result.fetched:
+        return
+    retry = []
+    for item in result.selected:
+        if item["link"] not in failed_urls:
+            continue
+        attempts = item.get("attempts", 0) + 1
+        if attempts >= RSS_MAX_ATTEMPTS:
+            print(f"   🗑️ {attempts}회 실패한 항목 제외: {item['link']}")
+            continue
+        retry.append({**item, "attempts": attempts})
+    save_feed_state(result.rss_url, **result.state)
+    save_feed_backlog(result.rss_url, retry + result.carried)
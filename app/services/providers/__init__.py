@@ -0,0 +1,11 @@
+from .config import PROVIDER_MODE
+from .registry import get_llm_provider, get_embedding_provider, get_tts_provider, get_storage_provider, resolve_feeds
+
+__all__ = [
+    'PROVIDER_MODE',
+    'get_llm_provider',
+    'get_embedding_provider',
+    'get_tts_provider',
+    'get_storage_provider',
+    'resolve_feeds'
+]
@@ -0,0 +1,22 @@
+"""외부 연동 provider 설정 (PROVIDER_MODE=live | fake)"""
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# live: OpenAI/Google TTS/GCS/언론사 실서비스, fake: 로컬 대체 구현 (부하 테스트/CI용)
+PROVIDER_MODE = os.getenv("PROVIDER_MODE", "live").lower()
+
+# fake provider 공통 동작 (지연시간 평균/편차 ms, 실패 확률 0~1)
+FAKE_LATENCY_MS = float(os.getenv("FAKE_LATENCY_MS", 50))
+FAKE_LATENCY_JITTER_MS = float(os.getenv("FAKE_LATENCY_JITTER_MS", 20))
+FAKE_FAILURE_RATE = float(os.getenv("FAKE_FAILURE_RATE", 0.0))
+# 난수 시드 (지정하면 지연/실패 패턴이 재현됨)
+FAKE_SEED = os.getenv("FAKE_SEED")
+
+# 로컬 저장소 (GCS 대체)
+FAKE_STORAGE_DIR = os.getenv("FAKE_STORAGE_DIR", "fake_storage")
+FAKE_STORAGE_BASE_URL = os.getenv("FAKE_STORAGE_BASE_URL", "")
+
+# 로컬 언론사 서버 (RSS/기사/이미지)
+FAKE_PUBLISHER_URL = os.getenv("FAKE_PUBLISHER_URL", "http://127.0.0.1:8765")
@@ -0,0 +1,169 @@
+"""로컬 가짜 언론사 서버 (RSS/기사/이미지)
+
+각 언론사 추출 스펙과 같은 구조의 HTML을 결정적으로 생성합니다.
+FAKE_PUBLISHER_ROTATE_SECONDS마다 새 기사 묶음이 RSS에 올라오고, 지연시간/실패율은 FAKE_* 설정을 따릅니다.
+
+실행:
+    python -m app.services.providers.fake_publisher --port 8765
+"""
+import argparse
+import hashlib
+import io
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional
+from xml.sax.saxutils import escape
+from aiohttp import web
+from app.services.providers.fakes import FakeBehavior, FakeProviderError
+
+FAKE_PUBLISHER_ITEMS = int(os.getenv("FAKE_PUBLISHER_ITEMS", 20))
+FAKE_PUBLISHER_ROTATE_SECONDS = int(os.getenv("FAKE_PUBLISHER_ROTATE_SECONDS", 900))
+KST = timezone(timedelta(hours=9))
+
+PRESS_SLUGS = {"한국경제": "hankyung", "SBS뉴스": "sbs", "매일경제": "mbn"}
+
+_SUBJECTS = ["기준금리", "반도체 수출", "부동산 시장", "국회 예산안", "폭염 특보", "코스피", "전기차 판매", "청년 고용", "환율", "프로야구"]
+_SENTENCES = [
+    "{s} 관련 발표가 나오면서 시장의 관심이 집중됐다.",
+    "전문가들은 {s} 흐름이 하반기까지 이어질 가능성이 높다고 분석했다.",
+    "정부는 {s}에 대한 추가 대책을 검토하고 있다고 밝혔다.",
+    "업계 관계자는 {s} 변화가 실적에 미칠 영향을 주시하고 있다고 말했다.",
+    "{s} 지표는 전월 대비 {n}% 변동한 것으로 집계됐다.",
+    "일각에서는 {s}에 대한 우려도 제기됐다.",
+    "이번 조치로 {s} 관련 불확실성이 다소 해소될 것으로 보인다.",
+]
+
+
+def _article_seed(article_id: str) -> random.Random:
+    return random.Random(int.from_bytes(hashlib.sha256(article_id.encode("utf-8")).digest()[:8], "little"))
+
+
+def _article_data(article_id: str) -> Dict:
+    rng = _article_seed(article_id)
+    subject = rng.choice(_SUBJECTS)
+    paragraphs = [
+        " ".join(rng.choice(_SENTENCES).format(s=subject, n=rng.randint(1, 30)) for _ in range(rng.randint(2, 5)))
+        for _ in range(rng.randint(4, 30))
+    ]
+    published = datetime.now(KST).replace(microsecond=0) - timedelta(minutes=rng.randint(0, 60))
+    return {
+        "title": f"{subject} {rng.choice(['급등', '하락', '논란', '전망', '발표', '확대'])}… {article_id[-6:]}",
+        "paragraphs": paragraphs,
+        "reporter": rng.choice(["김", "이", "박", "최", "정"]) + rng.choice(["민수", "지현", "서준", "하은"]),
+        "published": published,
+    }
+
+
+def _render_article(slug: str, article_id: str, base_url: str) -> str:
+    data = _article_data(article_id)
+    body = "".join(f"<p>{escape(p)}</p>" for p in data["paragraphs"])
+    published = data["published"]
+    if slug == "sbs":
+        content = (
+            f'<h1 class="article_main_tit" id="news-title">{escape(data["title"])}</h1>'
+            f'<div class="date_area"><meta itemprop="datePublished" content="{published.isoformat()}"><span>{published:%Y.%m.%d %H:%M}</span></div>'
+            f'<div class="article_img"><img class="mainimg" src="{base_url}/image/sbs/{article_id}.jpg"></div>'
+            f'<div class="text_area" itemprop="articleBody">{body}</div>'
+            f'<div class="reporter"><span itemprop="name">{data["reporter"]}</span></div>'
+        )
+    elif slug == "mbn":
+        content = (
+            f'<h2 class="news_ttl">{escape(data["title"])}</h2>'
+            f'<div class="news_write_info_group"><div class="author"><span class="name">{data["reporter"]} 기자</span></div>'
+            f'<div class="time_area"><dl class="registration"><dd>{published:%Y-%m-%d %H:%M:%S}</dd></dl></div></div>'
+            # 매일경제 스펙은 mk.co.kr이 포함된 이미지 주소만 허용
+            f'<div class="news_cnt_detail_wrap" itemprop="articleBody"><div class="thumb"><img loading="lazy" src="{base_url}/image/mk.co.kr/{article_id}.jpg"></div>{body}</div>'
+        )
+    else:
+        content = (
+            f'<h1 class="headline">{escape(data["title"])}</h1>'
+            f'<span class="txt-date">입력 {published:%Y.%m.%d %H:%M}</span>'
+            f'<div class="article-body"><div class="article-img"><img src="{base_url}/image/hankyung/{article_id}.jpg"></div>{body}</div>'
+            f'<div class="author"><span class="reporter">{data["reporter"]} 기자</span></div>'
+        )
+    return f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{escape(data["title"])}</title></head><body>{content}</body></html>'
+
+
+def _render_rss(slug: str, feed_index: str, generation: int, base_url: str) -> str:
+    generated_at = datetime.fromtimestamp(generation * FAKE_PUBLISHER_ROTATE_SECONDS, timezone.utc)
+    items = []
+    for i in range(FAKE_PUBLISHER_ITEMS):
+        article_id = f"{slug}-{feed_index}-{generation}-{i}"
+        link = f"{base_url}/article/{slug}/{article_id}"
+        pub_date = format_datetime(generated_at - timedelta(seconds=i))
+        items.append(f"<item><title>{article_id}</title><link>{link}</link><guid>{link}</guid><pubDate>{pub_date}</pubDate></item>")
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{slug} {feed_index}</title>{"".join(items)}</channel></rss>'
+
+
+_image_cache: Optional[bytes] = None
+
+
+def _render_image() -> bytes:
+    global _image_cache
+    if _image_cache is None:
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.new("RGB", (640, 360), (90, 120, 160)).save(buffer, format="JPEG", quality=70)
+        _image_cache = buffer.getvalue()
+    return _image_cache
+
+
+@web.middleware
+async def _behavior_middleware(request: web.Request, handler):
+    try:
+        await request.app["behavior"].simulate()
+    except FakeProviderError:
+        return web.Response(status=503, text="fake publisher failure")
+    return await handler(request)
+
+
+async def _rss_handler(request: web.Request) -> web.Response:
+    generation = int(time.time() // FAKE_PUBLISHER_ROTATE_SECONDS)
+    etag = f'"{generation}"'
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304)
+    base_url = str(request.url.origin())
+    body = _render_rss(request.match_info["slug"], request.match_info["index"], generation, base_url)
+    return web.Response(text=body, content_type="application/rss+xml", headers={"ETag": etag})
+
+
+async def _article_handler(request: web.Request) -> web.Response:
+    html = _render_article(request.match_info["slug"], request.match_info["article_id"], str(request.url.origin()))
+    return web.Response(text=html, content_type="text/html", charset="utf-8")
+
+
+async def _image_handler(request: web.Request) -> web.Response:
+    return web.Response(body=_render_image(), content_type="image/jpeg")
+
+
+def create_app(behavior: Optional[FakeBehavior] = None) -> web.Application:
+    app = web.Application(middlewares=[_behavior_middleware])
+    app["behavior"] = behavior or FakeBehavior("publisher")
+    app.router.add_get("/rss/{slug}/{index}", _rss_handler)
+    app.router.add_get("/article/{slug}/{article_id}", _article_handler)
+    app.router.add_get("/image/{path:.*}", _image_handler)
+    return app
+
+
+async def start_fake_publisher(host: str = "127.0.0.1", port: int = 8765, behavior: Optional[FakeBehavior] = None) -> web.AppRunner:
+    """서버를 백그라운드로 시작하고 runner 반환 (종료는 runner.cleanup())"""
+    runner = web.AppRunner(create_app(behavior))
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    print(f"📰 가짜 언론사 서버 시작: http://{host}:{port}")
+    return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 가짜 언론사 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    web.run_app(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""로컬 대체 provider (OpenAI/Google TTS/GCS 없이 지연시간과 실패율만 흉내냄)"""
+import asyncio
+import hashlib
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+import numpy as np
+from app.services.chatgpt.extractive_summarizer import summarize_extractive
+from app.services.providers.config import (
+    FAKE_FAILURE_RATE, FAKE_LATENCY_JITTER_MS, FAKE_LATENCY_MS, FAKE_SEED, FAKE_STORAGE_BASE_URL, FAKE_STORAGE_DIR,
+)
+
+EMBEDDING_DIMENSION = 1536
+# MPEG-1 Layer III, 128kbps, 44.1kHz 프레임 헤더 (프레임당 417바이트, 약 26ms)
+_MP3_FRAME = bytes.fromhex("fffb9064") + bytes(413)
+_MP3_FRAME_SECONDS = 1152 / 44100
+
+
+class FakeProviderError(Exception):
+    """FAKE_FAILURE_RATE에 따라 발생시키는 가짜 장애"""
+
+
+class FakeBehavior:
+    def __init__(self, name: str, latency_ms: float = FAKE_LATENCY_MS, jitter_ms: float = FAKE_LATENCY_JITTER_MS, failure_rate: float = FAKE_FAILURE_RATE):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.random = random.Random(f"{FAKE_SEED}:{name}" if FAKE_SEED is not None else None)
+
+    def _next(self) -> float:
+        if self.random.random() < self.failure_rate:
+            raise FakeProviderError(f"fake {self.name} 장애")
+        return max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+
+    async def simulate(self) -> None:
+        await asyncio.sleep(self._next())
+
+    def simulate_sync(self) -> None:
+        time.sleep(self._next())
+
+
+def _usage(prompt_tokens: int, completion_tokens: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, total_tokens=prompt_tokens + completion_tokens)
+
+
+class FakeLLMProvider:
+    """마지막 사용자 메시지를 로컬 추출 요약한 결과를 응답으로 반환"""
+
+    def __init__(self):
+        self.behavior = FakeBehavior("llm")
+        # 벤치마크에서 실제로 LLM 경로를 탔는지 확인용 (가짜 장애 포함 호출 수)
+        self.calls = 0
+
+    async def chat_completion(self, model: str, messages: List[Dict[str, str]], max_tokens: Optional[int] = None, **kwargs):
+        self.calls += 1
+        await self.behavior.simulate()
+        prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+        content = summarize_extractive(prompt, max_chars=min(500, (max_tokens or 500)))
+        message = SimpleNamespace(role="assistant", content=content)
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, message=message, finish_reason="stop")],
+            usage=_usage(sum(len(m.get("content", "")) for m in messages), len(content)),
+        )
+
+
+class FakeEmbeddingProvider:
+    """텍스트 해시를 시드로 한 결정적 단위 벡터 (같은 텍스트 → 같은 임베딩)"""
+
+    def __init__(self):
+        self.behavior = FakeBehavior("embedding")
+
+    @staticmethod
+    def embed(text: str) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSION)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    async def create_embeddings(self, model: str, inputs: List[str]):
+        await self.behavior.simulate()
+        data = [SimpleNamespace(index=i, embedding=self.embed(text)) for i, text in enumerate(inputs)]
+        return SimpleNamespace(model=model, data=data, usage=_usage(sum(len(t) for t in inputs)))
+
+
+class FakeTTSProvider:
+    """본문 길이에 비례한 길이의 무음 MP3 생성"""
+
+    def __init__(self, seconds_per_char: float = 0.15, max_seconds: float = 120.0):
+        self.behavior = FakeBehavior("tts")
+        self.seconds_per_char = seconds_per_char
+        self.max_seconds = max_seconds
+
+    def synthesize(self, text: str, voice_name: str, speaking_rate: float = 1.0) -> bytes:
+        self.behavior.simulate_sync()
+        seconds = min(self.max_seconds, len(text) * self.seconds_per_char / max(speaking_rate, 0.1))
+        return _MP3_FRAME * max(1, int(seconds / _MP3_FRAME_SECONDS))
+
+
+class LocalStorageProvider:
+    """GCS 대신 로컬 디렉터리에 저장"""
+
+    def __init__(self, root: str = FAKE_STORAGE_DIR, base_url: str = FAKE_STORAGE_BASE_URL):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+        self.behavior = FakeBehavior("storage")
+
+    def upload(self, data: bytes, key: str, content_type: str, cache_control: Optional[str] = None) -> str:
+        self.behavior.simulate_sync()
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return f"{self.base_url}/{key}" if self.base_url else path.resolve().as_uri()
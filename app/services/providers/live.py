@@ -0,0 +1,44 @@
+"""실서비스 provider (OpenAI 게이트웨이, Google TTS, GCS)"""
+import os
+from typing import Dict, List, Optional
+from app.services.chatgpt import llm_gateway
+
+
+class LiveLLMProvider:
+    async def chat_completion(self, model: str, messages: List[Dict[str, str]], max_tokens: Optional[int] = None, **kwargs):
+        return await llm_gateway.chat_completion(model, messages, max_tokens=max_tokens, **kwargs)
+
+
+class LiveEmbeddingProvider:
+    async def create_embeddings(self, model: str, inputs: List[str]):
+        return await llm_gateway.create_embeddings(model, inputs)
+
+
+class GoogleTTSProvider:
+    def __init__(self):
+        from google.cloud import texttospeech
+        self.texttospeech = texttospeech
+        self.client = texttospeech.TextToSpeechClient()
+
+    def synthesize(self, text: str, voice_name: str, speaking_rate: float = 1.0) -> bytes:
+        tts = self.texttospeech
+        response = self.client.synthesize_speech(
+            input=tts.SynthesisInput(text=text),
+            voice=tts.VoiceSelectionParams(language_code="ko-KR", name=voice_name),
+            audio_config=tts.AudioConfig(audio_encoding=tts.AudioEncoding.MP3, speaking_rate=speaking_rate),
+        )
+        return response.audio_content
+
+
+class GCSStorageProvider:
+    def __init__(self, bucket_name: Optional[str] = None):
+        from google.cloud import storage
+        self.bucket_name = bucket_name or os.getenv("GOOGLE_CLOUD_STORAGE_BUCKET")
+        self.bucket = storage.Client().bucket(self.bucket_name)
+
+    def upload(self, data: bytes, key: str, content_type: str, cache_control: Optional[str] = None) -> str:
+        blob = self.bucket.blob(key)
+        if cache_control:
+            blob.cache_control = cache_control
+        blob.upload_from_string(data, content_type=content_type)
+        return f"https://storage.googleapis.com/{self.bucket_name}/{key}"
@@ -0,0 +1,52 @@
+"""PROVIDER_MODE에 맞는 provider 인스턴스 (프로세스당 1개씩, 처음 사용할 때 생성)"""
+import threading
+from typing import Callable, Dict
+from app.services.providers.config import FAKE_PUBLISHER_URL, PROVIDER_MODE
+
+_instances: Dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def _get(kind: str, live_factory: Callable[[], object], fake_factory: Callable[[], object]):
+    with _lock:
+        if kind not in _instances:
+            _instances[kind] = fake_factory() if PROVIDER_MODE == "fake" else live_factory()
+        return _instances[kind]
+
+
+def get_llm_provider():
+    from app.services.providers import fakes, live
+    return _get("llm", live.LiveLLMProvider, fakes.FakeLLMProvider)
+
+
+def get_embedding_provider():
+    from app.services.providers import fakes, live
+    return _get("embedding", live.LiveEmbeddingProvider, fakes.FakeEmbeddingProvider)
+
+
+def get_tts_provider():
+    from app.services.providers import fakes, live
+    return _get("tts", live.GoogleTTSProvider, fakes.FakeTTSProvider)
+
+
+def get_storage_provider():
+    from app.services.providers import fakes, live
+    return _get("storage", live.GCSStorageProvider, fakes.LocalStorageProvider)
+
+
+def resolve_feeds(feeds: Dict[str, Dict]) -> Dict[str, Dict]:
+    """fake 모드에서는 RSS 주소를 로컬 언론사 서버로 바꿈 (언론사/카테고리/속도 제한 설정은 유지)"""
+    if PROVIDER_MODE != "fake":
+        return feeds
+    from app.services.providers.fake_publisher import PRESS_SLUGS
+    resolved = {}
+    for press, press_config in feeds.items():
+        slug = PRESS_SLUGS.get(press, "press")
+        resolved[press] = {
+            **press_config,
+            "feeds": {
+                category: f"{FAKE_PUBLISHER_URL}/rss/{slug}/{index}"
+                for index, category in enumerate(press_config["feeds"])
+            },
+        }
+    return resolved
@@ -2,7 +2,7 @@ from .article_recommender import recommend_articles_for_user_async, index_user_p
 from .text_embedding import get_embedding_async, get_embeddings_batch_async
 from .opensearch import create_news_index, bulk_index_articles, search_similar_articles_by_embedding_async
 from .redis_cache import get_or_cache_keyword_embedding
-from .user_keywords import get_user_keywords
+from .user_keywords import get_user_keywords, get_user_keywords_async
 
 __all__ = [
     # 추천 관련 함수들
@@ -22,5 +22,6 @@ __all__ = [
     'get_or_cache_keyword_embedding',
     
     # 사용자 키워드 관련 함수들
-    'get_user_keywords'
+    'get_user_keywords',
+    'get_user_keywords_async'
 ]
@@ -1,7 +1,16 @@
 from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user_keyword import UserKeyword
 
 def get_user_keywords(db, user_id) -> List[str]:
     """사용자의 관심 키워드 목록을 가져옵니다."""
     keywords = db.query(UserKeyword).filter_by(user_id=user_id, is_deleted=False).all()
-    return [kw.keyword for kw in keywords] 
\ No newline at end of file
+    return [kw.keyword for kw in keywords]
+
+async def get_user_keywords_async(db: AsyncSession, user_id) -> List[str]:
+    """사용자의 관심 키워드 목록을 가져옵니다. (async 엔드포인트용)"""
+    result = await db.execute(
+        select(UserKeyword.keyword).where(UserKeyword.user_id == user_id, UserKeyword.is_deleted == False)
+    )
+    return list(result.scalars())
@@ -1,7 +1,7 @@
 import uuid
 from typing import Dict
 from app.core.database import get_db
-from app.models.news_article import NewsArticle
+from app.models.news_article import NewsArticle, media_status_update
 from app.services.thumbnails.image_downloader import download_image
 from app.services.thumbnails.image_processor import create_thumbnail, image_to_bytes
 from app.services.thumbnails.gcs_uploader import upload_to_gcs
@@ -43,6 +43,7 @@ def process_image_to_gcs(article_id: str) -> Dict:
         
         # DB에 URL 저장
         article.thumbnail_image_url = thumbnail_url
+        article.media_status = media_status_update(thumbnail_ready=True)
         db.commit()
         db.refresh(article)
         
@@ -77,6 +78,7 @@ def apply_fallback_image_direct(article_id: str) -> Dict:
         
         # DB에 fallback URL 저장
         article.thumbnail_image_url = fallback_url
+        article.media_status = media_status_update(thumbnail_ready=True)
         db.commit()
         db.refresh(article)
         
@@ -1,11 +1,11 @@
-import os
+import asyncio
 from typing import Optional
-from google.cloud import texttospeech
+from app.services.providers import get_tts_provider
 from app.services.tts.audio_uploader import AudioUploader
 
 class TTSGenerator:
     def __init__(self):
-        self.tts_client = texttospeech.TextToSpeechClient()
+        self.tts_provider = get_tts_provider()
         self.audio_uploader = AudioUploader()
 
     async def generate_tts_audio(self, text: str, voice_name: str = "ko-KR-Chirp3-HD-Charon", speaking_rate: float = 1.1) -> Optional[str]:
@@ -13,28 +13,13 @@ class TTSGenerator:
         try:
             print(f"TTS 생성 시작: voice={voice_name}, text_length={len(text)}")
             
-            # TTS 요청 설정
-            synthesis_input = texttospeech.SynthesisInput(text=text)
-            voice = texttospeech.VoiceSelectionParams(
-                language_code="ko-KR",
-                name=voice_name
-            )
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=speaking_rate
-            )
-            
-            # Google TTS API 호출
+            # TTS provider 호출 (live: Google TTS, 동기 클라이언트이므로 스레드에서 실행)
             print(f"Google TTS API 호출 중: voice={voice_name}")
-            response = self.tts_client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-            print(f"Google TTS API 응답 성공: voice={voice_name}, audio_size={len(response.audio_content)}")
+            audio_content = await asyncio.to_thread(self.tts_provider.synthesize, text, voice_name, speaking_rate)
+            print(f"Google TTS API 응답 성공: voice={voice_name}, audio_size={len(audio_content)}")
             
             # GCS에 업로드
-            gcs_url = await self.audio_uploader.upload_audio_to_gcs(response.audio_content, voice_name)
+            gcs_url = await self.audio_uploader.upload_audio_to_gcs(audio_content, voice_name)
             if gcs_url:
                 print(f"TTS 생성 완료: voice={voice_name}, url={gcs_url}")
                 return gcs_url
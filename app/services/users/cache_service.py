@@ -5,8 +5,7 @@ from sqlalchemy.orm import Session
 from app.models.user_preferred_press import UserPreferredPress
 from app.models.user_category import UserCategory
 from app.models.user_keyword import UserKeyword
-from app.models.press import Press
-from app.models.category import Category
+from app.core.dimension_cache import category_cache, press_cache
 from app.models.user import User
 
 # Redis 클라이언트 설정
@@ -66,10 +65,7 @@ class UserPreferencesCache:
         ).all()
         press_ids = [rel.press_id for rel in press_relations]
         
-        press_names = []
-        if press_ids:
-            presses = db.query(Press).filter(Press.id.in_(press_ids)).all()
-            press_names = [press.press_name for press in presses]
+        press_names = press_cache.get_names(db, press_ids) if press_ids else []
         
         # 캐시에 저장
         cls._set_cache(cache_key, press_names)
@@ -91,10 +87,7 @@ class UserPreferencesCache:
         ).all()
         category_ids = [rel.category_id for rel in category_relations]
         
-        category_names = []
-        if category_ids:
-            categories = db.query(Category).filter(Category.id.in_(category_ids)).all()
-            category_names = [category.category_name for category in categories]
+        category_names = category_cache.get_names(db, category_ids) if category_ids else []
         
         # 캐시에 저장
         cls._set_cache(cache_key, category_names)
@@ -0,0 +1,20 @@
+"""기사 목록 키셋 페이지네이션 커서 ((published_at, id)를 URL-safe base64로 인코딩)"""
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(published_at: datetime, article_id: UUID) -> str:
+    raw = f"{published_at.isoformat()}|{article_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """잘못된 커서면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        published_at, article_id = raw.split("|", 1)
+        return datetime.fromisoformat(published_at), UUID(article_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
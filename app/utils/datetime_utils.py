@@ -1,8 +1,20 @@
 import datetime
+from typing import Optional, Tuple
 
 def get_today_range_kst():
     KST = datetime.timezone(datetime.timedelta(hours=9))
     now = datetime.datetime.now(KST)
     start = now - datetime.timedelta(hours=12)
     end = now
-    return start, end
\ No newline at end of file
+    return start, end
+
+def get_bucketed_range_kst(hours: int, bucket_seconds: int, now: Optional[datetime.datetime] = None) -> Tuple[int, datetime.datetime, datetime.datetime]:
+    """
+    now가 속한 bucket_seconds 버킷 번호와 (버킷 끝 - hours, 버킷 끝) 범위
+    - 같은 버킷 안의 요청은 모두 같은 범위를 사용하므로 결과를 버킷 단위로 캐싱 가능
+    """
+    KST = datetime.timezone(datetime.timedelta(hours=9))
+    now = now or datetime.datetime.now(KST)
+    bucket = int(now.timestamp()) // bucket_seconds
+    end = datetime.datetime.fromtimestamp((bucket + 1) * bucket_seconds, KST)
+    return bucket, end - datetime.timedelta(hours=hours), end
@@ -1,19 +1,52 @@
 import asyncio
+import os
+import socket
 from apscheduler.schedulers.background import BackgroundScheduler
+from app.core.redis_client import get_redis_client
 from app.services.crawling.main_crawler import scrape_all_articles_async
 
+# uvicorn 워커마다 스케줄러가 뜨므로 Redis 키로 크롤러를 실행할 워커 하나만 고름
+# (리더가 죽으면 CRAWLER_LEADER_TTL초 뒤 다른 워커가 이어받음, 크롤러 DB 풀도 리더 워커에만 생김)
+CRAWLER_LEADER_KEY = "crawler:leader"
+CRAWLER_LEADER_TTL = int(os.getenv("CRAWLER_LEADER_TTL", 60))
+# 키 값이 내 것일 때만 만료 시간 연장
+_RENEW_LEADER_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def hold_crawler_leadership() -> bool:
+    """리더가 없으면 차지하고, 이미 리더면 만료 시간 연장 (Redis 장애 시 False → 이번 크롤링 생략)"""
+    redis_client = get_redis_client()
+    token = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        if redis_client.set(CRAWLER_LEADER_KEY, token, nx=True, ex=CRAWLER_LEADER_TTL):
+            print(f"👑 크롤러 실행 워커로 선출: {token}")
+            return True
+        return bool(redis_client.eval(_RENEW_LEADER_SCRIPT, 1, CRAWLER_LEADER_KEY, token, CRAWLER_LEADER_TTL))
+    except Exception as e:
+        print(f"⚠️ 크롤러 리더 확인 실패: {e}")
+        return False
+
 
 def start_scheduler(app):
     scheduler = BackgroundScheduler()
 
     def run_crawling():
+        if not hold_crawler_leadership():
+            return
         # 비동기 함수는 이벤트 루프에서 실행
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         loop.run_until_complete(scrape_all_articles_async(max_concurrent=10, save_to_db=True))
         loop.close()
 
+    # 크롤링 중에도 리더를 유지하도록 TTL보다 짧은 주기로 연장
+    scheduler.add_job(hold_crawler_leadership, 'interval', seconds=max(1, CRAWLER_LEADER_TTL // 3))
     # 15분마다 실행
     scheduler.add_job(run_crawling, 'interval', minutes=15)
     scheduler.start()
-    app.state.scheduler = scheduler
\ No newline at end of file
+    app.state.scheduler = scheduler
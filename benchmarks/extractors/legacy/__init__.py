@@ -0,0 +1,10 @@
+"""레지스트리 도입 전 언론사별 추출기 (golden을 테스트 대상 엔진과 독립적으로 만들기 위해 보관)"""
+from benchmarks.extractors.legacy.hankyung import parse_hankyung_article
+from benchmarks.extractors.legacy.mbn import parse_mbn_article
+from benchmarks.extractors.legacy.sbs import parse_sbs_article
+
+LEGACY_PARSERS = {
+    "한국경제": parse_hankyung_article,
+    "매일경제": parse_mbn_article,
+    "SBS뉴스": parse_sbs_article,
+}
@@ -0,0 +1,91 @@
+"""레지스트리 도입 전 매일경제 BeautifulSoup 추출기 (golden 생성용, 파싱 부분만 원본 그대로)"""
+from bs4 import BeautifulSoup
+import re
+from typing import Dict, Optional
+
+SELECTORS = {
+    "title": ['h2.news_ttl', 'h1.news_ttl', '.news_ttl'],
+    "image": ['img[loading="lazy"]', '.thumb img', '.news_cnt_detail_wrap img'],
+    "content": ['div.news_cnt_detail_wrap[itemprop="articleBody"]', '.news_cnt_detail_wrap'],
+    "reporter": ['.news_write_info_group .author .name', '.author .name', '.reporter'],
+    "published_time": ['.news_write_info_group .time_area .registration dd', '.time_area dd', '.registration dd'],
+}
+
+def get_image_url(soup: BeautifulSoup) -> Optional[str]:
+    """MBN 뉴스 이미지 URL 추출"""
+    for selector in SELECTORS['image']:
+        img_tags = soup.select(selector)
+        for img_tag in img_tags:
+            src = img_tag.get('src')
+            if src and isinstance(src, str) and src.strip():
+                # MBN 이미지 도메인 확인
+                if 'mk.co.kr' in src or 'pimg.mk.co.kr' in src:
+                    if src.startswith('//'):
+                        return f'https:{src}'
+                    elif src.startswith('http'):
+                        return src
+                    else:
+                        return f'https://www.mk.co.kr{src}' if src.startswith('/') else src
+    return None
+
+def select_one_text(soup: BeautifulSoup, selectors) -> Optional[str]:
+    """여러 셀렉터 중 하나를 선택하여 텍스트 반환"""
+    for sel in selectors:
+        el = soup.select_one(sel)
+        if el:
+            return el.get_text(strip=True)
+    return None
+
+def get_content_text(soup: BeautifulSoup) -> Optional[str]:
+    """MBN 뉴스 본문 텍스트 추출"""
+    content_div = soup.select_one(SELECTORS['content'][0])  # 첫 번째 셀렉터 사용
+    if content_div:
+        # 광고 및 불필요한 요소 제거
+        for tag in content_div(['script', 'style', '.ad_wrap', 'iframe']):
+            tag.decompose()
+        
+        # 텍스트 추출
+        text = content_div.get_text(separator=' ', strip=True)
+        
+        # 불필요한 텍스트 정리
+        if text:
+            # 광고 관련 텍스트 제거
+            text = re.sub(r'MC_article_billboard_\d+', '', text)
+            text = re.sub(r'google_ads_iframe.*', '', text)
+            text = re.sub(r'Advertisement', '', text)
+            text = re.sub(r'3rd party ad content', '', text)
+            
+            # 연속된 공백 정리
+            text = re.sub(r'\s+', ' ', text).strip()
+            
+            return text if len(text) > 20 else None
+    return None
+
+def get_reporter_name(soup: BeautifulSoup) -> Optional[str]:
+    """MBN 뉴스 기자명 추출"""
+    text = select_one_text(soup, SELECTORS['reporter'])
+    if text:
+        # "기자" 텍스트 제거
+        text = text.replace('기자', '').strip()
+        return text if text else None
+    return None
+
+"""MBN 뉴스 발행시간 추출"""
+def get_published_time(soup: BeautifulSoup) -> Optional[str]:
+
+    return select_one_text(soup, SELECTORS['published_time'])
+
+"""MBN 뉴스 기사 HTML 파싱 (파싱 프로세스 풀에서 실행)"""
+def parse_mbn_article(raw: bytes, url: str, charset: Optional[str] = None) -> Dict[str, Optional[str]]:
+    soup = BeautifulSoup(raw, 'lxml', from_encoding=charset)
+    
+    # 제목 추출
+    title = select_one_text(soup, SELECTORS['title'])
+    return {
+        "title": title,
+        "url": url,
+        "image_url": get_image_url(soup),
+        "content": get_content_text(soup),
+        "published_time": get_published_time(soup),
+        "reporter_name": get_reporter_name(soup),
+    }
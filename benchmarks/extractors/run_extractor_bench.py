@@ -0,0 +1,215 @@
+"""언론사 기사 추출기 오프라인 벤치마크
+
+fixtures/의 녹화된 기사 HTML로 parse_article(파싱 → 셀렉터 → 정리)을 반복 실행해
+처리량(pages/sec)과 페이지당 메모리 할당량을 측정하고, golden/의 기대 결과와 비교합니다.
+네트워크/DB 없이 실행됩니다.
+
+- fixture 메타의 source: archive(크롤러 아카이브에서 녹화한 실제 페이지) / synthetic(구조만 흉내 낸 합성 페이지)
+  실제 페이지 fixture가 없으면 결과에 경고를 출력하므로 --record-from-archive로 녹화해 추가
+- golden은 레지스트리 도입 전 BeautifulSoup 추출기(legacy/)로 생성 (--golden-from-legacy)
+  의도적으로 바꾼 필드는 fixture 메타 legacy_overrides에 {필드: 사유}로 적어야 현재 결과를 golden으로 씀
+  새 엔진 결과로 golden을 만들면 회귀를 잡지 못하므로 --update-golden은 의도적으로 동작을 바꿀 때만 사용
+
+사용 예 (저장소 루트에서):
+    python -m benchmarks.extractors.run_extractor_bench
+    python -m benchmarks.extractors.run_extractor_bench --iterations 500 --output bench.json
+    python -m benchmarks.extractors.run_extractor_bench --record-from-archive 2025-08-01 --limit 5
+    python -m benchmarks.extractors.run_extractor_bench --golden-from-legacy --filter 20250801
+    python -m benchmarks.extractors.run_extractor_bench --source archive
+"""
+import argparse
+import json
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import app.services.crawling  # noqa: F401  언론사 스펙 등록
+from app.services.crawling.extractor import PRESS_REGISTRY, parse_article
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURE_DIR = BENCH_DIR / "fixtures"
+GOLDEN_DIR = BENCH_DIR / "golden"
+FIELDS = ("title", "image_url", "content", "published_time", "reporter_name")
+
+
+def load_fixtures(name_filter: Optional[str] = None, source: Optional[str] = None) -> List[Dict]:
+    fixtures = []
+    for meta_path in sorted(FIXTURE_DIR.glob("*.json")):
+        name = meta_path.stem
+        if name_filter and not re.search(name_filter, name):
+            continue
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if source and meta.get("source", "synthetic") != source:
+            continue
+        fixtures.append({
+            "name": name,
+            "press": meta["press"],
+            "url": meta["url"],
+            "charset": meta.get("charset"),
+            "source": meta.get("source", "synthetic"),
+            "legacy_overrides": meta.get("legacy_overrides", {}),
+            "raw": (FIXTURE_DIR / f"{name}.html").read_bytes(),
+        })
+    return fixtures
+
+
+def extract(fixture: Dict) -> Dict:
+    return parse_article(fixture["press"], fixture["raw"], fixture["url"], fixture["charset"])
+
+
+def check_golden(fixture: Dict, result: Dict) -> List[str]:
+    """golden과 다른 필드 목록 (golden 파일이 없으면 ['<missing golden>'])"""
+    golden_path = GOLDEN_DIR / f"{fixture['name']}.json"
+    if not golden_path.exists():
+        return ["<missing golden>"]
+    expected = json.loads(golden_path.read_text(encoding="utf-8"))
+    return [f for f in FIELDS if result.get(f) != expected.get(f)]
+
+
+def write_golden(fixture: Dict, result: Dict) -> None:
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    golden = {f: result.get(f) for f in FIELDS}
+    (GOLDEN_DIR / f"{fixture['name']}.json").write_text(
+        json.dumps(golden, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def legacy_golden(fixture: Dict, result: Dict) -> Dict:
+    """
+    레지스트리 도입 전 추출기 결과로 만든 golden
+    - fixture 메타의 legacy_overrides에 사유와 함께 적은 필드만 현재 엔진 결과 사용 (의도한 동작 변경)
+    """
+    from benchmarks.extractors.legacy import LEGACY_PARSERS
+    golden = LEGACY_PARSERS[fixture["press"]](fixture["raw"], fixture["url"], fixture["charset"])
+    for field in fixture["legacy_overrides"]:
+        golden[field] = result.get(field)
+    return golden
+
+
+def measure_throughput(fixture: Dict, iterations: int, warmup: int) -> Dict:
+    for _ in range(warmup):
+        extract(fixture)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        extract(fixture)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    total = sum(timings)
+    return {
+        "pages_per_sec": iterations / total if total else 0.0,
+        "mean_ms": total / iterations * 1000,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+    }
+
+
+def measure_allocations(fixture: Dict, iterations: int) -> Dict:
+    """
+    tracemalloc 기준 페이지당 메모리 할당량
+    - peak: 추출 1회 중 최대 할당량 평균 (파이썬 할당자 기준, lxml 내부 C 할당은 제외)
+    - retained: 반복 후에도 해제되지 않은 양 (누수 확인용)
+    """
+    extract(fixture)
+    tracemalloc.start()
+    try:
+        peaks = []
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            extract(fixture)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kib_per_page": sum(peaks) / len(peaks) / 1024,
+        "retained_kib_per_page": max(0, retained) / iterations / 1024,
+    }
+
+
+def record_from_archive(date: str, limit: int) -> None:
+    """HTML 아카이브의 실제 원본을 fixture로 저장 (golden은 --golden-from-legacy로 생성)"""
+    from app.services.crawling.html_archive import CRAWL_ARCHIVE_DIR, HtmlArchive, LocalArchiveBackend, get_html_archive
+
+    archive = get_html_archive() or HtmlArchive(LocalArchiveBackend(CRAWL_ARCHIVE_DIR))
+    per_press: Dict[str, int] = {}
+    slugs = {"한국경제": "hankyung", "SBS뉴스": "sbs", "매일경제": "mbn"}
+    for record in archive.iter_latest(date):
+        count = per_press.get(record.press, 0)
+        if record.press not in PRESS_REGISTRY or count >= limit:
+            continue
+        per_press[record.press] = count + 1
+        name = f"{slugs.get(record.press, 'press')}_{date.replace('-', '')}_{count + 1}"
+        (FIXTURE_DIR / f"{name}.html").write_bytes(record.raw)
+        meta = {"press": record.press, "url": record.url, "charset": record.charset, "source": "archive", "fetched_at": record.fetched_at}
+        (FIXTURE_DIR / f"{name}.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"📼 fixture 저장: {name} ({record.url})")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="언론사 기사 추출기 오프라인 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="fixture당 측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--filter", help="fixture 이름 정규식")
+    parser.add_argument("--update-golden", action="store_true", help="현재 추출 결과로 golden 갱신 (의도적으로 동작을 바꿀 때만)")
+    parser.add_argument("--golden-from-legacy", action="store_true", help="레지스트리 도입 전 추출기 결과로 golden 생성")
+    parser.add_argument("--source", choices=("archive", "synthetic"), help="fixture 출처로 필터")
+    parser.add_argument("--record-from-archive", metavar="YYYY-MM-DD", help="아카이브 원본을 fixture로 저장")
+    parser.add_argument("--limit", type=int, default=3, help="--record-from-archive 사용 시 언론사별 저장 개수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    if args.record_from_archive:
+        record_from_archive(args.record_from_archive, args.limit)
+        return 0
+
+    fixtures = load_fixtures(args.filter, args.source)
+    if not fixtures:
+        print("⚠️ fixture가 없습니다.")
+        return 1
+
+    if not any(f["source"] == "archive" for f in fixtures):
+        print("⚠️ 실제 페이지(source=archive) fixture가 없어 합성 페이지로만 측정합니다. --record-from-archive로 녹화해 추가하세요.")
+
+    results = []
+    mismatched = 0
+    print(f"{'fixture':<28}{'press':<10}{'pages/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'alloc KiB':>10}  golden")
+    for fixture in fixtures:
+        result = extract(fixture)
+        if args.golden_from_legacy:
+            write_golden(fixture, legacy_golden(fixture, result))
+            diff = check_golden(fixture, result)
+        elif args.update_golden:
+            write_golden(fixture, result)
+            diff = []
+        else:
+            diff = check_golden(fixture, result)
+        mismatched += bool(diff)
+        row = {
+            "fixture": fixture["name"],
+            "press": fixture["press"],
+            "source": fixture["source"],
+            "bytes": len(fixture["raw"]),
+            **measure_throughput(fixture, args.iterations, args.warmup),
+            **measure_allocations(fixture, max(1, args.iterations // 10)),
+            "golden_mismatch": diff,
+        }
+        results.append(row)
+        status = "ok" if not diff else "DIFF " + ",".join(diff)
+        print(f"{row['fixture']:<28}{row['press']:<10}{row['pages_per_sec']:>10.1f}{row['p50_ms']:>9.2f}"
+              f"{row['p99_ms']:>9.2f}{row['alloc_peak_kib_per_page']:>10.1f}  {status}")
+
+    avg_pages = sum(r["pages_per_sec"] for r in results) / len(results)
+    print(f"\n평균 처리량: {avg_pages:.1f} pages/s, golden 불일치: {mismatched}/{len(results)}")
+    if args.output:
+        Path(args.output).write_text(json.dumps({"results": results}, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""수집 파이프라인 end-to-end 처리량 벤치마크
+
+가짜 provider(PROVIDER_MODE=fake)와 로컬 가짜 언론사 서버로 합성 피드를 만들고
+scrape_all_articles_async(discover → fetch → parse → summarize → persist)를 실행한 뒤,
+저장 단계에서 발행된 Celery 태스크(TTS, 썸네일, 정본 미디어 복사)를 프로세스 안의 워커로 처리하고
+저장된 기사를 임베딩(index)합니다.
+단계별 처리량(건/초), 처리 시간 p50/p99, 큐 대기 시간 p50/p99를 JSON으로 저장합니다.
+
+필요한 서비스: DB_URL의 Postgres (벤치마크 전용 DB 권장), Redis (없으면 캐시/중복 색인만 건너뜀)
+Celery 브로커는 메모리 브로커로 바꿔 실행하므로 RabbitMQ는 필요 없습니다.
+
+사용 예 (저장소 루트에서):
+    docker compose up -d db redis
+    python -m benchmarks.ingest.run_ingest_bench --items-per-feed 20
+    python -m benchmarks.ingest.run_ingest_bench --presses 한국경제 --feeds-per-press 3 --fake-latency-ms 200
+    python -m benchmarks.ingest.run_ingest_bench --compare benchmarks/ingest/results/abc1234.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+# Celery 태스크 이름 → 벤치마크 단계 이름
+CELERY_STAGES = {
+    "app.celery_app.generate_tts_audio_async": "tts",
+    "app.celery_app.generate_tts_audio_batch": "tts",
+    "app.celery_app.process_image_async": "thumbnail",
+    "app.celery_app.process_image_batch": "thumbnail",
+    "app.celery_app.copy_canonical_media_async": "copy_media",
+}
+STAGE_ORDER = ["discover", "fetch", "parse", "summarize", "persist", "tts", "thumbnail", "copy_media", "index"]
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """app 모듈을 import하기 전에 가짜 provider/언론사 서버 설정을 환경변수로 지정"""
+    os.environ["PROVIDER_MODE"] = "fake"
+    os.environ["FAKE_PUBLISHER_URL"] = f"http://127.0.0.1:{args.publisher_port}"
+    os.environ["FAKE_PUBLISHER_ITEMS"] = str(args.items_per_feed)
+    # 실행마다 새 기사 URL이 나오도록 RSS 묶음을 매초 교체
+    os.environ["FAKE_PUBLISHER_ROTATE_SECONDS"] = "1"
+    os.environ["FAKE_LATENCY_MS"] = str(args.fake_latency_ms)
+    os.environ["FAKE_LATENCY_JITTER_MS"] = str(args.fake_jitter_ms)
+    os.environ["FAKE_FAILURE_RATE"] = str(args.fake_failure_rate)
+    os.environ["FAKE_SEED"] = str(args.seed)
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+
+def build_feeds(presses: Optional[List[str]], feeds_per_press: Optional[int]) -> Dict[str, Dict]:
+    from app.services.crawling.main_crawler import RSS_FEEDS
+    feeds = {}
+    for press, press_config in RSS_FEEDS.items():
+        if presses and press not in presses:
+            continue
+        categories = list(press_config["feeds"].items())[:feeds_per_press]
+        feeds[press] = {**press_config, "feeds": dict(categories)}
+    return feeds
+
+
+def summarize_stage(stats) -> Dict:
+    """StageStats → JSON용 dict (시간 단위 ms)"""
+    from app.services.crawling.pipeline import percentile
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 2) if value is not None else None
+
+    return {
+        "processed": stats.processed,
+        "failed": stats.failed,
+        "throughput_per_sec": round(stats.throughput(), 3),
+        "latency_p50_ms": ms(percentile(stats.latencies, 50)),
+        "latency_p99_ms": ms(percentile(stats.latencies, 99)),
+        "queue_wait_p50_ms": ms(percentile(stats.queue_waits, 50)),
+        "queue_wait_p99_ms": ms(percentile(stats.queue_waits, 99)),
+    }
+
+
+class CeleryStageRecorder:
+    """Celery 시그널로 태스크별 큐 대기(발행 → 시작)와 처리 시간을 StageStats에 기록"""
+
+    def __init__(self):
+        from app.services.crawling.pipeline import StageStats
+        self.stats = {stage: StageStats() for stage in CELERY_STAGES.values()}
+        self.published: Dict[str, float] = {}
+        self.started: Dict[str, float] = {}
+        self.finished: set = set()
+        self.lock = threading.Lock()
+
+    def connect(self) -> None:
+        from celery.signals import before_task_publish, task_postrun, task_prerun
+        before_task_publish.connect(self.on_publish, weak=False)
+        task_prerun.connect(self.on_prerun, weak=False)
+        task_postrun.connect(self.on_postrun, weak=False)
+
+    def on_publish(self, sender=None, headers=None, **kwargs) -> None:
+        if sender in CELERY_STAGES and headers:
+            with self.lock:
+                # 재시도는 같은 태스크 ID로 다시 발행되므로 마지막 발행 시각 기준으로 대기 시간 계산
+                self.published[headers["id"]] = time.monotonic()
+
+    def on_prerun(self, task_id=None, task=None, **kwargs) -> None:
+        if task is not None and task.name in CELERY_STAGES:
+            with self.lock:
+                self.started[task_id] = time.monotonic()
+
+    def on_postrun(self, task_id=None, task=None, retval=None, state=None, **kwargs) -> None:
+        if task is None or task.name not in CELERY_STAGES or state == "RETRY":
+            return
+        now = time.monotonic()
+        with self.lock:
+            stats = self.stats[CELERY_STAGES[task.name]]
+            started = self.started.pop(task_id, now)
+            retval = retval if isinstance(retval, dict) else {}
+            if "succeeded" in retval:
+                # 배치 태스크: 기사별 성공/실패 수, 처리 시간은 배치 안 기사 모두 같은 값으로 기록
+                succeeded, failed = retval["succeeded"], retval.get("failed", 0)
+            else:
+                succeeded, failed = (1, 0) if retval.get("success") else (0, 1)
+            stats.processed += succeeded
+            stats.failed += failed
+            for _ in range(succeeded):
+                stats.record(started - self.published.get(task_id, started), started, now)
+            self.finished.add(task_id)
+
+    def pending(self) -> int:
+        with self.lock:
+            return len(set(self.published) - self.finished)
+
+
+def start_celery_worker(concurrency: int):
+    """Celery를 메모리 브로커로 바꾸고 프로세스 안에서 tts/image/default 큐를 모두 처리하는 워커 시작"""
+    from celery.contrib.testing.worker import start_worker
+    from app.celery_app import celery_app
+    celery_app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        broker_transport_options={"polling_interval": 0.01},
+        task_ignore_result=True,
+    )
+    return start_worker(celery_app, pool="threads", concurrency=concurrency, perform_ping_check=False, loglevel="WARNING", shutdown_timeout=30)
+
+
+def fake_llm_calls() -> int:
+    from app.services.providers import get_llm_provider
+    from app.services.providers.fakes import FakeLLMProvider
+    provider = get_llm_provider()
+    if not isinstance(provider, FakeLLMProvider):
+        raise RuntimeError(f"PROVIDER_MODE=fake인데 LLM provider가 {type(provider).__name__}입니다")
+    return provider.calls
+
+
+def wait_for_celery(recorder: CeleryStageRecorder, timeout: float) -> int:
+    deadline = time.monotonic() + timeout
+    while recorder.pending() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    return recorder.pending()
+
+
+async def run_index_stage(urls: List[str], batch_size: int, use_opensearch: bool):
+    """저장된 기사를 batch_size씩 임베딩 (use_opensearch면 OpenSearch bulk 인덱싱까지)"""
+    from app.core.database import SessionLocal
+    from app.models.news_article import NewsArticle
+    from app.services.crawling.pipeline import StageStats
+    from app.services.recommend.text_embedding import get_embeddings_batch_async
+    stats = StageStats()
+    db = SessionLocal()
+    try:
+        articles = db.query(NewsArticle).filter(NewsArticle.url.in_(urls)).all() if urls else []
+    finally:
+        db.close()
+    loop = asyncio.get_running_loop()
+    for i in range(0, len(articles), batch_size):
+        batch = articles[i:i + batch_size]
+        started = loop.time()
+        try:
+            if use_opensearch:
+                from app.services.recommend.opensearch import bulk_index_articles
+                await bulk_index_articles(batch)
+            else:
+                await get_embeddings_batch_async([f"{a.title} {a.summary_text}" for a in batch])
+        except Exception as e:
+            print(f"❌ 인덱싱 실패 ({len(batch)}개): {e}")
+            stats.failed += len(batch)
+            continue
+        finished = loop.time()
+        stats.processed += len(batch)
+        # 배치 안 기사는 같은 처리 시간을 가진 것으로 기록
+        for _ in batch:
+            stats.record(0.0, started, finished)
+    return stats
+
+
+async def run_crawl(args: argparse.Namespace, feeds: Dict[str, Dict], stats: Dict) -> List[Dict]:
+    from app.services.crawling.main_crawler import scrape_all_articles_async
+    from app.services.providers.fake_publisher import start_fake_publisher
+    runner = await start_fake_publisher(port=args.publisher_port)
+    try:
+        return await scrape_all_articles_async(max_concurrent=args.fetch_workers, save_to_db=True, feeds=feeds, stats=stats)
+    finally:
+        await runner.cleanup()
+
+
+def prepare_database() -> None:
+    import app.models  # noqa: F401  모든 테이블 등록
+    from app.core.database import Base, engine
+    from app.core.schema_upgrades import apply_schema_upgrades
+    Base.metadata.create_all(bind=engine)
+    apply_schema_upgrades(engine)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=BENCH_DIR).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict:
+    configure_environment(args)
+    prepare_database()
+    feeds = build_feeds(args.presses, args.feeds_per_press)
+    feed_count = sum(len(cfg["feeds"]) for cfg in feeds.values())
+    print(f"🧪 합성 피드 {feed_count}개 × {args.items_per_feed}개 기사 (가짜 지연 {args.fake_latency_ms}ms, 실패율 {args.fake_failure_rate})")
+
+    recorder = CeleryStageRecorder()
+    recorder.connect()
+    pipeline_stats: Dict = {}
+    started = time.monotonic()
+    with start_celery_worker(args.celery_concurrency):
+        articles = asyncio.run(run_crawl(args, feeds, pipeline_stats))
+        crawl_seconds = time.monotonic() - started
+        pending = wait_for_celery(recorder, args.drain_timeout)
+        if pending:
+            print(f"⚠️ {args.drain_timeout:.0f}초 안에 끝나지 않은 Celery 태스크 {pending}개")
+    index_stats = asyncio.run(run_index_stage([a["url"] for a in articles], args.index_batch_size, args.opensearch))
+    llm_calls = fake_llm_calls()
+    summarized = pipeline_stats["summarize"].processed if "summarize" in pipeline_stats else 0
+    if summarized and not llm_calls:
+        # 요약이 전부 추출 요약 fallback으로 처리됨 → 요약 단계 수치가 가짜 LLM 설정을 반영하지 않음
+        raise RuntimeError(f"요약 {summarized}건 중 가짜 LLM 호출이 0건입니다 (LLM 경로를 타지 않음)")
+    total_seconds = time.monotonic() - started
+
+    stages = {name: summarize_stage(s) for name, s in {**pipeline_stats, **recorder.stats, "index": index_stats}.items()}
+    stages = {name: stages[name] for name in STAGE_ORDER if name in stages}
+    active = {name: s for name, s in stages.items() if s["processed"] and name != "discover"}
+    return {
+        "benchmark": "ingest",
+        "revision": git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "params": {
+            "presses": list(feeds),
+            "feeds": feed_count,
+            "items_per_feed": args.items_per_feed,
+            "fetch_workers": args.fetch_workers,
+            "celery_concurrency": args.celery_concurrency,
+            "fake_latency_ms": args.fake_latency_ms,
+            "fake_jitter_ms": args.fake_jitter_ms,
+            "fake_failure_rate": args.fake_failure_rate,
+            "index_batch_size": args.index_batch_size,
+            "opensearch": args.opensearch,
+        },
+        "end_to_end": {
+            "articles": len(articles),
+            "crawl_seconds": round(crawl_seconds, 3),
+            "total_seconds": round(total_seconds, 3),
+            "articles_per_minute": round(len(articles) / total_seconds * 60, 2) if total_seconds else 0.0,
+            "celery_pending": pending,
+            "fake_llm_calls": llm_calls,
+        },
+        # 처리량이 가장 낮은 단계
+        "bottleneck": min(active, key=lambda name: active[name]["throughput_per_sec"]) if active else None,
+        "stages": stages,
+    }
+
+
+def print_report(result: Dict) -> None:
+    print(f"\n{'stage':<12}{'ok':>6}{'fail':>6}{'rate/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'wait p50':>10}{'wait p99':>10}")
+    for name, s in result["stages"].items():
+        cells = [s["latency_p50_ms"], s["latency_p99_ms"], s["queue_wait_p50_ms"], s["queue_wait_p99_ms"]]
+        print(f"{name:<12}{s['processed']:>6}{s['failed']:>6}{s['throughput_per_sec']:>10.2f}" + "".join(f"{'-' if c is None else f'{c:.0f}':>10}" for c in cells))
+    e2e = result["end_to_end"]
+    print(f"\n전체 {e2e['articles']}개 기사, {e2e['total_seconds']:.1f}초 ({e2e['articles_per_minute']:.1f}개/분), 병목: {result['bottleneck']}")
+
+
+def compare(result: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준 결과 대비 처리량이 threshold 이상 떨어지거나 p99가 threshold 이상 늘어난 단계"""
+    regressions = []
+    print(f"\n기준 {baseline.get('revision')} 대비:")
+    for name, s in result["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            continue
+        notes = []
+        if base["throughput_per_sec"] and s["throughput_per_sec"]:
+            change = s["throughput_per_sec"] / base["throughput_per_sec"] - 1
+            notes.append(f"처리량 {change:+.1%}")
+            if change < -threshold:
+                regressions.append(f"{name} 처리량 {change:+.1%}")
+        if base["latency_p99_ms"] and s["latency_p99_ms"]:
+            change = s["latency_p99_ms"] / base["latency_p99_ms"] - 1
+            notes.append(f"p99 {change:+.1%}")
+            if change > threshold:
+                regressions.append(f"{name} p99 {change:+.1%}")
+        print(f"   {name:<12}" + ", ".join(notes))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="수집 파이프라인 end-to-end 처리량 벤치마크")
+    parser.add_argument("--presses", type=lambda v: v.split(","), default=None, help="쉼표로 구분한 언론사 (기본: 전체)")
+    parser.add_argument("--feeds-per-press", type=int, default=None, help="언론사당 피드 수 (기본: 전체)")
+    parser.add_argument("--items-per-feed", type=int, default=20)
+    parser.add_argument("--fetch-workers", type=int, default=10)
+    parser.add_argument("--celery-concurrency", type=int, default=16)
+    parser.add_argument("--fake-latency-ms", type=float, default=50)
+    parser.add_argument("--fake-jitter-ms", type=float, default=20)
+    parser.add_argument("--fake-failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--publisher-port", type=int, default=8765)
+    parser.add_argument("--index-batch-size", type=int, default=50)
+    parser.add_argument("--opensearch", action="store_true", help="임베딩 후 OpenSearch bulk 인덱싱까지 실행")
+    parser.add_argument("--drain-timeout", type=float, default=300, help="Celery 태스크 완료 대기 한도(초)")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로 (기본: results/<git revision>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--regression-threshold", type=float, default=0.1, help="회귀로 볼 변화율 (기본 10%%)")
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    print_report(result)
+    output = args.output or RESULTS_DIR / f"{result['revision'] or datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"💾 결과 저장: {output}")
+
+    if args.compare:
+        regressions = compare(result, json.loads(args.compare.read_text(encoding="utf-8")), args.regression_threshold)
+        if regressions:
+            print("❌ 회귀: " + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
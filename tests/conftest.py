@@ -0,0 +1,6 @@
+import os
+
+# DB가 필요한 테스트는 TEST_DB_URL(Postgres)이 있을 때만 실행 (app.core.database import 전에 DB_URL로 지정)
+TEST_DB_URL = os.getenv("TEST_DB_URL")
+if TEST_DB_URL:
+    os.environ["DB_URL"] = TEST_DB_URL
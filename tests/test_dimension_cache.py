@@ -0,0 +1,77 @@
+"""언론사/카테고리 차원 캐시 생성 테스트 (Postgres 필요: TEST_DB_URL)"""
+import os
+import uuid
+import pytest
+
+if not os.getenv("TEST_DB_URL"):
+    pytest.skip("TEST_DB_URL이 없어 DB 테스트 생략", allow_module_level=True)
+
+from app.core.database import Base, SessionLocal, engine
+from app.core.dimension_cache import category_cache, press_cache
+from app.core.schema_upgrades import apply_schema_upgrades
+from app.models.category import Category
+from app.models.press import Press
+
+
+@pytest.fixture(scope="module", autouse=True)
+def schema():
+    Base.metadata.create_all(bind=engine)
+    apply_schema_upgrades(engine)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    names = []
+    yield session, names
+    session.rollback()
+    session.query(Press).filter(Press.press_name.in_(names)).delete(synchronize_session=False)
+    session.query(Category).filter(Category.category_name.in_(names)).delete(synchronize_session=False)
+    session.commit()
+    session.close()
+    press_cache.invalidate()
+    category_cache.invalidate()
+
+
+def _name(names, prefix):
+    name = f"{prefix}-{uuid.uuid4().hex[:8]}"
+    names.append(name)
+    return name
+
+
+@pytest.mark.parametrize("cache, model, column", [
+    (press_cache, Press, "press_name"),
+    (category_cache, Category, "category_name"),
+])
+def test_soft_deleted_name_is_revived(db, cache, model, column):
+    session, names = db
+    name = _name(names, "deleted")
+    row = model(**{column: name}, is_deleted=True)
+    session.add(row)
+    session.commit()
+    cache.invalidate()
+
+    ids = cache.get_or_create_ids(session, [name])
+    session.commit()
+
+    assert ids == {name: row.id}
+    session.refresh(row)
+    assert row.is_deleted is False
+    assert cache.get_id(session, name) == row.id
+    assert session.query(model).filter(getattr(model, column) == name).count() == 1
+
+
+def test_new_and_existing_names(db):
+    session, names = db
+    existing = _name(names, "existing")
+    press = Press(press_name=existing)
+    session.add(press)
+    session.commit()
+    new = _name(names, "new")
+
+    ids = press_cache.get_or_create_ids(session, [existing, new])
+    session.commit()
+
+    assert ids[existing] == press.id
+    assert session.get(Press, ids[new]).press_name == new
+    assert press_cache.get_id(session, new) == ids[new]